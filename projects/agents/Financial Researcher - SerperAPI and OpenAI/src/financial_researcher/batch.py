@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# src/financial_researcher/batch.py
+import argparse
+import asyncio
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from financial_researcher.crew import ResearchCrew
+from financial_researcher.tools.cached_search import search_stats
+
+REPORTS_DIR = 'output/reports'
+DEFAULT_WORKERS = 8
+DEFAULT_MAX_AGE_HOURS = 24
+
+
+def report_path(company: str, reports_dir: str = REPORTS_DIR) -> str:
+    """
+    Path of the report for a company, e.g. 'output/reports/berkshire_hathaway.md'.
+    """
+    slug = re.sub(r'[^a-z0-9]+', '_', company.lower()).strip('_')
+    return os.path.join(reports_dir, f'{slug}.md')
+
+
+def is_fresh(path: str, max_age_hours: float) -> bool:
+    """
+    True if the report exists and is younger than max_age_hours.
+    """
+    return os.path.exists(path) and time.time() - os.path.getmtime(path) < max_age_hours * 3600
+
+
+def read_companies(path: str) -> list:
+    """
+    Read one company per line, ignoring blank lines and '#' comments.
+    """
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+async def run_batch(companies: list, workers: int = DEFAULT_WORKERS,
+                    max_age_hours: float = DEFAULT_MAX_AGE_HOURS, force: bool = False,
+                    reports_dir: str = REPORTS_DIR) -> list:
+    """
+    Research many companies concurrently, one crew run per company.
+
+    The crew (YAML config, agents and tools) is built once; each company runs
+    on a copy of it with its own report file. Companies whose report is younger
+    than max_age_hours are skipped unless force is set.
+
+    Returns:
+        One result dict per company with its status, report path and duration.
+    """
+    os.makedirs(reports_dir, exist_ok=True)
+    # kickoff_async runs each crew in a worker thread; size the pool to the worker limit
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=workers))
+    template = ResearchCrew().crew()
+    semaphore = asyncio.Semaphore(workers)
+
+    async def research(company: str) -> dict:
+        path = report_path(company, reports_dir)
+        if not force and is_fresh(path, max_age_hours):
+            return {'company': company, 'status': 'skipped', 'report': path, 'seconds': 0.0}
+
+        async with semaphore:
+            crew = template.copy()
+            crew.tasks[-1].output_file = path
+            start = time.perf_counter()
+            try:
+                await crew.kickoff_async(inputs={'company': company})
+                status = 'done'
+            except Exception as e:
+                print(f"Research failed for {company}: {e}")
+                status = 'failed'
+            return {'company': company, 'status': status, 'report': path,
+                    'seconds': round(time.perf_counter() - start, 1)}
+
+    return await asyncio.gather(*(research(company) for company in dict.fromkeys(companies)))
+
+
+def main():
+    """
+    Run the research crew for a list of companies.
+    """
+    parser = argparse.ArgumentParser(description='Research many companies concurrently.')
+    parser.add_argument('companies', nargs='*', help='Company names')
+    parser.add_argument('--file', help='File with one company per line')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Maximum concurrent crew runs')
+    parser.add_argument('--max-age-hours', type=float, default=DEFAULT_MAX_AGE_HOURS,
+                        help='Skip companies whose report is younger than this')
+    parser.add_argument('--force', action='store_true', help='Research every company, even with a fresh report')
+    parser.add_argument('--reports-dir', default=REPORTS_DIR)
+    args = parser.parse_args()
+
+    companies = args.companies + (read_companies(args.file) if args.file else [])
+    if not companies:
+        parser.error('no companies given')
+
+    start = time.perf_counter()
+    results = asyncio.run(run_batch(companies, args.workers, args.max_age_hours, args.force, args.reports_dir))
+    elapsed = time.perf_counter() - start
+
+    print("\n\n=== BATCH SUMMARY ===\n")
+    for result in results:
+        print(f"{result['status']:>8}  {result['seconds']:>7.1f}s  {result['company']}  ->  {result['report']}")
+    counts = {status: sum(r['status'] == status for r in results) for status in ('done', 'skipped', 'failed')}
+    print(f"\n{counts} in {elapsed:.1f}s")
+    print(f"Search cache: {search_stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 # src/financial_researcher/crew.py
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import SerperDevTool
+from financial_researcher.tools.cached_search import CachedSerperDevTool
 
 @CrewBase
 class ResearchCrew():
@@ -12,7 +12,7 @@ class ResearchCrew():
         return Agent(
             config=self.agents_config['researcher'],
             verbose=True,
-            tools=[SerperDevTool()]
+            tools=[CachedSerperDevTool()]
         )
 
     @agent
@@ -2,6 +2,7 @@
 # src/financial_researcher/main.py
 import os
 from financial_researcher.crew import ResearchCrew
+from financial_researcher.tools.cached_search import search_stats
 
 # Create output directory if it doesn't exist
 os.makedirs('output', exist_ok=True)
@@ -22,6 +23,7 @@ def run():
     print(result.raw)
 
     print("\n\nReport has been saved to output/report.md")
+    print(f"Search cache: {search_stats.summary()}")
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
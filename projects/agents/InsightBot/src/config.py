@@ -18,6 +18,10 @@ class Config:
     OUTPUT_DIR = "outputs"
     MODEL_TYPE = "cohere"  # or "flan-t5-base" for free model
     MAX_SEARCH_RESULTS = 3
+    LOCAL_MODEL_NAME = "google/flan-t5-base"
+    LOCAL_MODEL_INT8 = os.getenv("LOCAL_MODEL_INT8", "false").lower() == "true"
+    LOCAL_MODEL_MAX_BATCH = 8
+    LOCAL_MODEL_MAX_WAIT_MS = 20
 
     @staticmethod
     def validate():
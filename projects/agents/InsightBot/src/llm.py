@@ -2,9 +2,8 @@
 Language model initialization for the Analytical Chatbot.
 """
 from langchain_cohere import ChatCohere
-from langchain_community.llms import HuggingFacePipeline
-from transformers import pipeline
 from src.config import Config
+from src.model_server import LocalModelServer, LocalServerLLM
 from src.logger import setup_logger
 
 # Set logger
@@ -17,15 +16,18 @@ def initialize_llm():
             llm = ChatCohere()
             logger.info("Cohere LLM Initialized Successfully")
         elif Config.MODEL_TYPE == 'flan-t5-base':
-            pipe = pipeline(
-                task = "text2text-generation",
-                model = "google/flan-t5-base",
+            # Weights are loaded once per process and shared by every session
+            server = LocalModelServer.get_instance(
+                model_name = Config.LOCAL_MODEL_NAME,
+                quantize_int8 = Config.LOCAL_MODEL_INT8,
+                max_batch_size = Config.LOCAL_MODEL_MAX_BATCH,
+                max_wait_ms = Config.LOCAL_MODEL_MAX_WAIT_MS,
                 max_length = 512,
                 temperature = 0.7,
                 top_p = 0.9,
             )
-            llm = HuggingFacePipeline(pipeline=pipe)
-            logger.info("HuggingFace LLM Initialized Successfully")
+            llm = LocalServerLLM(server=server)
+            logger.info(f"HuggingFace LLM Initialized Successfully: {server.stats()}")
         else:
             raise ValueError(f"Unsupported model type: {Config.MODEL_TYPE}")
         return llm
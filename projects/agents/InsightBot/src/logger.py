@@ -14,4 +14,5 @@ def setup_logger():
             logging.StreamHandler()
         ]
     )
-    logger = logging.getLogger(__name__)
\ No newline at end of file
+    logger = logging.getLogger(__name__)
+    return logger
\ No newline at end of file
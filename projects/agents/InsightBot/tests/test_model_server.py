@@ -0,0 +1,56 @@
+"""
+Unit tests for the local model server.
+"""
+import threading
+import time
+from src.model_server import LocalModelServer, LocalServerLLM
+
+
+class FakePipeline:
+    """Echo pipeline that records the size of every batch it receives."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def __call__(self, prompts, batch_size=1, **kwargs):
+        self.batch_sizes.append(len(prompts))
+        time.sleep(0.01)
+        return [[{"generated_text": f"echo {prompt}"}] for prompt in prompts]
+
+
+def test_concurrent_requests_are_micro_batched():
+    """Test that concurrent prompts share batches and get their own answers."""
+    pipe = FakePipeline()
+    server = LocalModelServer(pipe=pipe, max_batch_size=8, max_wait_ms=50)
+    results = {}
+
+    def ask(i):
+        results[i] = server.generate(f"q{i}", timeout=5)
+
+    threads = [threading.Thread(target=ask, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {i: f"echo q{i}" for i in range(8)}
+    assert max(pipe.batch_sizes) > 1
+    stats = server.stats()
+    assert stats["requests"] == 8
+    assert stats["batches"] == len(pipe.batch_sizes)
+    assert stats["tokens_per_second"] > 0
+
+
+def test_get_instance_returns_singleton():
+    """Test that the server is created once per model configuration."""
+    LocalModelServer._instances.clear()
+    first = LocalModelServer.get_instance(model_name="fake", pipe=FakePipeline())
+    second = LocalModelServer.get_instance(model_name="fake")
+    assert first is second
+
+
+def test_llm_wrapper_applies_stop_tokens():
+    """Test the LangChain wrapper around the server."""
+    server = LocalModelServer(pipe=FakePipeline(), max_wait_ms=1)
+    llm = LocalServerLLM(server=server)
+    assert llm.invoke("hello STOP world", stop=["STOP"]) == "echo hello "
@@ -1,7 +1,6 @@
 # Import standard Python libraries
 import os
 import json
-import requests
 from dotenv import load_dotenv
 from datetime import datetime
 
@@ -12,6 +11,7 @@ from typing import List, Dict, Any
 
 # Import custom logger module
 from logger import setup_logger
+from notifier import get_dispatcher
 
 # ------------------------ #
 # Configure Logger        #
@@ -60,8 +60,6 @@ except Exception as e:
 # Load Pushover credentials for sending notifications
 PUSHOVER_USER = os.getenv("PUSHOVER_USER")
 PUSHOVER_TOKEN = os.getenv("PUSHOVER_TOKEN")
-# PUSHOVER_URL = "https://api.pushover.net/1/messages.json"
-PUSHOVER_URL = "https://api.pushover.net/1/messages.json"
 
 if not PUSHOVER_USER or not PUSHOVER_TOKEN:
     logger.warning("Pushover credentials not set. Notifications will be logged locally only.")
@@ -165,6 +163,9 @@ def log_customer_issue(customer_id: str, issue_description: str, urgency: str) -
 def send_notification(message: str) -> Dict[str, str]:
     """
     Send a notification to the support team via Pushover or log locally if credentials are missing.
+
+    The message is handed to the background dispatcher and this returns immediately;
+    delivery (with batching and retries) happens off the chat loop.
     
     Args:
         message (str): Notification message to send.
@@ -174,27 +175,12 @@ def send_notification(message: str) -> Dict[str, str]:
     """
     try:
         if PUSHOVER_USER and PUSHOVER_TOKEN:
-            payload = {
-                "user": PUSHOVER_USER,
-                "token": PUSHOVER_TOKEN,
-                "message": message
-            }
-            logger.debug(f"Sending Pushover notification with payload: {payload}")
-            response = requests.post(PUSHOVER_URL, data=payload, timeout=5)
-            response.raise_for_status()
-            logger.info(f"Notification sent: {message}")
-            return {"status": "success", "message": "Notification sent successfully"}
+            get_dispatcher().notify(message)
+            logger.info(f"Notification queued: {message}")
+            return {"status": "success", "message": "Notification queued for delivery"}
         else:
             logger.info(f"Local notification: {message}")
             return {"status": "success", "message": "Notification logged locally"}
-    except requests.exceptions.HTTPError as e:
-        error_detail = f"HTTP Error: {str(e)}"
-        try:
-            error_detail += f" - Response: {e.response.text}"
-        except:
-            pass
-        logger.error(f"Failed to send notification: {error_detail}")
-        return {"status": "error", "message": error_detail}
     except Exception as e:
         logger.error(f"Failed to send notification: {str(e)}")
         return {"status": "error", "message": str(e)}
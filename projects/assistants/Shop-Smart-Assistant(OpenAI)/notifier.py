@@ -0,0 +1,168 @@
+import atexit
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections import Counter
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Overridable with PUSHOVER_URL, read when the dispatcher is created (after .env is loaded)
+DEFAULT_PUSHOVER_URL = "https://api.pushover.net/1/messages.json"
+# Pushover rejects messages longer than this
+PUSHOVER_MAX_LENGTH = 1024
+
+
+class PushoverDispatcher:
+    """
+    Non-blocking Pushover sender.
+
+    `notify()` only queues the message and returns. A background thread sends
+    queued messages over one persistent HTTP session: messages arriving within
+    `coalesce_seconds` of each other are batched into a single notification
+    (identical ones are collapsed with a count), and failed requests are
+    retried with exponential backoff.
+    """
+
+    def __init__(self, user=None, token=None, url=None, coalesce_seconds=1.0,
+                 max_batch=20, max_retries=4, backoff_seconds=1.0, timeout=10):
+        self.user = user or os.getenv("PUSHOVER_USER")
+        self.token = token or os.getenv("PUSHOVER_TOKEN")
+        self.url = url or os.getenv("PUSHOVER_URL", DEFAULT_PUSHOVER_URL)
+        self.coalesce_seconds = coalesce_seconds
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.stats = {"queued": 0, "batches": 0, "requests_sent": 0, "requests_failed": 0, "retries": 0}
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="pushover-dispatcher", daemon=True)
+        self._thread.start()
+
+    @property
+    def enabled(self):
+        return bool(self.user and self.token)
+
+    def notify(self, message):
+        """
+        Queue a message for delivery and return immediately.
+
+        Returns:
+            bool: True if the message was queued, False if Pushover credentials are missing.
+        """
+        if not self.enabled:
+            logger.info(f"Local notification (Pushover not configured): {message}")
+            return False
+        self.stats["queued"] += 1
+        self._queue.put(message)
+        return True
+
+    def flush(self, timeout=None):
+        """
+        Block until every queued message has been sent or given up on.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def _collect_batch(self):
+        """Wait for one message, then gather whatever else arrives within the coalescing window."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.coalesce_seconds
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    @staticmethod
+    def _compose(batch):
+        """
+        Collapse duplicates and join the batch into notification texts within Pushover's length
+        limit. A message longer than the limit is split over several notifications.
+        """
+        counts = Counter(batch)
+        lines = [message if counts[message] == 1 else f"{message} (x{counts[message]})"
+                 for message in dict.fromkeys(batch)]
+        texts, current = [], ""
+        pieces = [line[start:start + PUSHOVER_MAX_LENGTH] for line in lines
+                  for start in range(0, max(len(line), 1), PUSHOVER_MAX_LENGTH)]
+        for piece in pieces:
+            candidate = f"{current}\n{piece}" if current else piece
+            if len(candidate) > PUSHOVER_MAX_LENGTH:
+                texts.append(current)
+                candidate = piece
+            current = candidate
+        texts.append(current)
+        return texts
+
+    def _send(self, text):
+        """POST one notification, retrying transient failures with backoff."""
+        payload = {"user": self.user, "token": self.token, "message": text}
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.post(self.url, data=payload, timeout=self.timeout)
+                # 4xx other than 429 means a bad request or credentials; retrying will not help
+                if response.status_code < 500 and response.status_code != 429:
+                    response.raise_for_status()
+                    return True
+                error = f"HTTP {response.status_code}"
+                retry_after = response.headers.get("Retry-After")
+            except requests.HTTPError as e:
+                logger.error(f"Pushover rejected notification: {e}")
+                return False
+            except requests.RequestException as e:
+                error, retry_after = str(e), None
+            if attempt == self.max_retries:
+                logger.error(f"Giving up on notification after {attempt + 1} attempts: {error}")
+                return False
+            self.stats["retries"] += 1
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else \
+                self.backoff_seconds * 2 ** attempt + random.uniform(0, 0.1)
+            logger.warning(f"Notification failed ({error}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            self.stats["batches"] += 1
+            try:
+                for text in self._compose(batch):
+                    if self._send(text):
+                        self.stats["requests_sent"] += 1
+                    else:
+                        self.stats["requests_failed"] += 1
+            except Exception as e:
+                logger.error(f"Notification dispatcher error: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher():
+    """
+    Return the process-wide dispatcher, starting it on first use.
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = PushoverDispatcher()
+            # Give queued notifications a chance to go out when the process exits
+            atexit.register(_dispatcher.flush, 15)
+        return _dispatcher
@@ -20,6 +20,7 @@ from langchain.chains.combine_documents import create_stuff_documents_chain
 from langchain.callbacks import StdOutCallbackHandler
 from langchain_cohere.embeddings import CohereEmbeddings
 from langchain.text_splitter import RecursiveCharacterTextSplitter
+from cache import build_caches, text_hash
 import os
 import logging
 from datetime import datetime
@@ -44,6 +45,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "embed-english-v3.0"
+ANSWER_CACHE_THRESHOLD = 0.95
+
+
+@st.cache_resource
+def get_caches():
+    """Create the embedding and answer caches once per server process."""
+    embeddings = CohereEmbeddings(model=EMBEDDING_MODEL)
+    logger.info("Embedding and answer caches initialized")
+    return build_caches(embeddings, namespace=EMBEDDING_MODEL, threshold=ANSWER_CACHE_THRESHOLD)
+
+
+@st.cache_resource
+def get_chain():
+    """Build the LLM and stuff-documents chain once per server process."""
+    llm = ChatCohere(model="command-r-plus")
+
+    # Define prompt template
+    prompt = ChatPromptTemplate.from_template(
+        """
+        You are a helpful assistant. Answer the question based on the following context from a PDF document.
+        If the answer is not in the context, say so clearly.
+        Context: {context}
+        Question: {question}
+        Answer:
+        """
+    )
+
+    # Create stuff documents chain
+    return create_stuff_documents_chain(llm, prompt)
+
 #------------------------------#
 # Implement App and Streamlit  #
 #------------------------------#
@@ -97,8 +129,9 @@ def main():
             st.write(store_name)
             store_path = f"vector_stores/{store_name}"
 
-            # Creating Embeddings
-            embeddings = CohereEmbeddings(model="embed-english-v3.0")
+            # Creating Embeddings (chunk vectors are cached by text hash across uploads)
+            embeddings, answer_cache = get_caches()
+            document_id = text_hash(text)
             if os.path.exists(store_path):
                 try:
                     VectorStore = FAISS.load_local(store_path, embeddings, allow_dangerous_deserialization=True)
@@ -122,30 +155,20 @@ def main():
             if query:
                 logger.info(f"User query: {query}")
                 try:
-                    docs = VectorStore.similarity_search(query=query, k=3)
-                    logger.info(f"Retrieved {len(docs)} documents for query")
-
-                    llm = ChatCohere(model="command-r-plus")
-
-                    # Define prompt template
-                    prompt = ChatPromptTemplate.from_template(
-                        """
-                        You are a helpful assistant. Answer the question based on the following context from a PDF document.
-                        If the answer is not in the context, say so clearly.
-                        Context: {context}
-                        Question: {question}
-                        Answer:
-                        """
-                    )
-
-                    # Create stuff documents chain
-                    chain = create_stuff_documents_chain(llm, prompt)
-
-                    # Run chain with callbacks
-                    response = chain.invoke(
-                        {"context": docs, "question": query},
-                        config={"callbacks": [StdOutCallbackHandler()]}
-                    )
+                    # Semantic answer cache: reuse answers to near-identical questions on this document
+                    response, score = answer_cache.lookup(document_id, query)
+                    if response is not None:
+                        logger.info(f"Answer cache hit (similarity={score:.3f})")
+                    else:
+                        docs = VectorStore.similarity_search(query=query, k=3)
+                        logger.info(f"Retrieved {len(docs)} documents for query")
+
+                        # Run chain with callbacks
+                        response = get_chain().invoke(
+                            {"context": docs, "question": query},
+                            config={"callbacks": [StdOutCallbackHandler()]}
+                        )
+                        answer_cache.store_answer(document_id, query, response)
                     st.write(response)
                     logger.info(f"Response generated: {response}")
 
@@ -157,6 +180,11 @@ def main():
             logger.error(f"Error processing PDF: {str(e)}")
             st.error(f"An error occurred while processing the PDF: {str(e)}")
 
+        # Cache statistics
+        embeddings, answer_cache = get_caches()
+        st.sidebar.subheader("Cache Hit Rates")
+        st.sidebar.write({"embeddings": embeddings.stats.as_dict(), "answers": answer_cache.stats.as_dict()})
+
 # Run main.py
 if __name__ == '__main__':
     main()
\ No newline at end of file
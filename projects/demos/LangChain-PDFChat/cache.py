@@ -0,0 +1,225 @@
+"""
+Two-tier cache for the Chat With PDF app.
+
+Tier 1 - ChunkEmbeddingCache: wraps any LangChain embedding model and stores
+chunk vectors on disk keyed by the SHA-256 of the chunk text, so re-uploaded or
+overlapping PDFs reuse vectors instead of calling the embedding API again.
+
+Tier 2 - SemanticAnswerCache: stores answers per document and returns a stored
+answer when a new query embeds within a cosine-similarity threshold of a
+previous query against the same document.
+
+Both tiers share one SQLite file and track hit/miss counts. They work with any
+object implementing `embed_documents` / `embed_query`, e.g.
+`langchain_core.embeddings.DeterministicFakeEmbedding` for local testing.
+
+Author: Mohammadreza Mohammadi
+Github: mohamamdreza-mohammadi94
+"""
+
+# Libs
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+CACHE_DB = "cache/pdfchat_cache.db"
+
+
+def text_hash(text):
+    """Return a stable SHA-256 hex digest for a piece of text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _to_blob(vector):
+    return array("f", vector).tobytes()
+
+
+def _from_blob(blob):
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+class CacheStats:
+    """Hit/miss counters for one cache tier."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self):
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hit_rate, 3)}
+
+
+class _SQLiteStore:
+    """Thread-safe SQLite connection shared by both cache tiers."""
+
+    def __init__(self, path=CACHE_DB):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Streamlit serves sessions from several threads, so guard the connection with a lock.
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "namespace TEXT, text_hash TEXT, vector BLOB, "
+                "PRIMARY KEY (namespace, text_hash))"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                "namespace TEXT, document_id TEXT, query TEXT, vector BLOB, answer TEXT)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_answers_doc ON answers (namespace, document_id)"
+            )
+
+
+class ChunkEmbeddingCache(Embeddings):
+    """Embedding model wrapper that persists vectors keyed by text hash."""
+
+    def __init__(self, embeddings, namespace, store=None, path=CACHE_DB):
+        self.embeddings = embeddings
+        self.namespace = namespace
+        self.store = store or _SQLiteStore(path)
+        self.stats = CacheStats()
+
+    def _lookup(self, hashes):
+        found = {}
+        with self.store.lock:
+            for start in range(0, len(hashes), 500):
+                batch = hashes[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self.store.conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings "
+                    f"WHERE namespace = ? AND text_hash IN ({placeholders})",
+                    [self.namespace, *batch],
+                ).fetchall()
+                found.update((h, _from_blob(blob)) for h, blob in rows)
+        return found
+
+    def _save(self, items):
+        with self.store.lock, self.store.conn:
+            self.store.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (namespace, text_hash, vector) VALUES (?, ?, ?)",
+                [(self.namespace, h, _to_blob(v)) for h, v in items],
+            )
+
+    def embed_documents(self, texts):
+        hashes = [text_hash(t) for t in texts]
+        cached = self._lookup(list(set(hashes)))
+
+        # Embed each unseen text once, even if it appears several times in this batch
+        missing = {}
+        for h, t in zip(hashes, texts):
+            if h in cached:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+                missing.setdefault(h, t)
+
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            new_items = list(zip(missing.keys(), vectors))
+            self._save(new_items)
+            cached.update(new_items)
+        return [list(cached[h]) for h in hashes]
+
+    def embed_query(self, text):
+        # Queries go through the underlying model's query mode, so keep them in their own namespace
+        h = text_hash(text)
+        key = f"query:{h}"
+        cached = self._lookup([key])
+        if key in cached:
+            self.stats.hits += 1
+            return cached[key]
+        self.stats.misses += 1
+        vector = self.embeddings.embed_query(text)
+        self._save([(key, vector)])
+        return list(vector)
+
+
+class SemanticAnswerCache:
+    """Answer cache matching queries by embedding similarity per document."""
+
+    def __init__(self, embeddings, namespace, threshold=0.95, store=None, path=CACHE_DB):
+        self.embeddings = embeddings
+        self.namespace = namespace
+        self.threshold = threshold
+        self.store = store or _SQLiteStore(path)
+        self.stats = CacheStats()
+        # document_id -> (matrix of normalized query vectors, answers)
+        self._index = {}
+        # Sessions run on several threads; taken before store.lock, never inside it
+        self._index_lock = threading.Lock()
+
+    def _load(self, document_id):
+        # Callers hold _index_lock
+        if document_id not in self._index:
+            with self.store.lock:
+                rows = self.store.conn.execute(
+                    "SELECT vector, answer FROM answers WHERE namespace = ? AND document_id = ?",
+                    (self.namespace, document_id),
+                ).fetchall()
+            vectors = [_from_blob(blob) for blob, _ in rows]
+            matrix = np.array(vectors, dtype=np.float32) if vectors else None
+            self._index[document_id] = (matrix, [answer for _, answer in rows])
+        return self._index[document_id]
+
+    @staticmethod
+    def _normalize(vector):
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, document_id, query):
+        """Return (answer, similarity) for the closest cached query, or (None, score)."""
+        query_vector = self._normalize(self.embeddings.embed_query(query))
+        with self._index_lock:
+            matrix, answers = self._load(document_id)
+        if matrix is None:
+            self.stats.misses += 1
+            return None, 0.0
+        scores = matrix @ query_vector
+        best = int(np.argmax(scores))
+        score = float(scores[best])
+        if score >= self.threshold:
+            self.stats.hits += 1
+            return answers[best], score
+        self.stats.misses += 1
+        return None, score
+
+    def store_answer(self, document_id, query, answer):
+        """Persist an answer for a query against a document."""
+        vector = self._normalize(self.embeddings.embed_query(query))
+        # Insert and index update under one lock, so concurrent stores keep each other's answers
+        with self._index_lock:
+            # Load before inserting, or a first load would read the new row and it would be appended twice
+            matrix, answers = self._load(document_id)
+            with self.store.lock, self.store.conn:
+                self.store.conn.execute(
+                    "INSERT INTO answers (namespace, document_id, query, vector, answer) VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, document_id, query, _to_blob(vector.tolist()), answer),
+                )
+            row = vector.reshape(1, -1)
+            matrix = row if matrix is None else np.vstack([matrix, row])
+            self._index[document_id] = (matrix, answers + [answer])
+
+
+def build_caches(embeddings, namespace, threshold=0.95, path=CACHE_DB):
+    """Create both cache tiers over a single SQLite store."""
+    store = _SQLiteStore(path)
+    chunk_cache = ChunkEmbeddingCache(embeddings, namespace, store=store)
+    # Answer lookups embed queries through the chunk cache so repeated questions cost no API call
+    answer_cache = SemanticAnswerCache(chunk_cache, namespace, threshold=threshold, store=store)
+    return chunk_cache, answer_cache
@@ -0,0 +1,97 @@
+"""
+Unit tests for the embedding and answer caches, using a local fake embedding model.
+"""
+import hashlib
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from cache import SemanticAnswerCache, build_caches
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic embeddings that count the texts they are asked to embed."""
+
+    def __init__(self, vectors=None):
+        self.vectors = vectors or {}
+        self.document_calls = 0
+        self.query_calls = 0
+
+    def _vector(self, text):
+        if text in self.vectors:
+            return self.vectors[text]
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [byte / 255 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        self.document_calls += len(texts)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text):
+        self.query_calls += 1
+        return self._vector(text)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+def test_chunk_cache_hits_and_misses(db_path):
+    """Test that each distinct chunk is embedded once and reused across uploads."""
+    fake = FakeEmbeddings()
+    chunks, _ = build_caches(fake, "test", path=db_path)
+
+    first = chunks.embed_documents(["a", "b", "a"])
+    assert fake.document_calls == 2
+    assert chunks.stats.as_dict() == {"hits": 0, "misses": 3, "hit_rate": 0.0}
+
+    second = chunks.embed_documents(["b", "c"])
+    assert fake.document_calls == 3
+    assert (chunks.stats.hits, chunks.stats.misses) == (1, 4)
+    assert second[0] == pytest.approx(first[1])
+
+
+def test_chunk_cache_persists_across_processes(db_path):
+    """Test that a new cache over the same file reuses stored vectors."""
+    build_caches(FakeEmbeddings(), "test", path=db_path)[0].embed_documents(["a"])
+    fake = FakeEmbeddings()
+    chunks, _ = build_caches(fake, "test", path=db_path)
+    chunks.embed_documents(["a"])
+    assert fake.document_calls == 0
+    assert chunks.stats.hits == 1
+
+
+def test_answer_threshold(db_path):
+    """Test that only queries within the similarity threshold reuse an answer."""
+    fake = FakeEmbeddings({
+        "what is attention?": [1.0, 0.0],
+        "what's attention?": [0.99, 0.05],
+        "who wrote it?": [0.0, 1.0],
+    })
+    _, answers = build_caches(fake, "test", threshold=0.95, path=db_path)
+    assert answers.lookup("doc", "what is attention?") == (None, 0.0)
+
+    answers.store_answer("doc", "what is attention?", "A mechanism.")
+    answer, score = answers.lookup("doc", "what's attention?")
+    assert answer == "A mechanism."
+    assert score >= 0.95
+    assert answers.lookup("doc", "who wrote it?")[0] is None
+    assert answers.lookup("other-doc", "what is attention?")[0] is None
+    assert (answers.stats.hits, answers.stats.misses) == (1, 3)
+
+
+def test_store_without_prior_lookup_indexes_answer_once(db_path):
+    """Test that storing into a document not yet loaded does not index the new row twice."""
+    fake = FakeEmbeddings({"q1": [1.0, 0.0], "q2": [0.0, 1.0]})
+    _, answers = build_caches(fake, "test", path=db_path)
+    answers.store_answer("doc", "q1", "first")
+    answers.store_answer("doc", "q2", "second")
+    matrix, stored = answers._index["doc"]
+    assert stored == ["first", "second"]
+    assert matrix.shape == (2, 2)
+
+    # A fresh cache over the same file loads each row exactly once
+    fresh = SemanticAnswerCache(fake, "test", path=db_path)
+    fresh.store_answer("doc", "q1", "third")
+    assert fresh._index["doc"][1] == ["first", "second", "third"]
@@ -13,8 +13,7 @@ import streamlit as st
 from langchain_core.prompts import ChatPromptTemplate
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain_community.tools.tavily_search import TavilySearchResults
-from langchain_community.llms import HuggingFacePipeline
-from transformers import pipeline
+from model_server import LocalModelServer, LocalServerLLM
 import os
 import logging
 from datetime import datetime
@@ -39,6 +38,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Set LOCAL_MODEL_INT8=true to serve an int8 dynamically quantized model on CPU
+LOCAL_MODEL_INT8 = os.getenv("LOCAL_MODEL_INT8", "false").lower() == "true"
+
+
+@st.cache_resource
+def get_model_server():
+    """Load flan-t5-base once per server process and share it across sessions."""
+    return LocalModelServer.get_instance(
+        model_name="google/flan-t5-base",
+        quantize_int8=LOCAL_MODEL_INT8,
+        max_length=512,
+        temperature=0.7,
+        top_p=0.9
+    )
+
 #------------------------------#
 # Implement App and Streamlit  #
 #------------------------------#
@@ -58,20 +72,16 @@ def main():
 
     # Initialize LLM
     try:
-        # Use free Hugging Face model (flan-t5-base)
-        pipe = pipeline(
-            "text2text-generation",
-            model="google/flan-t5-base",
-            max_length=512,
-            temperature=0.7,
-            top_p=0.9
-        )
-        llm = HuggingFacePipeline(pipeline=pipe)
+        # Use free Hugging Face model (flan-t5-base), served by a shared micro-batching worker
+        server = get_model_server()
+        llm = LocalServerLLM(server=server)
         logger.info("flan-t5-base LLM initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing LLM: {str(e)}")
         st.error(f"Error initializing LLM: {str(e)}")
         return
+    st.sidebar.subheader("Model Server")
+    st.sidebar.write(server.stats())
 
     # Initialize Tools
     tools = [
@@ -115,6 +125,7 @@ def main():
             st.write("**Answer:**")
             st.write(answer)
             logger.info(f"Response generated: {answer}")
+            logger.info(f"Model server stats: {server.stats()}")
         except Exception as e:
             logger.error(f"Error processing query: {str(e)}")
             st.error(f"An Error Occurred: {str(e)}")
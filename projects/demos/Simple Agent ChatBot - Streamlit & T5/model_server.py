@@ -0,0 +1,151 @@
+"""
+Shared local model server for the flan-t5-base agent chat.
+
+The transformers pipeline is loaded once per process and served from a
+background worker thread. Requests from concurrent Streamlit sessions are put on
+a queue and grouped into micro-batches, so weights are never reloaded on a rerun
+and the model runs one batched forward pass for several users at once.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, List, Optional
+
+from langchain_core.language_models.llms import LLM
+
+logger = logging.getLogger(__name__)
+
+
+class LocalModelServer:
+    """Singleton text2text-generation server with dynamic micro-batching."""
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, model_name="google/flan-t5-base", quantize_int8=False,
+                 max_batch_size=8, max_wait_ms=20, pipe=None, **generate_kwargs):
+        self.model_name = model_name
+        self.quantize_int8 = quantize_int8
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.generate_kwargs = generate_kwargs
+
+        start = time.perf_counter()
+        self.pipe = pipe if pipe is not None else self._load_pipeline()
+        self.cold_start_seconds = time.perf_counter() - start
+        logger.info(f"Model server for {model_name} ready in {self.cold_start_seconds:.2f}s "
+                    f"(int8={quantize_int8})")
+
+        self._queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._batches = 0
+        self._generated_tokens = 0
+        self._generation_seconds = 0.0
+        self._worker = threading.Thread(target=self._serve, name="local-model-server", daemon=True)
+        self._worker.start()
+
+    @classmethod
+    def get_instance(cls, model_name="google/flan-t5-base", quantize_int8=False, **kwargs):
+        """Return the process-wide server for a model, loading it on first use."""
+        key = (model_name, quantize_int8)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(model_name=model_name, quantize_int8=quantize_int8, **kwargs)
+            return cls._instances[key]
+
+    def _load_pipeline(self):
+        """Load the pipeline, optionally with int8 dynamic quantization for CPU."""
+        from transformers import pipeline
+
+        pipe = pipeline(task="text2text-generation", model=self.model_name, device=-1)
+        if self.quantize_int8:
+            import torch
+
+            pipe.model = torch.quantization.quantize_dynamic(
+                pipe.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        return pipe
+
+    def generate(self, prompt, timeout=None):
+        """Queue a prompt and block until its micro-batch has been generated."""
+        future = Future()
+        self._queue.put((prompt, future))
+        return future.result(timeout=timeout)
+
+    def _collect_batch(self):
+        """Wait for one request, then gather more until the batch is full or the window closes."""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _count_tokens(self, texts):
+        tokenizer = getattr(self.pipe, "tokenizer", None)
+        if tokenizer is None:
+            return sum(len(text.split()) for text in texts)
+        return sum(len(ids) for ids in tokenizer(texts)["input_ids"])
+
+    def _serve(self):
+        while True:
+            batch = self._collect_batch()
+            prompts = [prompt for prompt, _ in batch]
+            try:
+                start = time.perf_counter()
+                outputs = self.pipe(prompts, batch_size=len(prompts), **self.generate_kwargs)
+                elapsed = time.perf_counter() - start
+                texts = [output[0]["generated_text"] if isinstance(output, list) else output["generated_text"]
+                         for output in outputs]
+                tokens = self._count_tokens(texts)
+                with self._stats_lock:
+                    self._requests += len(batch)
+                    self._batches += 1
+                    self._generated_tokens += tokens
+                    self._generation_seconds += elapsed
+                for (_, future), text in zip(batch, texts):
+                    future.set_result(text)
+            except Exception as e:
+                logger.error(f"Model server batch failed: {str(e)}")
+                for _, future in batch:
+                    future.set_exception(e)
+
+    def stats(self):
+        """Return cold-start time, batching and throughput metrics."""
+        with self._stats_lock:
+            return {
+                "model": self.model_name,
+                "quantize_int8": self.quantize_int8,
+                "cold_start_seconds": round(self.cold_start_seconds, 3),
+                "requests": self._requests,
+                "batches": self._batches,
+                "avg_batch_size": round(self._requests / self._batches, 2) if self._batches else 0.0,
+                "tokens_per_second": round(self._generated_tokens / self._generation_seconds, 2)
+                if self._generation_seconds else 0.0,
+            }
+
+
+class LocalServerLLM(LLM):
+    """LangChain LLM that forwards prompts to a shared LocalModelServer."""
+
+    server: Any
+    timeout: Optional[float] = 120
+
+    @property
+    def _llm_type(self) -> str:
+        return "local_model_server"
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, run_manager=None, **kwargs) -> str:
+        text = self.server.generate(prompt, timeout=self.timeout)
+        if stop:
+            for token in stop:
+                text = text.split(token)[0]
+        return text
@@ -1,12 +1,17 @@
 """Main script demonstrating the RAG system."""
 
+import argparse
 import logging
 from pathlib import Path
 from dotenv import load_dotenv
 
 from config.settings import load_config
-from core.document_loader import load_documents, chunk_documents
-from core.vectorstore import create_embeddings, build_vectorstore
+from core.vectorstore import (
+    create_embeddings,
+    load_or_build_vectorstore,
+    benchmark_startup,
+)
+from core.evaluation import load_questions, create_eval_chain, evaluate, sweep
 from core.llm import get_chat_model, create_rag_chain
 
 # Configure logging
@@ -16,8 +21,62 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Alice RAG demo")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Ignore the persisted FAISS index and rebuild it",
+    )
+    parser.add_argument(
+        "--benchmark-startup",
+        action="store_true",
+        help="Compare rebuild and warm-load startup times, then exit",
+    )
+    parser.add_argument(
+        "--evaluate",
+        type=Path,
+        metavar="QUESTIONS_JSON",
+        help="Run a labeled question file through the chain and report metrics",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of questions evaluated concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Evaluate with abatch on an event loop instead of threads",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="With --evaluate, sweep chunking and embedding settings (retrieval only)",
+    )
+    parser.add_argument(
+        "--k",
+        type=int,
+        default=None,
+        help="Number of chunks retrieved per question (default: retrieval_k in the config)",
+    )
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[500, 1000])
+    parser.add_argument("--chunk-overlaps", type=int, nargs="+", default=[100, 250])
+    parser.add_argument("--embedding-models", nargs="+", default=None)
+    args = parser.parse_args()
+    if args.sweep and not args.evaluate:
+        parser.error("--sweep requires --evaluate QUESTIONS_JSON")
+    if args.k is not None and args.k < 1:
+        parser.error("--k must be at least 1")
+    return args
+
+
 def main():
     """Run the RAG pipeline with example questions."""
+    args = parse_args()
     logger.info("=" * 50)
     logger.info("Simple RAG System Based on LangChain and FAISS")
     logger.info("Alice's Adventures in Wonderland by Lewis Carroll")
@@ -27,20 +86,32 @@ def main():
         # Load environment variables and configuration
         load_dotenv()
         config = load_config()
+        k = args.k or config.retrieval_k
 
-        # Load and process documents
-        docs = load_documents(config.data_dir)
-        chunks = chunk_documents(
-            docs, chunk_size=config.chunk_size, chunk_overlap=config.chunk_overlap
-        )
-
-        # Create embeddings and vectorstore
+        # Create embeddings and vectorstore (documents are only re-read
+        # and re-chunked when the persisted index is stale)
         embedding_model = create_embeddings(config.embedding_model)
-        vectorstore = build_vectorstore(chunks, embedding_model, config.vectorstore_dir)
+        if args.benchmark_startup:
+            benchmark_startup(config, embedding_model)
+            return
+        if args.sweep:
+            sweep(
+                config,
+                load_questions(args.evaluate),
+                chunk_sizes=args.chunk_sizes,
+                chunk_overlaps=args.chunk_overlaps,
+                embedding_models=args.embedding_models or [config.embedding_model],
+                k=k,
+                max_concurrency=args.concurrency,
+            )
+            return
+        vectorstore = load_or_build_vectorstore(
+            config, embedding_model, force_rebuild=args.rebuild
+        )
 
         # Set up retriever
         retriever = vectorstore.as_retriever(
-            search_type="similarity", search_kwargs={"k": 4}
+            search_type="similarity", search_kwargs={"k": k}
         )
 
         # Initialize LLM and create chain
@@ -51,6 +122,16 @@ def main():
         )
         rag_chain = create_rag_chain(retriever, llm)
 
+        if args.evaluate:
+            evaluate(
+                create_eval_chain(retriever, llm),
+                load_questions(args.evaluate),
+                k=k,
+                max_concurrency=args.concurrency,
+                use_async=args.use_async,
+            )
+            return
+
         # Test the system
         logger.info("\nQuerying the RAG system...")
 
@@ -61,10 +142,12 @@ def main():
             "What is the capital of France?",  # Answer is NOT in the text
         ]
 
-        for i, question in enumerate(test_questions, 1):
+        answers = rag_chain.batch(
+            test_questions, config={"max_concurrency": args.concurrency}
+        )
+        for i, (question, answer) in enumerate(zip(test_questions, answers), 1):
             logger.info(f"\n--- Test Question {i} ---")
             logger.info(f"Question: {question}")
-            answer = rag_chain.invoke(question)
             logger.info(f"Answer: {answer}")
 
     except Exception as e:
@@ -15,6 +15,8 @@ class RAGConfig:
         Directory containing the source documents
     vectorstore_dir: Path
         Directory to save the FAISS index
+    embedding_cache_dir: Path
+        Directory holding cached chunk embeddings, keyed by model and chunk text
     embedding_model: str
         Name of the HuggingFace model to use for embeddings
     llm_model: str
@@ -23,6 +25,8 @@ class RAGConfig:
         Size of document chunks
     chunk_overlap: int
         Overlap between chunks
+    retrieval_k: int
+        Number of chunks retrieved per question
     temperature: float
         LLM temperature setting
     max_tokens: int
@@ -31,16 +35,20 @@ class RAGConfig:
 
     data_dir: Path
     vectorstore_dir: Path
+    embedding_cache_dir: Path
     embedding_model: str = "sentence-transformers/all-distilroberta-v1"
     llm_model: str = "gpt-4.1-mini"
     chunk_size: int = 1000
     chunk_overlap: int = 250
+    retrieval_k: int = 4
     temperature: float = 0
     max_tokens: int = 500
 
 
 def load_config(
-    data_dir: Optional[Path] = None, vectorstore_dir: Optional[Path] = None
+    data_dir: Optional[Path] = None,
+    vectorstore_dir: Optional[Path] = None,
+    embedding_cache_dir: Optional[Path] = None,
 ) -> RAGConfig:
     """Create a configuration with optional custom paths.
 
@@ -50,6 +58,8 @@ def load_config(
         Override the default data directory
     vectorstore_dir: Optional[Path]
         Override the default vectorstore directory
+    embedding_cache_dir: Optional[Path]
+        Override the default embedding cache directory
 
     Returns
     -------
@@ -61,4 +71,6 @@ def load_config(
     return RAGConfig(
         data_dir=data_dir or base_dir / "data",
         vectorstore_dir=vectorstore_dir or base_dir.parent / "faiss_alice_rag",
+        embedding_cache_dir=embedding_cache_dir
+        or base_dir.parent / "embedding_cache_alice_rag",
     )
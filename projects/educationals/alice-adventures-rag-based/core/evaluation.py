@@ -0,0 +1,275 @@
+"""Batch evaluation and configuration sweeps for the RAG system."""
+
+import asyncio
+import json
+import logging
+import re
+import statistics
+import time
+from dataclasses import replace
+from itertools import product
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from config.settings import RAGConfig
+from core.llm import RAG_PROMPT, format_docs
+from core.vectorstore import create_embeddings, load_or_build_vectorstore
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("retrieval", "prompt", "llm")
+
+
+def load_questions(path: Path) -> List[Dict]:
+    """Load labeled evaluation questions from a JSON file.
+
+    Parameters
+    ----------
+    path: Path
+        JSON file holding a list of objects with a `question` and a list of
+        `relevant_passages` quoted from the source text
+
+    Returns
+    -------
+    List[Dict]
+        The labeled questions
+    """
+    with open(path, encoding="utf-8") as f:
+        questions = json.load(f)
+    for item in questions:
+        item.setdefault("relevant_passages", [])
+    logger.info(f"Loaded {len(questions)} evaluation questions from {path}")
+    return questions
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def create_eval_chain(retriever, llm=None) -> Runnable:
+    """Create a RAG chain that records per-stage latency.
+
+    The chain takes `{"question": ...}` and returns a dict with the retrieved
+    documents, the answer (when an LLM is given) and a `timings` mapping of
+    stage name to seconds.
+
+    Parameters
+    ----------
+    retriever
+        Document retriever instance
+    llm
+        Language model instance; when None only retrieval is evaluated
+
+    Returns
+    -------
+    Runnable
+        Instrumented chain suitable for `batch` / `abatch`
+    """
+    parser = StrOutputParser()
+
+    def retrieve(state: Dict) -> Dict:
+        start = time.perf_counter()
+        docs = retriever.invoke(state["question"])
+        timings = {"retrieval": time.perf_counter() - start}
+        return {**state, "docs": docs, "timings": timings}
+
+    def build_prompt(state: Dict) -> Dict:
+        start = time.perf_counter()
+        messages = RAG_PROMPT.invoke(
+            {"context": format_docs(state["docs"]), "question": state["question"]}
+        )
+        timings = {**state["timings"], "prompt": time.perf_counter() - start}
+        return {**state, "messages": messages, "timings": timings}
+
+    def generate(state: Dict) -> Dict:
+        start = time.perf_counter()
+        answer = parser.invoke(llm.invoke(state["messages"]))
+        timings = {**state["timings"], "llm": time.perf_counter() - start}
+        return {**state, "answer": answer, "timings": timings}
+
+    chain = RunnableLambda(retrieve) | RunnableLambda(build_prompt)
+    if llm is not None:
+        chain = chain | RunnableLambda(generate)
+    return chain
+
+
+def hit_at_k(docs, relevant_passages: Sequence[str]) -> Optional[bool]:
+    """Check whether any retrieved chunk contains a labeled passage.
+
+    Returns None for questions without labels (e.g. out-of-scope questions).
+    """
+    if not relevant_passages:
+        return None
+    contents = [_normalize(doc.page_content) for doc in docs]
+    return any(
+        _normalize(passage) in content
+        for passage in relevant_passages
+        for content in contents
+    )
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def summarize(results: List[Dict], wall_seconds: float, k: int) -> Dict:
+    """Aggregate per-question results into latency and quality metrics."""
+    summary = {
+        "questions": len(results),
+        "wall_seconds": round(wall_seconds, 3),
+        "questions_per_second": round(len(results) / wall_seconds, 2)
+        if wall_seconds
+        else 0.0,
+    }
+    for stage in STAGES:
+        values = [r["timings"][stage] for r in results if stage in r["timings"]]
+        if values:
+            summary[f"{stage}_mean_ms"] = round(statistics.mean(values) * 1000, 1)
+            summary[f"{stage}_p95_ms"] = round(_percentile(values, 95) * 1000, 1)
+
+    hits = [r["hit"] for r in results if r["hit"] is not None]
+    summary[f"hit@{k}"] = round(sum(hits) / len(hits), 3) if hits else None
+    return summary
+
+
+def evaluate(
+    chain: Runnable,
+    questions: List[Dict],
+    k: int,
+    max_concurrency: int = 4,
+    use_async: bool = False,
+) -> Dict:
+    """Run labeled questions through an evaluation chain concurrently.
+
+    Parameters
+    ----------
+    chain: Runnable
+        Chain built by `create_eval_chain`
+    questions: List[Dict]
+        Labeled questions from `load_questions`
+    k: int
+        Number of retrieved documents, used to label the hit metric
+    max_concurrency: int, optional
+        Maximum number of questions in flight (default: 4)
+    use_async: bool, optional
+        Use `abatch` on an event loop instead of thread-based `batch`
+
+    Returns
+    -------
+    Dict
+        `summary` metrics and per-question `results`
+    """
+    inputs = [{"question": item["question"]} for item in questions]
+    config = {"max_concurrency": max_concurrency}
+
+    start = time.perf_counter()
+    if use_async:
+        outputs = asyncio.run(chain.abatch(inputs, config=config))
+    else:
+        outputs = chain.batch(inputs, config=config)
+    wall_seconds = time.perf_counter() - start
+
+    results = []
+    for item, output in zip(questions, outputs):
+        results.append(
+            {
+                "question": item["question"],
+                "answer": output.get("answer"),
+                "hit": hit_at_k(output["docs"], item["relevant_passages"]),
+                "timings": output["timings"],
+            }
+        )
+    summary = summarize(results, wall_seconds, k)
+    logger.info(f"Evaluation summary: {summary}")
+    return {"summary": summary, "results": results}
+
+
+def sweep(
+    base_config: RAGConfig,
+    questions: List[Dict],
+    chunk_sizes: Sequence[int],
+    chunk_overlaps: Sequence[int],
+    embedding_models: Sequence[str],
+    k: int = 4,
+    llm=None,
+    max_concurrency: int = 4,
+) -> List[Dict]:
+    """Evaluate every chunking / embedding combination and rank them.
+
+    Each combination gets its own persisted index, so repeated sweeps load
+    instead of rebuilding, and all combinations share the embedding cache, so
+    chunks with identical text are embedded only once per model.
+
+    Parameters
+    ----------
+    base_config: RAGConfig
+        Configuration the combinations are derived from
+    questions: List[Dict]
+        Labeled questions from `load_questions`
+    chunk_sizes, chunk_overlaps, embedding_models: Sequence
+        Values to combine
+    k: int, optional
+        Number of documents to retrieve (default: 4)
+    llm
+        Optional language model; retrieval-only when None
+    max_concurrency: int, optional
+        Maximum number of questions in flight (default: 4)
+
+    Returns
+    -------
+    List[Dict]
+        One summary per combination, best first (highest hit@k, then lowest
+        mean latency)
+    """
+    embeddings = {}
+    rows = []
+    for chunk_size, chunk_overlap, model_name in product(
+        chunk_sizes, chunk_overlaps, embedding_models
+    ):
+        if chunk_overlap >= chunk_size:
+            continue
+        config = replace(
+            base_config,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            embedding_model=model_name,
+            vectorstore_dir=Path(base_config.vectorstore_dir).with_name(
+                f"{Path(base_config.vectorstore_dir).name}_sweep_"
+                f"{model_name.replace('/', '__')}_{chunk_size}_{chunk_overlap}"
+            ),
+        )
+        if model_name not in embeddings:
+            embeddings[model_name] = create_embeddings(model_name)
+
+        start = time.perf_counter()
+        vectorstore = load_or_build_vectorstore(config, embeddings[model_name])
+        startup_seconds = time.perf_counter() - start
+
+        retriever = vectorstore.as_retriever(
+            search_type="similarity", search_kwargs={"k": k}
+        )
+        report = evaluate(
+            create_eval_chain(retriever, llm), questions, k, max_concurrency
+        )
+        rows.append(
+            {
+                "chunk_size": chunk_size,
+                "chunk_overlap": chunk_overlap,
+                "embedding_model": model_name,
+                "startup_seconds": round(startup_seconds, 3),
+                **report["summary"],
+            }
+        )
+
+    def total_latency(row: Dict) -> float:
+        return sum(row.get(f"{stage}_mean_ms", 0.0) for stage in STAGES)
+
+    rows.sort(key=lambda row: (-(row[f"hit@{k}"] or 0.0), total_latency(row)))
+    for row in rows:
+        logger.info(f"Sweep result: {row}")
+    return rows
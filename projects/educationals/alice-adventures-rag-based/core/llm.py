@@ -11,6 +11,19 @@ from langchain.prompts import ChatPromptTemplate
 
 logger = logging.getLogger(__name__)
 
+RAG_PROMPT = ChatPromptTemplate.from_template(
+    """
+    Answer the user's question based *only* on the following context.
+    If the context does not contain the answer, state that you don't know.
+
+    Context:
+    {context}
+
+    Question:
+    {question}
+"""
+)
+
 
 def get_chat_model(
     model_name: str = "gpt-4.1-mini", temperature: float = 0, max_tokens: int = 500
@@ -79,25 +92,12 @@ def create_rag_chain(retriever, llm) -> Runnable:
     Runnable
         Complete RAG chain that can be invoked with questions
     """
-    prompt = ChatPromptTemplate.from_template(
-        """
-        Answer the user's question based *only* on the following context.
-        If the context does not contain the answer, state that you don't know.
-
-        Context:
-        {context}
-
-        Question:
-        {question}
-    """
-    )
-
     chain = (
         {
             "context": retriever | format_docs,
             "question": RunnablePassthrough(),
         }
-        | prompt
+        | RAG_PROMPT
         | llm
         | StrOutputParser()
     )
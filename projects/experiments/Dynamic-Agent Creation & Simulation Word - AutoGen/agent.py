@@ -3,7 +3,7 @@ from autogen_core import (MessageContext,
                           message_handler)
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
-from autogen_ext.models.openai import OpenAIChatCompletionClient
+from model_pool import get_model_client
 import messages
 import random
 
@@ -22,8 +22,8 @@ class Agent(RoutedAgent):
 
     def __init__(self, name) -> None:
         super().__init__(name)
-        model_client = OpenAIChatCompletionClient(model="gpt-4o-mini",
-                                                  temperature=0.7)
+        model_client = get_model_client(model="gpt-4o-mini",
+                                        temperature=0.7)
         self._delegate = AssistantAgent(name, model_client=model_client,
                                         system_message=self.system_message)
         
@@ -38,7 +38,7 @@ class Agent(RoutedAgent):
         idea = response.chat_message.content
 
         if random.random() < self.CHANCES_THAT_I_BOUNCE_IDEA_OFF_ANOTHER:
-            recipient = messages.find_recipient()
+            recipient = messages.find_recipient(exclude=self.id.type)
             message = f"Here is my business idea. It may not be your speciality, but please refine it and make it better. {idea}"
             response = await self.send_message(messages.Message(content=message), 
                                                recipient)
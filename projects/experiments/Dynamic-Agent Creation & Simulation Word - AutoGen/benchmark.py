@@ -0,0 +1,98 @@
+"""
+Simulation benchmark: messages/sec and p95 handler latency as the number of
+worker processes grows. Uses the offline mock model client, so no API key is
+needed.
+
+Usage:
+    python benchmark.py --workers 1 2 4 --agents 20 --messages 400 --concurrency 32
+"""
+import os
+
+# Must be set before model_pool is imported, here and in the worker processes
+os.environ.setdefault("SIM_MOCK_MODEL", "1")
+os.environ.setdefault("SIM_REQUESTS_PER_MINUTE", "1000000")
+
+from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntimeHost, GrpcWorkerAgentRuntime
+from autogen_core import AgentId
+from launcher import (Placement, add_coordinator_serializers, create_agents, start_local_workers,
+                      stop_local_workers, wait_for_workers)
+import messages
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+
+async def send_load(runtime, agent_names, total, concurrency):
+    """Send `total` messages to random agents with at most `concurrency` in flight."""
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send_one():
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await runtime.send_message(messages.Message(content="Give me an idea"),
+                                           AgentId(random.choice(agent_names), "default"))
+                latencies.append(time.perf_counter() - start)
+            except Exception as e:
+                print(f"Message failed: {e}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send_one() for _ in range(total)))
+    return latencies, time.perf_counter() - start
+
+
+async def run_once(worker_count, port, agents, total_messages, concurrency):
+    address = f"localhost:{port}"
+    host = GrpcWorkerAgentRuntimeHost(address=address)
+    host.start()
+    worker_names, processes = start_local_workers(address, worker_count)
+    runtime = GrpcWorkerAgentRuntime(host_address=address)
+    add_coordinator_serializers(runtime)
+    await runtime.start()
+    try:
+        await wait_for_workers(runtime, worker_names)
+        placement = Placement(worker_names)
+        agent_names = await create_agents(runtime, placement, agents, write_ideas=False)
+        latencies, elapsed = await send_load(runtime, agent_names, total_messages, concurrency)
+    finally:
+        await runtime.stop()
+        stop_local_workers(processes)
+        await host.stop()
+
+    ordered = sorted(latencies)
+    return {
+        "workers": worker_count,
+        "agents": len(agent_names),
+        "messages": len(latencies),
+        "messages_per_sec": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.mean(ordered) * 1000, 1) if ordered else None,
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] * 1000, 1) if ordered else None,
+        "placement": placement.summary(),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark the simulation across worker counts.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--agents", type=int, default=20)
+    parser.add_argument("--messages", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--port", type=int, default=50061)
+    args = parser.parse_args()
+
+    results = []
+    for offset, worker_count in enumerate(args.workers):
+        result = await run_once(worker_count, args.port + offset, args.agents, args.messages, args.concurrency)
+        print(result)
+        results.append(result)
+
+    print(f"\n{'workers':>8} {'msgs/sec':>10} {'mean ms':>9} {'p95 ms':>8}")
+    for r in results:
+        print(f"{r['workers']:>8} {r['messages_per_sec']:>10} {r['mean_ms']:>9} {r['p95_ms']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,11 +1,15 @@
 from autogen_core import MessageContext, RoutedAgent, message_handler
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
-from autogen_ext.models.openai import OpenAIChatCompletionClient
+from model_pool import get_model_client, metrics
+from registry import announce_agent
 import messages
 from autogen_core import TRACE_LOGGER_NAME
-import importlib
 import logging
+import os
+import sys
+import time
+import types
 from autogen_core import AgentId
 
 logging.basicConfig(level=logging.WARNING)
@@ -13,6 +17,17 @@ logger = logging.getLogger(TRACE_LOGGER_NAME)
 logger.addHandler(logging.StreamHandler())
 logger.setLevel(logging.DEBUG)
 
+# Generated sources are kept here for inspection only; agents are loaded from memory
+GENERATED_DIR = "generated_agents"
+
+
+def load_module_from_source(module_name, source):
+    """Compile generated code into a module without going through the filesystem."""
+    module = types.ModuleType(module_name)
+    exec(compile(source, f"<{module_name}>", "exec"), module.__dict__)
+    sys.modules[module_name] = module
+    return module
+
 
 class Creator(RoutedAgent):
 
@@ -33,33 +48,54 @@ class Creator(RoutedAgent):
 
     def __init__(self, name) -> None:
         super().__init__(name)
-        model_client = OpenAIChatCompletionClient(model="gpt-4o-mini", 
-                                                  temperature=1.0)
+        model_client = get_model_client(model="gpt-4o-mini",
+                                        temperature=1.0)
         self._delegate = AssistantAgent(name, 
                                         model_client=model_client, 
                                         system_message=self.system_message)
+        self._template = None
 
     def get_user_prompt(self):
         prompt = "Please generate a new Agent based strictly on this template. Stick to the class structure. \
             Respond only with the python code, no other text, and no markdown code blocks.\n\n\
             Be creative about taking the agent in a new direction, but don't change method signatures.\n\n\
             Here is the template:\n\n"
-        with open("agent.py", "r", encoding="utf-8") as f:
-            template = f.read()
-        return prompt + template   
+        if self._template is None:
+            with open("agent.py", "r", encoding="utf-8") as f:
+                self._template = f.read()
+        return prompt + self._template
         
 
+    @message_handler
+    async def handle_ping(self, message: messages.Ping, ctx: MessageContext) -> messages.Ping:
+        # Lets a launcher check that this worker is connected and ready
+        return messages.Ping(worker=self.id.type)
+
+    @message_handler
+    async def handle_metrics_request(self, message: messages.MetricsRequest, ctx: MessageContext) -> messages.MetricsReport:
+        # Model-call latency and retries happen here, not in the coordinator
+        return messages.MetricsReport(worker=self.id.type, samples=dict(metrics.samples),
+                                      counters=dict(metrics.counters))
+
     @message_handler
     async def handle_my_message_type(self, message: messages.Message, ctx: MessageContext) -> messages.Message:
         filename = message.content
         agent_name = filename.split(".")[0]
+        start = time.perf_counter()
         text_message = TextMessage(content=self.get_user_prompt(), source="user")
         response = await self._delegate.on_messages([text_message], ctx.cancellation_token)
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(response.chat_message.content)
+        source = response.chat_message.content
+        os.makedirs(GENERATED_DIR, exist_ok=True)
+        with open(os.path.join(GENERATED_DIR, filename), "w", encoding="utf-8") as f:
+            f.write(source)
         print(f"** Creator has created python code for agent {agent_name} - about to register with Runtime")
-        module = importlib.import_module(agent_name)
+        module = load_module_from_source(agent_name, source)
         await module.Agent.register(self.runtime, agent_name, lambda: module.Agent(agent_name))
+        # Only fully registered agents become visible to find_recipient
+        await announce_agent(self, agent_name)
         logger.info(f"** Agent {agent_name} is live")
+        metrics.record("agent_creation", time.perf_counter() - start)
+        start = time.perf_counter()
         result = await self.send_message(messages.Message(content="Give me an idea"), AgentId(agent_name, "default"))
+        metrics.record("idea", time.perf_counter() - start)
         return messages.Message(content=result.content)
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""
+Run the simulation across several worker processes, on one machine or many.
+
+Every worker process runs its own GrpcWorkerAgentRuntime (and so its own event
+loop and core) with a Creator registered as Creator_<worker name>. A coordinator
+places each new agent on the least-loaded worker, so agents - and the messages
+they handle - are spread across processes.
+
+Usage:
+    # everything on this machine: host, coordinator and 4 worker processes
+    python launcher.py local --workers 4 --agents 20
+
+    # across hosts: start the host + coordinator on one machine ...
+    python launcher.py host --address 0.0.0.0:50051 --workers w1 w2 --agents 20
+    # ... and one worker per machine, pointing at the host; --budget-share is the
+    # number of workers splitting SIM_REQUESTS_PER_MINUTE between them
+    python launcher.py worker --host-address HOST:50051 --name w1 --budget-share 2
+"""
+from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntimeHost, GrpcWorkerAgentRuntime
+from autogen_core import AgentId, try_get_known_serializers_for_type
+from creator import Creator
+from model_pool import Metrics, metrics, close_all, share_request_budget
+from registry import attach_registry
+import messages
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+
+MAX_CONCURRENT_CREATIONS = 5
+WORKER_READY_TIMEOUT = 60
+
+
+async def run_worker(host_address, name, budget_share=1):
+    """
+    Connect one worker runtime to the host and serve agents until signalled to stop.
+
+    The worker gets 1/`budget_share` of the request budget, so `budget_share` workers
+    together stay within SIM_REQUESTS_PER_MINUTE.
+    """
+    share_request_budget(budget_share)
+    worker = GrpcWorkerAgentRuntime(host_address=host_address)
+    await worker.start()
+    await attach_registry(worker, name)
+    await Creator.register(worker, f"Creator_{name}", lambda: Creator(f"Creator_{name}"))
+    print(f"** Worker {name} connected to {host_address}")
+    try:
+        await worker.stop_when_signal()
+    finally:
+        await close_all()
+
+
+def worker_process(host_address, name, budget_share):
+    asyncio.run(run_worker(host_address, name, budget_share))
+
+
+def start_local_workers(host_address, count):
+    """Spawn `count` worker processes on this machine and return (names, processes)."""
+    names = [f"w{i}" for i in range(1, count + 1)]
+    processes = []
+    # The gRPC host is already running in this process, and gRPC state does not survive fork
+    context = multiprocessing.get_context("spawn")
+    for name in names:
+        process = context.Process(target=worker_process, args=(host_address, name, count), daemon=True)
+        process.start()
+        processes.append(process)
+    return names, processes
+
+
+def stop_local_workers(processes):
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join(timeout=10)
+
+
+class Placement:
+    """Tracks agents per worker and picks the least-loaded worker for the next one."""
+
+    def __init__(self, worker_names):
+        self.agents = {name: [] for name in worker_names}
+        self.in_flight = {name: 0 for name in worker_names}
+
+    def acquire(self):
+        name = min(self.agents, key=lambda n: len(self.agents[n]) + self.in_flight[n])
+        self.in_flight[name] += 1
+        return name
+
+    def release(self, worker_name, agent_name=None):
+        self.in_flight[worker_name] -= 1
+        if agent_name:
+            self.agents[worker_name].append(agent_name)
+
+    def all_agents(self):
+        return [agent for agents in self.agents.values() for agent in agents]
+
+    def summary(self):
+        return {name: len(agents) for name, agents in self.agents.items()}
+
+
+def add_coordinator_serializers(runtime):
+    """A coordinator hosts no agents, so it has to register the message types it exchanges itself."""
+    for message_type in (messages.Message, messages.Ping, messages.MetricsRequest, messages.MetricsReport):
+        runtime.add_message_serializer(try_get_known_serializers_for_type(message_type))
+
+
+async def wait_for_workers(runtime, worker_names, timeout=WORKER_READY_TIMEOUT):
+    """Ping every worker's Creator until it answers, so no message is sent to a missing agent type."""
+    deadline = time.monotonic() + timeout
+    for name in worker_names:
+        while True:
+            try:
+                await runtime.send_message(messages.Ping(), AgentId(f"Creator_{name}", "default"))
+                break
+            except Exception:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Worker {name} did not come up within {timeout}s")
+                await asyncio.sleep(0.5)
+
+
+async def create_agents(runtime, placement, how_many, write_ideas=True,
+                        max_concurrent=MAX_CONCURRENT_CREATIONS):
+    """Create `how_many` agents through a bounded pool, each on the least-loaded worker."""
+    queue = asyncio.Queue()
+    for i in range(1, how_many + 1):
+        queue.put_nowait(i)
+
+    async def creation_worker():
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            worker_name = placement.acquire()
+            agent_name = None
+            start = time.perf_counter()
+            try:
+                result = await runtime.send_message(messages.Message(content=f"agent{i}.py"),
+                                                    AgentId(f"Creator_{worker_name}", "default"))
+                agent_name = f"agent{i}"
+                metrics.record("agent_creation_end_to_end", time.perf_counter() - start)
+                if write_ideas:
+                    with open(f"idea{i}.md", "w") as f:
+                        f.write(result.content)
+            except Exception as e:
+                metrics.increment("failed_creations")
+                print(f"Failed to create agent{i} on {worker_name} due to exception: {e}")
+            finally:
+                placement.release(worker_name, agent_name)
+
+    await asyncio.gather(*(creation_worker() for _ in range(min(max_concurrent, how_many))))
+    return placement.all_agents()
+
+
+async def collect_worker_metrics(runtime, worker_names):
+    """Fetch every worker's metrics, merge them into `metrics` and return per-worker summaries."""
+    per_worker = {}
+    for name in worker_names:
+        try:
+            report = await runtime.send_message(messages.MetricsRequest(), AgentId(f"Creator_{name}", "default"))
+        except Exception as e:
+            print(f"Could not collect metrics from {name}: {e}")
+            continue
+        worker_metrics = Metrics()
+        worker_metrics.merge(report.samples, report.counters)
+        per_worker[name] = worker_metrics.summary()
+        metrics.merge(report.samples, report.counters)
+    return per_worker
+
+
+async def run_coordinator(host_address, worker_names, how_many):
+    runtime = GrpcWorkerAgentRuntime(host_address=host_address)
+    add_coordinator_serializers(runtime)
+    await runtime.start()
+    try:
+        await wait_for_workers(runtime, worker_names)
+        placement = Placement(worker_names)
+        await create_agents(runtime, placement, how_many)
+        print(f"Agents per worker: {placement.summary()}")
+        per_worker = await collect_worker_metrics(runtime, worker_names)
+        print(json.dumps({"workers": per_worker, "total": metrics.summary()}, indent=2))
+    finally:
+        await runtime.stop()
+
+
+async def run_host(address, worker_names, how_many, local_workers=0):
+    host = GrpcWorkerAgentRuntimeHost(address=address)
+    host.start()
+    processes = []
+    host_address = address.replace("0.0.0.0", "localhost")
+    if local_workers:
+        worker_names, processes = start_local_workers(host_address, local_workers)
+    try:
+        await run_coordinator(host_address, worker_names, how_many)
+    finally:
+        stop_local_workers(processes)
+        await host.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the agent world across several worker processes.")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    local = sub.add_parser("local", help="Host, coordinator and N worker processes on this machine")
+    local.add_argument("--address", default="localhost:50051")
+    local.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    local.add_argument("--agents", type=int, default=20)
+
+    host = sub.add_parser("host", help="Host and coordinator for workers started elsewhere")
+    host.add_argument("--address", default="0.0.0.0:50051")
+    host.add_argument("--workers", nargs="+", required=True, help="Names of the remote workers")
+    host.add_argument("--agents", type=int, default=20)
+
+    worker = sub.add_parser("worker", help="One worker process connected to a host")
+    worker.add_argument("--host-address", required=True)
+    worker.add_argument("--name", required=True)
+    worker.add_argument("--budget-share", type=int, default=1,
+                        help="Number of workers sharing SIM_REQUESTS_PER_MINUTE")
+
+    args = parser.parse_args()
+    if args.mode == "local":
+        asyncio.run(run_host(args.address, [], args.agents, local_workers=args.workers))
+    elif args.mode == "host":
+        asyncio.run(run_host(args.address, args.workers, args.agents))
+    else:
+        asyncio.run(run_worker(args.host_address, args.name, args.budget_share))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,42 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, List
 from autogen_core import AgentId
-import glob
-import os
 
 
-import random
-
 @dataclass
 class Message:
     content: str
 
 
-def find_recipient() -> AgentId:
-    try:
-        agent_files = glob.glob("agent*.py")
-        agent_names = [os.path.splitext(file)[0] for file in agent_files]
-        agent_names.remove("agent")
-        agent_name = random.choice(agent_names)
-        print(f"Selecting agent for refinement: {agent_name}")
-        return AgentId(agent_name, "default")
-    except Exception as e:
-        print(f"Exception finding recipient: {e}")
+@dataclass
+class AgentRegistered:
+    name: str
+
+
+@dataclass
+class Ping:
+    worker: str = ""
+
+
+@dataclass
+class MetricsRequest:
+    pass
+
+
+@dataclass
+class MetricsReport:
+    worker: str
+    samples: Dict[str, List[float]] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+
+def find_recipient(exclude: str = None) -> AgentId:
+    # Imported here because registry.py depends on the message types above
+    from registry import registry
+
+    agent_name = registry.choose(exclude=exclude)
+    if agent_name is None:
+        print("No registered agents available for refinement, falling back to agent1")
         return AgentId("agent1", "default")
+    print(f"Selecting agent for refinement: {agent_name}")
+    return AgentId(agent_name, "default")
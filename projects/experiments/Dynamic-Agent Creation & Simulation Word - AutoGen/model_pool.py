@@ -0,0 +1,247 @@
+from autogen_core.models import ChatCompletionClient, CreateResult, RequestUsage
+from autogen_ext.models.openai import OpenAIChatCompletionClient
+from collections import defaultdict
+import asyncio
+import openai
+import os
+import random
+import statistics
+import time
+
+# Set SIM_MOCK_MODEL=1 to replace OpenAI with MockChatCompletionClient (inherited by worker processes)
+USE_MOCK_MODEL = os.getenv("SIM_MOCK_MODEL") == "1"
+MOCK_LATENCY_MS = float(os.getenv("SIM_MOCK_LATENCY_MS", "50"))
+MOCK_CPU_MS = float(os.getenv("SIM_MOCK_CPU_MS", "5"))
+
+# Global request budget; worker processes each take a share of it (see share_request_budget)
+REQUESTS_PER_MINUTE = float(os.getenv("SIM_REQUESTS_PER_MINUTE", "300"))
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+
+RETRYABLE_ERRORS = (openai.RateLimitError,
+                    openai.APIConnectionError,
+                    openai.APITimeoutError,
+                    openai.InternalServerError)
+
+
+class Metrics:
+    """Latency samples and counters collected across the simulation."""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.counters = defaultdict(int)
+
+    def record(self, name, seconds):
+        self.samples[name].append(seconds)
+
+    def increment(self, name, amount=1):
+        self.counters[name] += amount
+
+    def merge(self, samples, counters):
+        """Add the raw samples and counters collected by another process."""
+        for name, values in samples.items():
+            self.samples[name].extend(values)
+        for name, amount in counters.items():
+            self.counters[name] += amount
+
+    def summary(self):
+        report = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            report[name] = {
+                "count": len(values),
+                "mean_s": round(statistics.mean(values), 3),
+                "p95_s": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 3),
+                "max_s": round(ordered[-1], 3),
+            }
+        report.update(self.counters)
+        return report
+
+
+metrics = Metrics()
+
+
+class RateLimiter:
+    """Token bucket that spaces requests to stay under a requests-per-minute budget."""
+
+    def __init__(self, requests_per_minute):
+        self.rate = requests_per_minute / 60
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = None
+
+    async def acquire(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+rate_limiter = RateLimiter(REQUESTS_PER_MINUTE)
+_shared_clients = {}
+
+
+def share_request_budget(processes):
+    """Limit this process to its 1/`processes` share of REQUESTS_PER_MINUTE."""
+    global rate_limiter
+    rate_limiter = RateLimiter(REQUESTS_PER_MINUTE / processes)
+
+
+class PooledModelClient(ChatCompletionClient):
+    """
+    Lightweight per-agent view of a shared OpenAIChatCompletionClient.
+
+    All views of the same model share one underlying client (and so one HTTP
+    connection pool). Every request goes through the global rate limiter and is
+    retried with exponential backoff on rate-limit and transient errors.
+    """
+
+    def __init__(self, client, extra_create_args=None):
+        self._client = client
+        self._extra_create_args = extra_create_args or {}
+
+    async def _backoff(self, attempt, error):
+        """Count a failed attempt and sleep before the next one; re-raises once retries run out."""
+        if attempt == MAX_RETRIES:
+            metrics.increment("failed_calls")
+            raise error
+        metrics.increment("retries")
+        delay = BACKOFF_BASE_SECONDS * (2 ** attempt) + random.uniform(0, 0.5)
+        print(f"Model call failed ({type(error).__name__}), retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    async def create(self, messages, **kwargs):
+        kwargs["extra_create_args"] = {**self._extra_create_args, **kwargs.get("extra_create_args", {})}
+        for attempt in range(MAX_RETRIES + 1):
+            await rate_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                result = await self._client.create(messages, **kwargs)
+                metrics.record("model_call", time.perf_counter() - start)
+                return result
+            except RETRYABLE_ERRORS as e:
+                await self._backoff(attempt, e)
+
+    async def create_stream(self, messages, **kwargs):
+        kwargs["extra_create_args"] = {**self._extra_create_args, **kwargs.get("extra_create_args", {})}
+        for attempt in range(MAX_RETRIES + 1):
+            await rate_limiter.acquire()
+            start = time.perf_counter()
+            started = False
+            try:
+                async for chunk in self._client.create_stream(messages, **kwargs):
+                    started = True
+                    yield chunk
+                metrics.record("model_call", time.perf_counter() - start)
+                return
+            except RETRYABLE_ERRORS as e:
+                # Chunks already handed to the caller cannot be taken back, so only retry before the first one
+                if started:
+                    metrics.increment("failed_calls")
+                    raise
+                await self._backoff(attempt, e)
+
+    async def close(self):
+        # The underlying client is shared; it is closed once by close_all()
+        pass
+
+    def actual_usage(self):
+        return self._client.actual_usage()
+
+    def total_usage(self):
+        return self._client.total_usage()
+
+    def count_tokens(self, messages, **kwargs):
+        return self._client.count_tokens(messages, **kwargs)
+
+    def remaining_tokens(self, messages, **kwargs):
+        return self._client.remaining_tokens(messages, **kwargs)
+
+    @property
+    def capabilities(self):
+        return self._client.capabilities
+
+    @property
+    def model_info(self):
+        return self._client.model_info
+
+
+class MockChatCompletionClient(ChatCompletionClient):
+    """
+    Offline model client for benchmarks.
+
+    Code-generation requests get the agent template back unchanged, so the
+    Creator produces working agents; every other request returns a short idea.
+    Each call waits MOCK_LATENCY_MS (network time) and burns MOCK_CPU_MS of CPU
+    (handler work), so adding worker processes has something to parallelize.
+    """
+
+    def __init__(self, latency_ms=MOCK_LATENCY_MS, cpu_ms=MOCK_CPU_MS):
+        self.latency = latency_ms / 1000
+        self.cpu = cpu_ms / 1000
+        self._usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
+        with open("agent.py", "r", encoding="utf-8") as f:
+            self._template = f.read()
+
+    async def create(self, messages, **kwargs):
+        await asyncio.sleep(self.latency)
+        deadline = time.perf_counter() + self.cpu
+        while time.perf_counter() < deadline:
+            pass
+        prompt = str(messages[-1].content) if messages else ""
+        content = self._template if "Here is the template" in prompt else "Mock idea: an agentic AI marketplace."
+        return CreateResult(finish_reason="stop", content=content, usage=self._usage, cached=False)
+
+    async def create_stream(self, messages, **kwargs):
+        # The whole reply arrives as one chunk, followed by the final result
+        result = await self.create(messages, **kwargs)
+        yield result.content
+        yield result
+
+    async def close(self):
+        pass
+
+    def actual_usage(self):
+        return self._usage
+
+    def total_usage(self):
+        return self._usage
+
+    def count_tokens(self, messages, **kwargs):
+        return 0
+
+    def remaining_tokens(self, messages, **kwargs):
+        return 128000
+
+    @property
+    def capabilities(self):
+        return self.model_info
+
+    @property
+    def model_info(self):
+        return {"vision": False, "function_calling": False, "json_output": False,
+                "family": "unknown", "structured_output": False}
+
+
+def get_model_client(model="gpt-4o-mini", temperature=0.7):
+    """Return a rate-limited client for `model` that shares its connection pool with every other agent."""
+    if model not in _shared_clients:
+        if USE_MOCK_MODEL:
+            _shared_clients[model] = MockChatCompletionClient()
+        else:
+            _shared_clients[model] = OpenAIChatCompletionClient(model=model)
+    return PooledModelClient(_shared_clients[model], {"temperature": temperature})
+
+
+async def close_all():
+    for client in _shared_clients.values():
+        await client.close()
+    _shared_clients.clear()
@@ -0,0 +1,90 @@
+from autogen_core import (MessageContext,
+                          RoutedAgent,
+                          TopicId,
+                          TypeSubscription,
+                          message_handler)
+import messages
+import random
+import threading
+
+# Topic on which newly registered agents are announced to every worker
+REGISTRY_TOPIC = "agent_registry"
+
+
+class AgentRegistry:
+    """
+    Set of live agent types with O(1) insert, remove and random choice.
+
+    Names are kept in a list plus a name -> position index; removal swaps the
+    last element into the freed slot so the list never has holes.
+    """
+
+    def __init__(self):
+        self._names = []
+        self._index = {}
+        self._lock = threading.Lock()
+
+    def add(self, name):
+        with self._lock:
+            if name not in self._index:
+                self._index[name] = len(self._names)
+                self._names.append(name)
+
+    def remove(self, name):
+        with self._lock:
+            position = self._index.pop(name, None)
+            if position is None:
+                return
+            last = self._names.pop()
+            if position < len(self._names):
+                self._names[position] = last
+                self._index[last] = position
+
+    def choose(self, exclude=None):
+        """Return a random registered name other than `exclude`, or None."""
+        with self._lock:
+            if not self._names or self._names == [exclude]:
+                return None
+            while True:
+                name = random.choice(self._names)
+                if name != exclude:
+                    return name
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __len__(self):
+        return len(self._names)
+
+
+# Replica for this process, kept up to date by RegistryReplica
+registry = AgentRegistry()
+
+
+class RegistryReplica(RoutedAgent):
+    """Adds agents announced on REGISTRY_TOPIC to this process's registry."""
+
+    def __init__(self, name) -> None:
+        super().__init__(name)
+
+    @message_handler
+    async def handle_registered(self, message: messages.AgentRegistered, ctx: MessageContext) -> None:
+        registry.add(message.name)
+
+
+async def attach_registry(runtime, worker_name):
+    """
+    Subscribe this worker's registry replica to agent announcements.
+
+    Agent types must be unique across gRPC workers, so each worker registers
+    its replica under its own type name.
+    """
+    agent_type = f"registry_{worker_name}"
+    await RegistryReplica.register(runtime, agent_type, lambda: RegistryReplica(agent_type))
+    await runtime.add_subscription(TypeSubscription(topic_type=REGISTRY_TOPIC, agent_type=agent_type))
+
+
+async def announce_agent(agent: RoutedAgent, name):
+    """Record a fully registered agent locally and announce it to every worker."""
+    registry.add(name)
+    await agent.publish_message(messages.AgentRegistered(name=name), TopicId(REGISTRY_TOPIC, "default"))
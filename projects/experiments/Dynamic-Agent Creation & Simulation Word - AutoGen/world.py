@@ -3,10 +3,15 @@ from agent import Agent
 from creator import Creator
 from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime
 from autogen_core import AgentId
+from model_pool import metrics, close_all
+from registry import attach_registry
 import messages
 import asyncio
+import json
 
 HOW_MANY_AGENTS = 20
+# Upper bound on agents being generated at the same time
+MAX_CONCURRENT_CREATIONS = 5
 
 async def create_and_message(worker, creator_id, i: int):
     try:
@@ -16,24 +21,41 @@ async def create_and_message(worker, creator_id, i: int):
         with open(f"idea{i}.md", "w") as f:
             f.write(result.content)
     except Exception as e:
+        metrics.increment("failed_creations")
         print(f"Failed to run worker {i} due to exception: {e}")
 
+async def creation_worker(worker, creator_id, queue: asyncio.Queue):
+    while True:
+        try:
+            i = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        await create_and_message(worker, creator_id, i)
+
 async def main():
     host = GrpcWorkerAgentRuntimeHost(address="localhost:50051")
     host.start() 
 
     worker = GrpcWorkerAgentRuntime(host_address="localhost:50051")
     await worker.start()
+    await attach_registry(worker, "main")
 
     result = await Creator.register(worker, 
                                     "Creator", 
                                     lambda: Creator("Creator"))
     creator_id = AgentId("Creator", "default")
 
-    coroutines = [create_and_message(worker, creator_id, i) for i in range(1, HOW_MANY_AGENTS+1)]
-    await asyncio.gather(*coroutines)
+    # A bounded pool of workers drains the queue instead of launching every creation at once
+    queue = asyncio.Queue()
+    for i in range(1, HOW_MANY_AGENTS+1):
+        queue.put_nowait(i)
+    workers = [creation_worker(worker, creator_id, queue) for _ in range(min(MAX_CONCURRENT_CREATIONS, HOW_MANY_AGENTS))]
+    await asyncio.gather(*workers)
+
+    print(json.dumps(metrics.summary(), indent=2))
 
     try:
+        await close_all()
         await worker.stop()
         await host.stop()
     except Exception as e:
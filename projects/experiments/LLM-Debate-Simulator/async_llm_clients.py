@@ -0,0 +1,182 @@
+# /async_llm_clients.py
+"""
+Async counterpart of llm_clients.py.
+
+All async provider clients share one pooled httpx connection pool, and every
+provider has its own concurrency limit and request timeout (see
+PROVIDER_LIMITS in config.py). A local "mock" provider with configurable
+latency is included so the concurrent debate can be measured offline.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import openai
+import groq
+from config import load_api_key, PROVIDER_LIMITS, MAX_CONNECTIONS, MAX_KEEPALIVE_CONNECTIONS
+
+
+class LLMQueryError(Exception):
+    """Raised by query_llm_async(raise_on_error=True) when a provider call fails or times out."""
+
+
+class MockAsyncClient:
+    """
+    Local stand-in for an async chat-completions client.
+
+    Each call sleeps for the configured latency of the requested model and
+    returns a canned answer, mimicking the `client.chat.completions.create`
+    interface of the OpenAI and Groq SDKs.
+    """
+    def __init__(self, latencies=None, default_latency=1.0):
+        self.latencies = latencies or {}
+        self.default_latency = default_latency
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, model, messages, **kwargs):
+        await asyncio.sleep(self.latencies.get(model, self.default_latency))
+        if kwargs.get("response_format", {}).get("type") == "json_object":
+            content = '{"ranking": [], "winner": "A", "reasoning": "Mock verdict."}'
+        else:
+            content = f"Mock argument from {model}."
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def close(self):
+        pass
+
+
+# Created lazily inside the running event loop, see _get_clients()
+_http_client = None
+_clients = {}
+_semaphores = {}
+
+
+def register_mock_provider(latencies=None, default_latency=1.0):
+    """
+    Registers the local mock provider under the name 'mock'.
+
+    Args:
+        latencies (Dict[str, float]): Simulated latency in seconds per model name.
+        default_latency (float): Latency for models not listed in `latencies`.
+    """
+    _clients["mock"] = MockAsyncClient(latencies, default_latency)
+
+
+def _get_clients():
+    """Creates the pooled HTTP client and the real provider clients on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            )
+        )
+        factories = {
+            "openai": lambda: openai.AsyncOpenAI(
+                api_key=load_api_key("OPENAI_API_KEY"), http_client=_http_client
+            ),
+            "groq": lambda: groq.AsyncGroq(
+                api_key=load_api_key("GROQ_API_KEY"), http_client=_http_client
+            ),
+        }
+        for provider, factory in factories.items():
+            if provider in _clients:
+                continue
+            try:
+                _clients[provider] = factory()
+            except ValueError as e:
+                print(e)
+    return _clients
+
+
+def _limits(provider):
+    return PROVIDER_LIMITS.get(provider, PROVIDER_LIMITS["default"])
+
+
+def _get_semaphore(provider):
+    if provider not in _semaphores:
+        _semaphores[provider] = asyncio.Semaphore(_limits(provider)["max_concurrency"])
+    return _semaphores[provider]
+
+
+async def query_llm_async(provider, model, prompt, is_json=False, raise_on_error=False):
+    """
+    Queries a specified LLM asynchronously, respecting per-provider limits.
+
+    Args:
+        provider (str): The LLM provider (e.g., 'openai', 'groq', 'mock').
+        model (str): The model name (e.g., 'gpt-4o-mini', 'llama3-8b-8192').
+        prompt (str): The prompt to send to the model.
+        is_json (bool): Whether to enable JSON mode for the response (if supported).
+        raise_on_error (bool): Raise LLMQueryError on a failed call instead of
+            returning an error message as the content.
+
+    Returns:
+        str: The content of the LLM's response.
+
+    Raises:
+        ValueError: If the provider is not supported.
+        LLMQueryError: If the call fails and `raise_on_error` is set.
+    """
+    provider = provider.lower()
+    client = _get_clients().get(provider)
+    if not client:
+        raise ValueError(f"Unsupported provider: {provider}. Supported: {list(_clients.keys())}")
+
+    chat_completion_args = {
+        "model": model,
+        "messages": [
+            {"role": "system",
+             "content": prompt}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 1024
+    }
+    if is_json and provider in ("openai", "mock"):
+        chat_completion_args['response_format'] = {"type": "json_object"}
+
+    try:
+        async with _get_semaphore(provider):
+            response = await asyncio.wait_for(
+                client.chat.completions.create(**chat_completion_args),
+                timeout=_limits(provider)["timeout"],
+            )
+        content = response.choices[0].message.content
+        return content.strip() if content else ""
+    except asyncio.TimeoutError as e:
+        print(f"Timed out while querying {provider}/{model}")
+        error = e
+    except Exception as e:
+        print(f"An error occured while querying {provider}/{model}: {e}")
+        error = e
+    if raise_on_error:
+        raise LLMQueryError(f"Could not get a response from {provider}/{model}") from error
+    return f"Error: Could not get a response from {model}"
+
+
+async def timed_query(provider, model, prompt, is_json=False, raise_on_error=False):
+    """
+    Same as query_llm_async, but also returns the call latency in seconds.
+
+    Returns:
+        Tuple[str, float]: The response content and its latency.
+    """
+    start = time.perf_counter()
+    content = await query_llm_async(provider, model, prompt, is_json, raise_on_error)
+    return content, time.perf_counter() - start
+
+
+async def close_clients():
+    """Closes the shared connection pool. Call once before the event loop exits."""
+    global _http_client
+    for client in _clients.values():
+        await client.close()
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+    _clients.clear()
+    _semaphores.clear()
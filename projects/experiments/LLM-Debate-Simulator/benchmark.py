@@ -0,0 +1,55 @@
+# /benchmark.py
+"""
+Measures debate round latency, sequential vs. concurrent, against the local
+mock provider. No API keys or network access are needed.
+
+Usage:
+    python benchmark.py
+"""
+
+import asyncio
+
+from debate_simulator import DebateSimulator
+from async_llm_clients import register_mock_provider, close_clients
+
+# Simulated latency (seconds) per mock debater model
+MOCK_LATENCIES = {
+    "mock-fast": 0.5,
+    "mock-medium": 1.0,
+    "mock-slow": 1.5,
+}
+
+
+async def run_benchmark():
+    """
+    Runs one debate round sequentially and one concurrently and prints both timings.
+    """
+    register_mock_provider(MOCK_LATENCIES)
+    debaters = [
+        {"provider": "mock", "model": "mock-fast", "stance": "pro"},
+        {"provider": "mock", "model": "mock-medium", "stance": "con"},
+        {"provider": "mock", "model": "mock-slow", "stance": "neutral"},
+    ]
+    judge = {"provider": "mock", "model": "mock-fast"}
+
+    results = {}
+    try:
+        for label, concurrent in (("sequential", False), ("concurrent", True)):
+            simulator = DebateSimulator(debaters, judge)
+            await simulator.run_debate_async(concurrent=concurrent)
+            results[label] = simulator.timings["debate_round"]
+    finally:
+        await close_clients()
+
+    print("\n" + "=" * 50)
+    print(f"Sum of debater latencies : {sum(MOCK_LATENCIES.values()):.2f}s")
+    print(f"Slowest debater          : {max(MOCK_LATENCIES.values()):.2f}s")
+    for label, seconds in results.items():
+        print(f"{label.capitalize():<25}: {seconds:.2f}s")
+    print(f"Speedup                  : {results['sequential'] / results['concurrent']:.2f}x")
+    print("=" * 50)
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
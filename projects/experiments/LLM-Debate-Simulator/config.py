@@ -34,4 +34,27 @@ def load_api_key(provider_name):
 DEBATE_TOPIC = "Should remote work be the default standard for all tech companies?"
 RESULTS_DIR = "results"
 RANKED_DEBATE_FILE = os.path.join(RESULTS_DIR, "ranked_debate.json")
-DEBATE_SUMMARY_FILE = os.path.join(RESULTS_DIR, "debate_summary.md")
\ No newline at end of file
+DEBATE_SUMMARY_FILE = os.path.join(RESULTS_DIR, "debate_summary.md")
+
+# Per-provider limits for the async clients: maximum in-flight requests and
+# per-request timeout in seconds. Providers not listed use "default".
+PROVIDER_LIMITS = {
+    "openai": {"max_concurrency": 8, "timeout": 60},
+    "groq": {"max_concurrency": 4, "timeout": 60},
+    "mock": {"max_concurrency": 16, "timeout": 30},
+    "default": {"max_concurrency": 4, "timeout": 60},
+}
+
+# Shared HTTP connection pool for all async provider clients
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+
+# Tournament mode
+TOURNAMENT_DIR = os.path.join(RESULTS_DIR, "tournament")
+TOURNAMENT_TOPICS = [
+    DEBATE_TOPIC,
+    "Should AI-generated code be allowed in safety-critical software?",
+    "Should open-source foundation models be regulated like proprietary ones?",
+]
+TOURNAMENT_ROUNDS = 2  # rebuttal rounds after the opening statements
+MAX_CONCURRENT_DEBATES = 8
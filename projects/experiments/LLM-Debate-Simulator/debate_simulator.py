@@ -5,9 +5,12 @@ This is the beating heart of the project.
 The main logic of the orchestration of the debate 
 and evaluation is located in this module.
 """
+import asyncio
 import json
+import time
 
 from llm_clients import query_llm
+from async_llm_clients import timed_query
 from prompts import get_debate_prompt, get_judge_prompt
 
 class DebateSimulator:
@@ -26,6 +29,7 @@ class DebateSimulator:
         self.debaters_config = debaters
         self.judge_config = judge
         self.arguments = {}
+        self.timings = {}
 
     def run_debate(self):
         """
@@ -55,6 +59,67 @@ class DebateSimulator:
         print(f"---- All arguments collected ----\n")
         return self.arguments
     
+    async def run_debate_async(self, concurrent=True):
+        """
+        Collects arguments from all debaters using the async provider clients.
+
+        With `concurrent=True` all debaters are queried at once, so the round
+        takes as long as the slowest debater instead of the sum of all of them.
+
+        Args:
+            concurrent (bool): Fan the debaters out concurrently. Set to False
+                to await them one by one (useful as a baseline).
+
+        Returns:
+            Dict[str, Dict[str, str]]: A dictionary containing the arguments,
+            where keys are debater names (e.g., 'Debater_Pro').
+        """
+        print("---- Starting the Debater ----")
+        calls = []
+        for debater in self.debaters_config:
+            debater_name = f"Debater_{debater['stance'].capitalize()}"
+            print(f"🗣️  Querying {debater_name} (Model: {debater['model']}) for a '{debater['stance']}' argument...")
+            calls.append(timed_query(debater['provider'], debater['model'], get_debate_prompt(debater['stance'])))
+
+        start = time.perf_counter()
+        if concurrent:
+            responses = await asyncio.gather(*calls)
+        else:
+            responses = [await call for call in calls]
+        self.timings["debate_round"] = time.perf_counter() - start
+
+        for debater, (argument, latency) in zip(self.debaters_config, responses):
+            debater_name = f"Debater_{debater['stance'].capitalize()}"
+            self.arguments[debater_name] = {
+                "stance": debater['stance'],
+                "model": debater['model'],
+                "argument": argument
+            }
+            self.timings[debater_name] = latency
+        print(f"---- All arguments collected in {self.timings['debate_round']:.2f}s ----\n")
+        return self.arguments
+
+    async def evaluate_debate_async(self):
+        """
+        Async version of evaluate_debate().
+
+        Returns:
+            Dict[str, Any]: The judge's parsed JSON ranking, or an error dictionary.
+        """
+        if not self.arguments:
+            raise ValueError("Debate has not been run yet. Call run_debate_async() first.")
+        print("--- Starting Evaluation ---")
+        print(f"⚖️  Sending arguments to the Judge (Model: {self.judge_config['model']})...")
+
+        judge_response_str, self.timings["judge"] = await timed_query(
+            self.judge_config['provider'],
+            self.judge_config['model'],
+            get_judge_prompt(self.arguments),
+            is_json=True
+        )
+        print("---- Evaluation received ----\n")
+        return self._parse_judge_response(judge_response_str)
+
     def evaluate_debate(self):
         """
         Uses a judge LLM to evaluate and rank the collected arguments.
@@ -79,7 +144,16 @@ class DebateSimulator:
         )
         
         print("---- Evaluation received ----\n")
+        return self._parse_judge_response(judge_response_str)
 
+    @staticmethod
+    def _parse_judge_response(judge_response_str):
+        """
+        Parses the judge's JSON output.
+
+        Returns:
+            Dict[str, Any]: The ranking, or an error dictionary with the raw response.
+        """
         try:
             # Parse the JSON response from the judge
             ranked_results = json.loads(judge_response_str)
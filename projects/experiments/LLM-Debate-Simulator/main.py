@@ -4,12 +4,15 @@ This file ties everything together. Its job is to define the models,
 run the simulator, and store and display the results.
 """
 
+import asyncio
+
 from debate_simulator import DebateSimulator
+from async_llm_clients import close_clients
 from utils import save_to_json, format_markdown_output, save_markdown_file
 from ui import display_in_terminal, create_gradio_interface
 from config import RANKED_DEBATE_FILE, DEBATE_SUMMARY_FILE
 
-def main():
+async def main():
     """
     Main function to run the LLM Debate Simulator.
     """
@@ -42,11 +45,14 @@ def main():
     # 2. Implementation: Run the simulation
     simulator = DebateSimulator(debaters, judge)
     
-    # Run the debate to get arguments
-    debate_arguments = simulator.run_debate()
-    
-    # Have the judge evaluate the arguments
-    ranked_results = simulator.evaluate_debate()
+    try:
+        # Run the debate to get arguments (all debaters are queried concurrently)
+        debate_arguments = await simulator.run_debate_async()
+
+        # Have the judge evaluate the arguments
+        ranked_results = await simulator.evaluate_debate_async()
+    finally:
+        await close_clients()
 
     if "error" in ranked_results:
         print(f"Halting due to evaluation error: {ranked_results['error']}")
@@ -70,6 +76,6 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except Exception as e:
         print(f"\nAn unexpected error occurred: {e}")
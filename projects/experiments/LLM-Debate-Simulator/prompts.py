@@ -1,17 +1,20 @@
 # /prompts.py
 from config import DEBATE_TOPIC
 
-def get_debate_prompt(stance):
+def get_debate_prompt(stance, topic=DEBATE_TOPIC):
     """
     Generates the system prompt for a debater LLM based on its stance.
 
     Args:
         stance (str): The stance the LLM should take ('pro', 'con', or 'neutral').
+        topic (str): The debate topic. Defaults to DEBATE_TOPIC.
 
     Returns:
         str: The formatted system prompt.
     """
-    if stance == 'pro':
+    if topic != DEBATE_TOPIC:
+        argument_position, instruction = _generic_position(stance)
+    elif stance == 'pro':
         argument_position = "You are a string advocate for remote work."
         instruction = "Argue passionately in favor of making remote work the default standard for tech companies."
     elif stance == 'con':
@@ -23,7 +26,7 @@ def get_debate_prompt(stance):
 
     return f"""
     **Role**: {argument_position}
-    **Topic**: "{DEBATE_TOPIC}"
+    **Topic**: "{topic}"
     **Task**: {instruction}
     
     **Instructions**:
@@ -33,6 +36,84 @@ def get_debate_prompt(stance):
     4. Do not introduce yourself or break character. Focus solely on the argument.
     """
 
+def _generic_position(stance):
+    """
+    Returns the role and instruction for a stance on an arbitrary topic.
+    """
+    if stance == 'pro':
+        return ("You are a strong advocate of the motion.",
+                "Argue passionately in favor of the motion.")
+    if stance == 'con':
+        return ("You are a staunch critic of the motion.",
+                "Argue persuasively against the motion, highlighting its drawbacks.")
+    return ("You are a neutral, balanced analyst.",
+            "Provide a balanced, objective view, weighing the pros and cons of the motion.")
+
+
+def get_rebuttal_prompt(stance, topic, own_argument, opponent_argument):
+    """
+    Generates the prompt for a rebuttal round.
+
+    Args:
+        stance (str): The debater's stance ('pro' or 'con').
+        topic (str): The debate topic.
+        own_argument (str): The debater's previous statement.
+        opponent_argument (str): The opponent's previous statement.
+
+    Returns:
+        str: The formatted rebuttal prompt.
+    """
+    argument_position, _ = _generic_position(stance)
+    return f"""
+    **Role**: {argument_position}
+    **Topic**: "{topic}"
+    **Task**: Write a rebuttal to your opponent's latest statement while defending your position.
+
+    **Your previous statement**:
+    {own_argument}
+
+    **Opponent's latest statement**:
+    {opponent_argument}
+
+    **Instructions**:
+    1. Directly address the opponent's strongest points.
+    2. Reinforce your own position with new reasoning, not repetition.
+    3. Keep it concise, between 120 and 200 words.
+    4. Do not introduce yourself or break character.
+    """
+
+
+def get_pairwise_judge_prompt(topic, transcript_a, transcript_b):
+    """
+    Generates the prompt for judging one head-to-head debate.
+
+    Args:
+        topic (str): The debate topic.
+        transcript_a (str): All statements of debater A, in order.
+        transcript_b (str): All statements of debater B, in order.
+
+    Returns:
+        str: The formatted prompt for the judge.
+    """
+    return f"""
+    **Role**: You are an expert debate judge and logical analyst.
+    **Task**: Decide which of two debaters argued better on the topic: "{topic}".
+
+    **Debater A**:
+    {transcript_a}
+
+    **Debater B**:
+    {transcript_b}
+
+    **Evaluation Criteria**: clarity, logic and persuasiveness, including how well each side answered the other's rebuttals.
+
+    **Output Format**:
+    You MUST respond with a valid JSON object and nothing else, with the keys:
+    - "winner": either "A" or "B".
+    - "reasoning": a brief, one-sentence explanation.
+    """
+
+
 def get_judge_prompt(arguments):
     """
     Generates the prompt for the evaluator LLM to rank the debate arguments.
@@ -44,10 +125,10 @@ def get_judge_prompt(arguments):
     Returns:
         str: The formatted prompt for the judge.
     """
-    argument_section = ""
-    for debater, info in arguments.items():
-        argument_section += f"--- Argument from {debater} ({info['stance']}) ---\n"
-        argument_section += f"{info['argument']}\n\n"
+    argument_section = "".join(
+        f"--- Argument from {debater} ({info['stance']}) ---\n{info['argument']}\n\n"
+        for debater, info in arguments.items()
+    )
 
     return f"""
     **Role**: You are an expert debate judge and logical analyst.
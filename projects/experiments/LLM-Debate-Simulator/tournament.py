@@ -0,0 +1,364 @@
+# /tournament.py
+"""
+Tournament mode: every pair of debaters argues every topic over several
+rebuttal rounds, and a judge decides each head-to-head debate.
+
+Debates are scheduled concurrently (bounded by MAX_CONCURRENT_DEBATES and the
+per-provider limits of the async clients). Every turn is streamed to disk as
+soon as it arrives, so the run can be resumed after an interruption: finished
+debates are skipped and unfinished ones continue from their last saved turn.
+Failed calls are never saved, so a debate hit by a provider error is left
+unfinished and its missing turns (or verdict) are retried on the next run.
+
+Usage:
+    python tournament.py            # real providers
+    python tournament.py --mock     # offline, against the local mock provider
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from itertools import combinations
+
+from async_llm_clients import LLMQueryError, timed_query, register_mock_provider, close_clients
+from prompts import get_debate_prompt, get_rebuttal_prompt, get_pairwise_judge_prompt
+from utils import format_blockquote
+from config import (
+    TOURNAMENT_DIR,
+    TOURNAMENT_TOPICS,
+    TOURNAMENT_ROUNDS,
+    MAX_CONCURRENT_DEBATES,
+)
+
+SIDES = ("pro", "con")
+
+
+def _slug(text):
+    return re.sub(r"[^a-zA-Z0-9]+", "-", text).strip("-").lower()
+
+
+class TranscriptWriter:
+    """
+    Streams tournament output to disk incrementally.
+
+    - `transcript.jsonl`: one line per debate turn, in completion order.
+    - `results.jsonl`: one line per judged debate.
+    - `debates/<debate_id>.md`: a Markdown transcript per debate.
+
+    Each write appends only the new record, so total output cost is linear
+    in the size of the transcript.
+    """
+    def __init__(self, output_dir=TOURNAMENT_DIR):
+        self.output_dir = output_dir
+        self.debates_dir = os.path.join(output_dir, "debates")
+        self.transcript_path = os.path.join(output_dir, "transcript.jsonl")
+        self.results_path = os.path.join(output_dir, "results.jsonl")
+        os.makedirs(self.debates_dir, exist_ok=True)
+
+    @staticmethod
+    def _read_jsonl(path):
+        records = []
+        if not os.path.exists(path):
+            return records
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A line cut short by an interruption; the turn will be redone
+                    continue
+        return records
+
+    def load_progress(self):
+        """
+        Reads previously saved turns and results.
+
+        Returns:
+            Tuple[Dict[str, Dict[Tuple[int, str], Dict]], Dict[str, Dict]]:
+            Saved turns per debate keyed by (round, side), and results per debate.
+        """
+        turns = defaultdict(dict)
+        for turn in self._read_jsonl(self.transcript_path):
+            turns[turn["debate_id"]][(turn["round"], turn["side"])] = turn
+        results = {r["debate_id"]: r for r in self._read_jsonl(self.results_path)}
+        return turns, results
+
+    @staticmethod
+    def _append(path, text):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+
+    def _markdown_path(self, debate_id):
+        return os.path.join(self.debates_dir, f"{debate_id}.md")
+
+    def start_debate(self, debate):
+        """Writes the Markdown header of a debate unless it already exists."""
+        path = self._markdown_path(debate["debate_id"])
+        if os.path.exists(path):
+            return
+        self._append(path, (
+            f"# {debate['topic']}\n\n"
+            f"- **Pro**: `{debate['pro']['model']}` ({debate['pro']['provider']})\n"
+            f"- **Con**: `{debate['con']['model']}` ({debate['con']['provider']})\n\n"
+        ))
+
+    def write_turn(self, turn):
+        """Appends one debate turn to the JSONL log and the debate's Markdown file."""
+        self._append(self.transcript_path, json.dumps(turn, ensure_ascii=False) + "\n")
+        label = "Opening" if turn["round"] == 0 else f"Rebuttal {turn['round']}"
+        self._append(
+            self._markdown_path(turn["debate_id"]),
+            f"### {label} - {turn['side'].capitalize()} (`{turn['model']}`)\n"
+            + format_blockquote(turn["text"]),
+        )
+
+    def write_result(self, result):
+        """Appends a judged result to the results log and the debate's Markdown file."""
+        self._append(self.results_path, json.dumps(result, ensure_ascii=False) + "\n")
+        self._append(
+            self._markdown_path(result["debate_id"]),
+            f"## 🏆 Verdict\n\n**Winner**: `{result['winner_model']}` "
+            f"({result['winner_side']})\n\n{result['reasoning']}\n",
+        )
+
+    def write_standings(self, standings):
+        """Writes the final leaderboard as Markdown."""
+        lines = [
+            "# 🏆 Tournament Standings\n\n",
+            "| Rank | Model | Wins | Losses | Undecided | Win Rate |\n",
+            "|:----:|:------|:----:|:------:|:---------:|:--------:|\n",
+        ]
+        for rank, row in enumerate(standings, 1):
+            lines.append(
+                f"| **{rank}** | `{row['model']}` | {row['wins']} | {row['losses']} "
+                f"| {row['undecided']} | {row['win_rate']:.0%} |\n"
+            )
+        path = os.path.join(self.output_dir, "standings.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(lines))
+        print(f"✅ Successfully saved tournament standings to {path}")
+
+
+class Tournament:
+    """
+    Runs a round-robin debate tournament across topics and debater pairings.
+    """
+    def __init__(self, topics, debaters, judge, rounds=TOURNAMENT_ROUNDS,
+                 max_concurrent_debates=MAX_CONCURRENT_DEBATES, output_dir=TOURNAMENT_DIR):
+        """
+        Args:
+            topics (List[str]): The debate topics.
+            debaters (List[Dict[str, str]]): Debaters with 'provider' and 'model'.
+            judge (Dict[str, str]): The judge LLM with 'provider' and 'model'.
+            rounds (int): Number of rebuttal rounds after the opening statements.
+            max_concurrent_debates (int): Maximum number of debates in flight.
+            output_dir (str): Directory for transcripts, results and standings.
+        """
+        self.topics = topics
+        self.debaters = debaters
+        self.judge = judge
+        self.rounds = rounds
+        self.max_concurrent_debates = max_concurrent_debates
+        self.writer = TranscriptWriter(output_dir)
+
+    def schedule(self):
+        """
+        Builds the list of debates: every debater pair on every topic, with
+        sides alternating between topics. Debate ids include each debater's
+        position in the list, so debaters sharing a model never collide.
+        Which side the judge sees as "A" alternates from one debate to the
+        next, so position bias does not favour either side.
+
+        Returns:
+            List[Dict[str, Any]]: Debate specifications.
+        """
+        debates = []
+        for topic_index, topic in enumerate(self.topics):
+            for first, second in combinations(enumerate(self.debaters), 2):
+                (pro_index, pro), (con_index, con) = (first, second) if topic_index % 2 == 0 else (second, first)
+                debate_id = (f"t{topic_index:03d}-d{pro_index}-{_slug(pro.get('name', pro['model']))}"
+                             f"-vs-d{con_index}-{_slug(con.get('name', con['model']))}")
+                judged_as = {"pro": "A", "con": "B"} if len(debates) % 2 == 0 else {"pro": "B", "con": "A"}
+                debates.append({"debate_id": debate_id, "topic": topic, "pro": pro, "con": con,
+                                "judged_as": judged_as})
+        return debates
+
+    async def _take_turn(self, debate, round_number, side, saved_turns):
+        if (round_number, side) in saved_turns:
+            return saved_turns[(round_number, side)]
+
+        debater = debate[side]
+        if round_number == 0:
+            prompt = get_debate_prompt(side, debate["topic"])
+        else:
+            other = "con" if side == "pro" else "pro"
+            prompt = get_rebuttal_prompt(
+                side,
+                debate["topic"],
+                saved_turns[(round_number - 1, side)]["text"],
+                saved_turns[(round_number - 1, other)]["text"],
+            )
+        text, latency = await timed_query(debater["provider"], debater["model"], prompt, raise_on_error=True)
+        turn = {
+            "debate_id": debate["debate_id"],
+            "topic": debate["topic"],
+            "round": round_number,
+            "side": side,
+            "model": debater["model"],
+            "text": text,
+            "latency": round(latency, 3),
+        }
+        self.writer.write_turn(turn)
+        return turn
+
+    async def _judge(self, debate, saved_turns):
+        def side_transcript(side):
+            return "\n\n".join(
+                saved_turns[(r, side)]["text"] for r in range(self.rounds + 1)
+            )
+
+        side_a, side_b = sorted(SIDES, key=debate["judged_as"].get)
+        response, _ = await timed_query(
+            self.judge["provider"],
+            self.judge["model"],
+            get_pairwise_judge_prompt(debate["topic"], side_transcript(side_a), side_transcript(side_b)),
+            is_json=True,
+            raise_on_error=True,
+        )
+        try:
+            verdict = json.loads(response)
+        except json.JSONDecodeError:
+            verdict = None
+        if isinstance(verdict, dict):
+            winner_side = {"A": side_a, "B": side_b}.get(str(verdict.get("winner")).strip().upper())
+            reasoning = verdict.get("reasoning", "")
+        else:
+            winner_side, reasoning = None, f"Judge did not return a JSON object: {response}"
+
+        return {
+            "debate_id": debate["debate_id"],
+            "topic": debate["topic"],
+            "pro_model": debate["pro"]["model"],
+            "con_model": debate["con"]["model"],
+            "pro_judged_as": debate["judged_as"]["pro"],
+            "winner_side": winner_side,
+            "winner_model": debate[winner_side]["model"] if winner_side else None,
+            "reasoning": reasoning,
+        }
+
+    async def _run_debate(self, debate, saved_turns, semaphore):
+        async with semaphore:
+            self.writer.start_debate(debate)
+            try:
+                for round_number in range(self.rounds + 1):
+                    # Both sides of a round depend only on the previous round, so query them together
+                    turns = await asyncio.gather(
+                        *(self._take_turn(debate, round_number, side, saved_turns) for side in SIDES)
+                    )
+                    for side, turn in zip(SIDES, turns):
+                        saved_turns[(round_number, side)] = turn
+                result = await self._judge(debate, saved_turns)
+            except LLMQueryError as e:
+                print(f"⚠️  {debate['debate_id']} left unfinished, rerun to resume it: {e}")
+                return None
+            self.writer.write_result(result)
+            print(f"⚖️  {debate['debate_id']}: winner {result['winner_model']}")
+            return result
+
+    async def run(self):
+        """
+        Runs (or resumes) the tournament.
+
+        Returns:
+            List[Dict[str, Any]]: The standings, best first.
+        """
+        saved_turns, results = self.writer.load_progress()
+        debates = self.schedule()
+        pending = [d for d in debates if d["debate_id"] not in results]
+        print(f"---- Tournament: {len(debates)} debates, {len(debates) - len(pending)} already finished ----")
+
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrent_debates)
+        new_results = await asyncio.gather(
+            *(self._run_debate(d, saved_turns[d["debate_id"]], semaphore) for d in pending)
+        )
+        finished = [result for result in new_results if result is not None]
+        for result in finished:
+            results[result["debate_id"]] = result
+        print(f"---- {len(finished)} of {len(pending)} debates finished in {time.perf_counter() - start:.2f}s ----\n")
+
+        scheduled_ids = {d["debate_id"] for d in debates}
+        standings = self.standings([r for r in results.values() if r["debate_id"] in scheduled_ids])
+        self.writer.write_standings(standings)
+        return standings
+
+    def standings(self, results):
+        """
+        Aggregates head-to-head results into a leaderboard.
+
+        Args:
+            results (List[Dict[str, Any]]): Judged debate results.
+
+        Returns:
+            List[Dict[str, Any]]: Per-model wins, losses and win rate, best first.
+        """
+        table = {d["model"]: {"model": d["model"], "wins": 0, "losses": 0, "undecided": 0}
+                 for d in self.debaters}
+        for result in results:
+            for side in SIDES:
+                row = table.setdefault(result[f"{side}_model"], {
+                    "model": result[f"{side}_model"], "wins": 0, "losses": 0, "undecided": 0})
+                if result["winner_side"] is None:
+                    row["undecided"] += 1
+                elif result["winner_side"] == side:
+                    row["wins"] += 1
+                else:
+                    row["losses"] += 1
+        for row in table.values():
+            played = row["wins"] + row["losses"]
+            row["win_rate"] = row["wins"] / played if played else 0.0
+        return sorted(table.values(), key=lambda r: (r["win_rate"], r["wins"]), reverse=True)
+
+
+async def main():
+    """
+    Runs a tournament from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Run an LLM debate tournament.")
+    parser.add_argument("--mock", action="store_true", help="Use the local mock provider.")
+    parser.add_argument("--rounds", type=int, default=TOURNAMENT_ROUNDS)
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENT_DEBATES)
+    parser.add_argument("--output-dir", default=TOURNAMENT_DIR)
+    args = parser.parse_args()
+
+    if args.mock:
+        register_mock_provider(default_latency=0.2)
+        debaters = [{"provider": "mock", "model": f"mock-{i}"} for i in range(4)]
+        judge = {"provider": "mock", "model": "mock-judge"}
+    else:
+        debaters = [
+            {"provider": "groq", "model": "llama3-8b-8192"},
+            {"provider": "openai", "model": "gpt-4o-mini"},
+            {"provider": "groq", "model": "llama3-70b-8192"},
+        ]
+        judge = {"provider": "openai", "model": "gpt-4o-mini"}
+
+    tournament = Tournament(
+        TOURNAMENT_TOPICS, debaters, judge,
+        rounds=args.rounds,
+        max_concurrent_debates=args.concurrency,
+        output_dir=args.output_dir,
+    )
+    try:
+        await tournament.run()
+    finally:
+        await close_clients()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
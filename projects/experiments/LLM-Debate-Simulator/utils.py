@@ -34,30 +34,44 @@ def format_markdown_output(debate_args, ranked_results):
         str: A formatted Markdown string.
     """
     from config import DEBATE_TOPIC
-    output = f"# 🤖 LLM Debate Simulation\n\n"
-    output += f"## Topic: *{DEBATE_TOPIC}*\n\n"
-    output += "---\n\n"
-    
-    output += "### 🏆 Judge's Final Ranking\n\n"
-    output += "| Rank | Debater | Stance | Model Used | Judge's Reasoning |\n"
-    output += "|:----:|:--------|:-------|:-----------|:------------------|\n"
-    
+    # Collect the parts and join once at the end to keep building linear in size
+    parts = [
+        f"# 🤖 LLM Debate Simulation\n\n",
+        f"## Topic: *{DEBATE_TOPIC}*\n\n",
+        "---\n\n",
+        "### 🏆 Judge's Final Ranking\n\n",
+        "| Rank | Debater | Stance | Model Used | Judge's Reasoning |\n",
+        "|:----:|:--------|:-------|:-----------|:------------------|\n",
+    ]
+
     ranking = sorted(ranked_results['ranking'], key=lambda x: x['rank'])
-    
+
     for item in ranking:
-        output += f"| **{item['rank']}** | {item['debater']} | {item['stance'].capitalize()} | `{item['model']}` | {item['reasoning']} |\n"
-        
-    output += "\n---\n\n"
-    
-    output += "### 💬 Full Arguments\n\n"
+        parts.append(f"| **{item['rank']}** | {item['debater']} | {item['stance'].capitalize()} | `{item['model']}` | {item['reasoning']} |\n")
+
+    parts.append("\n---\n\n")
+
+    parts.append("### 💬 Full Arguments\n\n")
     for debater_name, info in debate_args.items():
-        output += f"#### Argument from {debater_name} (`{info['stance']}` stance, using `{info['model']}`)\n"
-        # Perform the replacement outside the f-string for compatibility
-        formatted_argument = info['argument'].replace('\n', '\n> ')
-        # Now, use the new variable in the f-string
-        output += f"> {formatted_argument}\n\n"
-        
-    return output
+        parts.append(f"#### Argument from {debater_name} (`{info['stance']}` stance, using `{info['model']}`)\n")
+        parts.append(format_blockquote(info['argument']))
+
+    return "".join(parts)
+
+
+def format_blockquote(text):
+    """
+    Formats a block of text as a Markdown blockquote.
+
+    Args:
+        text (str): The text to quote.
+
+    Returns:
+        str: The quoted text followed by a blank line.
+    """
+    # Perform the replacement outside the f-string for compatibility
+    formatted_text = text.replace('\n', '\n> ')
+    return f"> {formatted_text}\n\n"
 
 def save_markdown_file(content, filepath):
     """
@@ -0,0 +1,87 @@
+"""
+Persistent store of per-article analyses, keyed by article hash.
+"""
+# /analysis_store.py
+
+import json
+import sqlite3
+import threading
+import time
+from config import ANALYSIS_STORE_PATH
+
+
+class ArticleAnalysisStore:
+    """
+    SQLite-backed memo of per-article sentiment and key points.
+
+    Also remembers which set of articles each topic's report was last built
+    from, so an unchanged topic can skip the aggregation call.
+    """
+
+    def __init__(self, path: str = ANALYSIS_STORE_PATH):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS article_analyses ("
+            "article_hash TEXT PRIMARY KEY, title TEXT, sentiment TEXT, score REAL, "
+            "key_points TEXT, analyzed_at REAL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS topic_reports ("
+            "topic TEXT PRIMARY KEY, articles_key TEXT, reported_at REAL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, article_hashes: list[str]) -> dict[str, dict]:
+        """
+        Returns the stored analyses for the given hashes.
+
+        Args:
+            article_hashes (list[str]): Article hashes to look up.
+
+        Returns:
+            dict[str, dict]: Analyses by hash; hashes never analyzed are absent.
+        """
+        found = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(article_hashes), 500):
+                chunk = article_hashes[start:start + 500]
+                rows = self._conn.execute(
+                    "SELECT article_hash, title, sentiment, score, key_points FROM article_analyses "
+                    f"WHERE article_hash IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                for article_hash, title, sentiment, score, key_points in rows:
+                    found[article_hash] = {"title": title, "sentiment": sentiment, "score": score,
+                                           "key_points": json.loads(key_points)}
+        return found
+
+    def put(self, article_hash: str, analysis: dict):
+        """
+        Stores (or replaces) the analysis of one article.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO article_analyses VALUES (?, ?, ?, ?, ?, ?)",
+                (article_hash, analysis.get("title"), analysis["sentiment"], analysis["score"],
+                 json.dumps(analysis["key_points"]), time.time()),
+            )
+            self._conn.commit()
+
+    def last_report_key(self, topic: str) -> str | None:
+        """
+        Returns the articles key of the topic's last saved report, if any.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT articles_key FROM topic_reports WHERE topic = ?",
+                                     (topic,)).fetchone()
+        return row[0] if row else None
+
+    def record_report(self, topic: str, articles_key: str):
+        """
+        Records that the topic's report was built from the given set of articles.
+        """
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO topic_reports VALUES (?, ?, ?)",
+                               (topic, articles_key, time.time()))
+            self._conn.commit()
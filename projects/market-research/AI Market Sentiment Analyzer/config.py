@@ -23,4 +23,22 @@ ANALYSIS_MODEL = "gpt-4o-mini"
 FINANCIAL_TOPIC = "NVIDIA"
 
 # Directory to save the output reports
-OUTPUT_DIR = "/output"
\ No newline at end of file
+OUTPUT_DIR = "/output"
+
+# --- News API Configuration ---
+# Override to point at a local fake NewsAPI server for testing
+NEWS_API_BASE_URL = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org/v2")
+HTTP_TIMEOUT_SECONDS = 10
+
+# --- Watchlist Configuration ---
+WATCHLIST = ["NVIDIA", "AMD", "Intel", "TSMC", "Microsoft", "Apple"]
+NEWS_PAGE_SIZE = 50       # NewsAPI allows up to 100 per page
+NEWS_MAX_PAGES = 3        # Pages fetched per topic
+NEWS_MAX_CONCURRENCY = 16 # Topics fetched at the same time
+NEWS_CACHE_DIR = ".news_cache"
+NEWS_CACHE_TTL_SECONDS = 3600
+
+# --- Incremental Analysis Configuration ---
+# Per-article analyses are stored here and reused across runs
+ANALYSIS_STORE_PATH = "analysis_store.sqlite"
+MAX_CONCURRENT_ANALYSES = 8
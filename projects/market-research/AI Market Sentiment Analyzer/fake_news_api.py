@@ -0,0 +1,127 @@
+"""
+A local fake of NewsAPI's /everything endpoint for testing the fetchers
+without an API key or network access.
+
+Usage:
+    python fake_news_api.py --port 8765
+    NEWS_API_BASE_URL=http://127.0.0.1:8765/v2 python main.py --watchlist NVIDIA AMD
+"""
+# /fake_news_api.py
+
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def make_articles(topic: str, total: int) -> list[dict]:
+    """
+    Generates deterministic articles for a topic. Every topic also gets the
+    same two market-wide stories, one of them under a topic-specific URL, so
+    both URL and content-hash deduplication are exercised.
+    """
+    articles = [
+        {
+            "title": f"{topic} headline {i}",
+            "url": f"https://news.example.com/{topic.lower()}/{i}",
+            "content": f"Story {i} about {topic}: shares moved on new guidance.",
+            "publishedAt": f"2024-01-01T00:{i % 60:02d}:00Z",
+        }
+        for i in range(max(0, total - 2))
+    ]
+    articles.append({
+        "title": "Markets rally on rate cut hopes",
+        "url": "https://news.example.com/markets/rally",
+        "content": "Stocks rose broadly as investors priced in lower rates.",
+        "publishedAt": "2024-01-01T01:00:00Z",
+    })
+    articles.append({
+        "title": "Chip sector outlook",
+        "url": f"https://mirror.example.com/{topic.lower()}/chips",
+        "content": "Analysts expect semiconductor demand to stay strong.",
+        "publishedAt": "2024-01-01T02:00:00Z",
+    })
+    return articles
+
+
+class FakeNewsAPI:
+    """
+    Threaded HTTP server imitating NewsAPI's paging, usable as a context manager.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, articles_per_topic: int = 25):
+        self.articles_per_topic = articles_per_topic
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                with fake._lock:
+                    fake.request_count += 1
+
+                if url.path != "/v2/everything":
+                    return self._send(404, {"status": "error", "message": "Not found."})
+                if not params.get("apiKey"):
+                    return self._send(401, {"status": "error", "message": "Missing API key."})
+
+                articles = make_articles(params.get("q", ""), fake.articles_per_topic)
+                page_size = int(params.get("pageSize", 100))
+                page = int(params.get("page", 1))
+                start = (page - 1) * page_size
+                self._send(200, {"status": "ok", "totalResults": len(articles),
+                                 "articles": articles[start:start + page_size]})
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a fake NewsAPI server.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--articles-per-topic", type=int, default=25)
+    args = parser.parse_args()
+
+    fake = FakeNewsAPI(port=args.port, articles_per_topic=args.articles_per_topic)
+    print(f"Fake NewsAPI listening on {fake.base_url}")
+    try:
+        fake.server.serve_forever()
+    except KeyboardInterrupt:
+        fake.stop()
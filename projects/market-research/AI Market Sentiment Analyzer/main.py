@@ -3,8 +3,10 @@ This script ties everything together and runs the agent.
 """
 
 # /main.py
-from config import FINANCIAL_TOPIC
-from news_fetcher import fetch_financial_news
+import argparse
+from config import FINANCIAL_TOPIC, WATCHLIST
+from news_fetcher import fetch_articles
+from watchlist_fetcher import fetch_watchlist
 from market_analyst_agent import MarketAnalystAgent
 
 def main():
@@ -15,19 +17,55 @@ def main():
 
     # 1. Fetch recent financial news
     print("📰 Fetching financial news...")
-    news_text = fetch_financial_news(FINANCIAL_TOPIC)
+    articles = fetch_articles(FINANCIAL_TOPIC)
     
-    if not news_text:
+    if not articles:
         print("Failed to fetch news. Exiting.")
         return
 
     print("✅ News fetched successfully.")
     
-    # 2. Initialize and run the agent
+    # 2. Initialize and run the agent; previously analyzed articles come from the store
     agent = MarketAnalystAgent()
-    agent.analyze(news_text, FINANCIAL_TOPIC)
+    agent.analyze_articles(articles, FINANCIAL_TOPIC)
+    print(f"Analysis stats: {agent.stats}")
     
     print("\n--- Financial Market Research Complete ---")
 
+def run_watchlist(topics):
+    """
+    Fetches news for every watchlist topic concurrently, then runs the agent per topic.
+
+    Articles shared between topics or seen in earlier runs are analyzed only once.
+
+    Args:
+        topics (list[str]): Topics or tickers to research.
+    """
+    print(f"--- Starting Watchlist Research for {len(topics)} topics ---")
+
+    print("📰 Fetching news for the watchlist...")
+    result = fetch_watchlist(topics)
+    print(f"✅ Fetch stats: {result['stats']}")
+
+    # Analyze every new article of the whole watchlist in one parallel pass
+    agent = MarketAnalystAgent()
+    agent.update_analyses(list(result["articles"].values()))
+    for topic, hashes in result["by_topic"].items():
+        if not hashes:
+            print(f"No articles found for {topic}. Skipping.")
+            continue
+        agent.analyze_articles([result["articles"][h] for h in hashes], topic)
+    print(f"Analysis stats: {agent.stats}")
+
+    print("\n--- Watchlist Research Complete ---")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Financial market research agent.")
+    parser.add_argument("--watchlist", nargs="*", metavar="TOPIC",
+                        help="Research several topics; defaults to WATCHLIST in config.py")
+    args = parser.parse_args()
+
+    if args.watchlist is not None:
+        run_watchlist(args.watchlist or WATCHLIST)
+    else:
+        main()
@@ -3,24 +3,36 @@ This is the core orchestrator for the agent.
 """
 # /market_analyst_agent.py
 
+import asyncio
+import hashlib
 import openai
 import json
-from config import OPENAI_API_KEY, ANALYSIS_MODEL
-from prompts import get_system_prompt
+from collections import Counter
+from config import OPENAI_API_KEY, ANALYSIS_MODEL, MAX_CONCURRENT_ANALYSES
+from analysis_store import ArticleAnalysisStore
+from prompts import get_system_prompt, get_article_analysis_prompt, get_aggregation_prompt
 from tools import get_tool_definitions, AVAILABLE_TOOLS
+from watchlist_fetcher import article_hash
+
+SENTIMENTS = ("Positive", "Negative", "Neutral")
 
 class MarketAnalystAgent:
     """
     An agent that analyzes website content and uses tools to report findings.
     """
-    def __init__(self):
+    def __init__(self, store: ArticleAnalysisStore | None = None):
         self.client = openai.OpenAI(api_key=OPENAI_API_KEY)
+        self.store = store or ArticleAnalysisStore()
+        self.stats = {"lookups": 0, "store_hits": 0, "analyzed": 0, "failed": 0, "reports_skipped": 0}
 
-    def analyze(self, news_content: str, topic: str):
+    def analyze(self, news_content: str, topic: str, system_prompt: str | None = None):
         """
         Performs analysis on the news content and handles tool calls.
+
+        Returns:
+            bool: True if the model called a tool.
         """
-        system_prompt = get_system_prompt(topic)
+        system_prompt = system_prompt or get_system_prompt(topic)
         tool_definitions = get_tool_definitions()
         
         print("🤖 Agent: Analyzing news content and formulating strategy...")
@@ -40,9 +52,118 @@ class MarketAnalystAgent:
         
         if response_message.tool_calls:
             self._handle_tool_calls(response_message.tool_calls)
-        else:
-            print("🤖 Agent: The model did not use any tools. Here is the response:")
-            print(response_message.content)
+            return True
+        print("🤖 Agent: The model did not use any tools. Here is the response:")
+        print(response_message.content)
+        return False
+
+    async def _analyze_article(self, client: openai.AsyncOpenAI, semaphore: asyncio.Semaphore,
+                               article: dict) -> dict | None:
+        """
+        Analyzes one article, returning its sentiment, score and key points or None on failure.
+        """
+        title = article.get("title") or "No Title"
+        content = article.get("content") or article.get("description") or "No content available."
+        async with semaphore:
+            try:
+                response = await client.chat.completions.create(
+                    model=ANALYSIS_MODEL,
+                    messages=[
+                        {"role": "system", "content": get_article_analysis_prompt()},
+                        {"role": "user", "content": f"{title}\n\n{content}"}
+                    ],
+                    response_format={"type": "json_object"}
+                )
+                result = json.loads(response.choices[0].message.content)
+                sentiment = str(result["sentiment"]).capitalize()
+                if sentiment not in SENTIMENTS:
+                    raise ValueError(f"unknown sentiment {result['sentiment']!r}")
+                return {"title": title, "sentiment": sentiment,
+                        "score": max(-1.0, min(1.0, float(result.get("score", 0.0)))),
+                        "key_points": [str(point) for point in result.get("key_points", [])][:3]}
+            except (openai.OpenAIError, KeyError, TypeError, ValueError) as e:
+                print(f"Error analyzing article '{title}': {e}")
+                return None
+
+    async def _analyze_new_articles(self, new_articles: dict[str, dict]) -> dict[str, dict]:
+        """
+        Analyzes articles concurrently and stores each successful result.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+        hashes = list(new_articles)
+        # One client per event loop, so its connection pool is not reused across asyncio.run() calls
+        async with openai.AsyncOpenAI(api_key=OPENAI_API_KEY) as client:
+            results = await asyncio.gather(*(self._analyze_article(client, semaphore, new_articles[h])
+                                             for h in hashes))
+        analyzed = {}
+        for digest, analysis in zip(hashes, results):
+            if analysis is None:
+                self.stats["failed"] += 1
+                continue
+            self.store.put(digest, analysis)
+            analyzed[digest] = analysis
+        self.stats["analyzed"] += len(analyzed)
+        return analyzed
+
+    def update_analyses(self, articles: list[dict]) -> dict[str, dict]:
+        """
+        Returns per-article analyses, sending only articles missing from the store to the model.
+
+        Args:
+            articles (list[dict]): NewsAPI article objects.
+
+        Returns:
+            dict[str, dict]: Analyses by article hash (articles that failed are absent).
+        """
+        by_hash = {}
+        for article in articles:
+            by_hash.setdefault(article_hash(article), article)
+        analyses = self.store.get_many(list(by_hash))
+        new_articles = {h: a for h, a in by_hash.items() if h not in analyses}
+        self.stats["lookups"] += len(by_hash)
+        self.stats["store_hits"] += len(analyses)
+
+        if new_articles:
+            print(f"🤖 Agent: Analyzing {len(new_articles)} new of {len(by_hash)} articles...")
+            analyses.update(asyncio.run(self._analyze_new_articles(new_articles)))
+        # Keep the articles' original (newest first) order
+        return {h: analyses[h] for h in by_hash if h in analyses}
+
+    def analyze_articles(self, articles: list[dict], topic: str, force: bool = False):
+        """
+        Incrementally analyzes articles and saves a report aggregated from per-article results.
+
+        Only articles missing from the store are sent to the model (in parallel);
+        the report is then built from the stored analyses. If the topic's last
+        report was built from exactly the same articles, nothing is sent at all.
+
+        Args:
+            articles (list[dict]): NewsAPI article objects.
+            topic (str): The topic or ticker the articles are about.
+            force (bool): Rebuild the report even if its articles are unchanged.
+        """
+        analyses = self.update_analyses(articles)
+        if not analyses:
+            print(f"No analyzed articles for {topic}. Skipping report.")
+            return
+
+        articles_key = hashlib.sha256("".join(sorted(analyses)).encode("utf-8")).hexdigest()
+        if not force and self.store.last_report_key(topic) == articles_key:
+            print(f"🤖 Agent: No new articles for {topic}; the saved report is up to date.")
+            self.stats["reports_skipped"] += 1
+            return
+
+        # One line per article from the stored analyses; no raw article text is resent
+        counts = Counter(analysis["sentiment"] for analysis in analyses.values())
+        digest = "\n".join(
+            f"- [{a['sentiment']} {a['score']:+.2f}] {a['title']}: {'; '.join(a['key_points'])}"
+            for a in analyses.values()
+        )
+        summary = ", ".join(f"{label}: {counts.get(label, 0)}" for label in SENTIMENTS)
+        news_content = f"{digest}\n\nSentiment counts ({len(analyses)} articles): {summary}"
+
+        if self.analyze(news_content, topic, system_prompt=get_aggregation_prompt(topic)):
+            self.store.record_report(topic, articles_key)
 
     def _handle_tool_calls(self, tool_calls):
         """
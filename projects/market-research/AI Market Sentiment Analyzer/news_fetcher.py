@@ -3,29 +3,51 @@ website text.
 """
 # /news_fetcher.py
 import requests
-from config import NEWS_API_KEY
+from config import NEWS_API_KEY, NEWS_API_BASE_URL, HTTP_TIMEOUT_SECONDS
 
-def fetch_financial_news(query: str, num_articles: int = 10) -> str | None:
+# Reuse one connection pool across calls
+_session = requests.Session()
+
+
+def format_articles(articles: list[dict]) -> str:
     """
-    Fetches and concatenates the content of recent financial news articles.
+    Formats articles into a single text block for the model.
+
+    Args:
+        articles (list[dict]): NewsAPI article objects.
+
+    Returns:
+        str: One section per article with its title and content.
+    """
+    return "\n\n".join(
+        f"--- Article {i+1}: {article.get('title') or 'No Title'} ---\n"
+        f"{article.get('content') or 'No content available.'}"
+        for i, article in enumerate(articles)
+    )
+
+
+def fetch_articles(query: str, num_articles: int = 10) -> list[dict] | None:
+    """
+    Fetches recent financial news articles.
 
     Args:
         query (str): The company, stock ticker, or topic to search for.
         num_articles (int): The number of articles to fetch.
 
     Returns:
-        str | None: A single string containing the content of all articles,
-                    or None if an error occurs.
+        list[dict] | None: NewsAPI article objects, or None if an error occurs.
     """
-    url = (f"https://newsapi.org/v2/everything?"
-           f"q={query}&"
-           f"language=en&"
-           f"sortBy=publishedAt&"
-           f"pageSize={num_articles}&"
-           f"apiKey={NEWS_API_KEY}")
-    
+    params = {
+        "q": query,
+        "language": "en",
+        "sortBy": "publishedAt",
+        "pageSize": num_articles,
+        "apiKey": NEWS_API_KEY,
+    }
+
     try:
-        response = requests.get(url)
+        response = _session.get(f"{NEWS_API_BASE_URL}/everything", params=params,
+                                timeout=HTTP_TIMEOUT_SECONDS)
         response.raise_for_status()
         data = response.json()
 
@@ -33,15 +55,25 @@ def fetch_financial_news(query: str, num_articles: int = 10) -> str | None:
             print(f"Error from NewsAPI: {data.get('message', 'No articles found.')}")
             return None
 
-        # Concatenate content from all articles into one text block
-        all_content = ""
-        for i, article in enumerate(data["articles"]):
-            title = article.get('title', 'No Title')
-            content = article.get('content', 'No content available.')
-            all_content += f"--- Article {i+1}: {title} ---\n{content}\n\n"
-        
-        return all_content.strip()
+        return data["articles"]
 
     except requests.RequestException as e:
         print(f"Error fetching news: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def fetch_financial_news(query: str, num_articles: int = 10) -> str | None:
+    """
+    Fetches and concatenates the content of recent financial news articles.
+
+    Args:
+        query (str): The company, stock ticker, or topic to search for.
+        num_articles (int): The number of articles to fetch.
+
+    Returns:
+        str | None: A single string containing the content of all articles,
+                    or None if an error occurs.
+    """
+    articles = fetch_articles(query, num_articles)
+    # Concatenate content from all articles into one text block
+    return format_articles(articles) if articles else None
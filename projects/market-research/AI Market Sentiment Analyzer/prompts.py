@@ -13,4 +13,32 @@ You are an expert Financial Analyst AI. Your goal is to analyze the provided rec
 3.  **Identify Key Themes**: Summarize the 2-3 most important themes or events discussed in the articles (e.g., product launches, earnings reports, regulatory changes, macroeconomic factors).
 4.  **Formulate an Investment Thesis**: Based on your analysis, provide a brief, high-level investment thesis. This should be a short paragraph explaining a potential investment outlook.
 5.  **Use Tools to Save Your Findings**: You MUST use the `save_market_insights` tool to save your complete analysis, including the sentiment, key themes, and investment thesis.
-"""
\ No newline at end of file
+"""
+
+def get_article_analysis_prompt() -> str:
+    """
+    Generates the system prompt for analyzing a single news article.
+    """
+    return """
+You are an expert Financial Analyst AI. Analyze the single news article provided by the user.
+
+Respond ONLY with a JSON object of this form:
+{"sentiment": "Positive" | "Negative" | "Neutral", "score": <number from -1.0 (very negative) to 1.0 (very positive)>, "key_points": [<1-3 short strings with the market-relevant facts>]}
+"""
+
+
+def get_aggregation_prompt(topic: str) -> str:
+    """
+    Generates the system prompt for building the report on **topic** from per-article analyses.
+    """
+    return f"""
+You are an expert Financial Analyst AI. Your goal is to generate a concise market sentiment report and investment thesis about **{topic}**.
+
+You are given pre-computed analyses of recent news articles, one per line, each with its sentiment, score and key points, followed by the overall sentiment counts.
+
+**Your Task:**
+1.  **Determine Market Sentiment**: Using the per-article sentiments and scores, classify the overall market sentiment as **Positive**, **Negative**, or **Neutral**.
+2.  **Identify Key Themes**: Summarize the 2-3 most important themes or events across the articles (e.g., product launches, earnings reports, regulatory changes, macroeconomic factors).
+3.  **Formulate an Investment Thesis**: Provide a brief, high-level investment thesis. This should be a short paragraph explaining a potential investment outlook.
+4.  **Use Tools to Save Your Findings**: You MUST use the `save_market_insights` tool to save your complete analysis, including the sentiment, key themes, and investment thesis.
+"""
@@ -0,0 +1,207 @@
+"""
+Fetches news for a whole watchlist of topics concurrently.
+"""
+# /watchlist_fetcher.py
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+
+import httpx
+from config import (NEWS_API_KEY, NEWS_API_BASE_URL, HTTP_TIMEOUT_SECONDS,
+                    NEWS_PAGE_SIZE, NEWS_MAX_PAGES, NEWS_MAX_CONCURRENCY,
+                    NEWS_CACHE_DIR, NEWS_CACHE_TTL_SECONDS)
+
+
+def article_hash(article: dict) -> str:
+    """
+    Hashes an article's normalized title and content, so syndicated copies
+    of the same story under different URLs get the same hash.
+
+    Args:
+        article (dict): A NewsAPI article object.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    text = f"{article.get('title') or ''}\n{article.get('content') or ''}"
+    normalized = re.sub(r"\s+", " ", text).strip().lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class TopicCache:
+    """
+    On-disk cache of fetched articles per topic with a time-to-live.
+    """
+
+    def __init__(self, cache_dir: str = NEWS_CACHE_DIR, ttl_seconds: float = NEWS_CACHE_TTL_SECONDS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, topic: str) -> str:
+        key = hashlib.sha256(topic.strip().lower().encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, topic: str) -> list[dict] | None:
+        """
+        Returns the cached articles for a topic, or None if missing or expired.
+        """
+        try:
+            with open(self._path(topic), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry["fetched_at"] > self.ttl_seconds:
+            return None
+        return entry["articles"]
+
+    def put(self, topic: str, articles: list[dict]):
+        """
+        Stores the articles for a topic, replacing any previous entry.
+        """
+        path = self._path(topic)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"topic": topic, "fetched_at": time.time(), "articles": articles}, f)
+        os.replace(tmp_path, path)
+
+
+class WatchlistFetcher:
+    """
+    Fetches every topic of a watchlist over one pooled async HTTP client.
+
+    Each topic is paged through NewsAPI's /everything endpoint, results are
+    served from the TTL cache when fresh, and articles are deduplicated across
+    topics by URL and by content hash.
+    """
+
+    def __init__(self, api_key: str = NEWS_API_KEY, base_url: str = NEWS_API_BASE_URL,
+                 page_size: int = NEWS_PAGE_SIZE, max_pages: int = NEWS_MAX_PAGES,
+                 max_concurrency: int = NEWS_MAX_CONCURRENCY, cache: TopicCache | None = None,
+                 timeout: float = HTTP_TIMEOUT_SECONDS):
+        """
+        Args:
+            api_key (str): NewsAPI key.
+            base_url (str): API root; point it at a local fake server for testing.
+            page_size (int): Articles requested per page.
+            max_pages (int): Maximum pages fetched per topic.
+            max_concurrency (int): Maximum requests in flight at once.
+            cache (TopicCache): Topic cache; a default one is created if omitted.
+            timeout (float): Per-request timeout in seconds.
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_concurrency = max_concurrency
+        self.cache = cache or TopicCache()
+        self.timeout = timeout
+        self.stats = {"topics": 0, "cache_hits": 0, "api_calls": 0, "failed_topics": 0,
+                      "articles": 0, "duplicates": 0}
+
+    async def _fetch_topic(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                           topic: str) -> list[dict] | None:
+        """
+        Fetches all pages for one topic, using the cache when it is fresh.
+
+        Returns:
+            list[dict] | None: The topic's articles, or None if the request failed.
+        """
+        cached = self.cache.get(topic)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return cached
+
+        articles = []
+        for page in range(1, self.max_pages + 1):
+            params = {
+                "q": topic,
+                "language": "en",
+                "sortBy": "publishedAt",
+                "pageSize": self.page_size,
+                "page": page,
+                "apiKey": self.api_key,
+            }
+            try:
+                async with semaphore:
+                    self.stats["api_calls"] += 1
+                    response = await client.get(f"{self.base_url}/everything", params=params)
+                response.raise_for_status()
+                data = response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                print(f"Error fetching news for '{topic}' (page {page}): {e}")
+                self.stats["failed_topics"] += 1
+                return None
+
+            if data.get("status") != "ok":
+                print(f"Error from NewsAPI for '{topic}': {data.get('message', 'Unknown error.')}")
+                self.stats["failed_topics"] += 1
+                return None
+
+            batch = data.get("articles") or []
+            articles.extend(batch)
+            if len(batch) < self.page_size or len(articles) >= data.get("totalResults", 0):
+                break
+
+        self.cache.put(topic, articles)
+        return articles
+
+    async def fetch(self, topics: list[str]) -> dict:
+        """
+        Fetches news for every topic concurrently.
+
+        Args:
+            topics (list[str]): Watchlist topics or tickers.
+
+        Returns:
+            dict: "articles" maps article hash to article (each stored once);
+                  "by_topic" maps each topic to the hashes of its articles.
+        """
+        limits = httpx.Limits(max_connections=self.max_concurrency,
+                              max_keepalive_connections=self.max_concurrency)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits) as client:
+            results = await asyncio.gather(*(self._fetch_topic(client, semaphore, topic) for topic in topics))
+
+        articles, by_topic, hash_by_url = {}, {}, {}
+        for topic, topic_articles in zip(topics, results):
+            self.stats["topics"] += 1
+            if topic_articles is None:
+                continue
+            hashes = []
+            for article in topic_articles:
+                url = article.get("url")
+                digest = hash_by_url.get(url) or article_hash(article)
+                if digest in articles:
+                    self.stats["duplicates"] += 1
+                else:
+                    articles[digest] = article
+                if url:
+                    hash_by_url[url] = digest
+                if digest not in hashes:
+                    hashes.append(digest)
+            by_topic[topic] = hashes
+
+        self.stats["articles"] = len(articles)
+        return {"articles": articles, "by_topic": by_topic}
+
+
+def fetch_watchlist(topics: list[str], **kwargs) -> dict:
+    """
+    Synchronous wrapper around WatchlistFetcher.fetch().
+
+    Args:
+        topics (list[str]): Watchlist topics or tickers.
+        **kwargs: Passed to WatchlistFetcher.
+
+    Returns:
+        dict: The fetch result, with the run statistics under "stats".
+    """
+    fetcher = WatchlistFetcher(**kwargs)
+    result = asyncio.run(fetcher.fetch(topics))
+    result["stats"] = fetcher.stats
+    return result
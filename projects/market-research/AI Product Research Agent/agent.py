@@ -1,6 +1,18 @@
-import tools
+import asyncio
+import re
+import time
+import async_tools
+import config
+from email_delivery import shutdown_mailer
 from report_generator import create_html_report, send_report_by_email
 
+def report_file_name(product_idea: str) -> str:
+    """
+    Builds a per-idea report file name, so batch runs do not overwrite each other.
+    """
+    slug = re.sub(r"[^a-z0-9]+", "_", product_idea.lower()).strip("_")[:60]
+    return f"product_research_report_{slug}.html"
+
 class ProductResearchAgent:
     """
     An agent that orchestrates the product research process using live, online tools.
@@ -12,35 +24,92 @@ class ProductResearchAgent:
         """
         Executes the entire research workflow using online tools.
         """
+        asyncio.run(self.run_async(product_idea, report_file="product_research_report.html"))
+        shutdown_mailer()
+
+    async def run_async(self, product_idea: str, report_file: str | None = None,
+                        clients: async_tools.AsyncClients | None = None) -> dict:
+        """
+        Executes the research workflow, running the independent steps concurrently.
+
+        `clients` are shared with other ideas researched on the same event loop; without
+        them, clients are created for this run and closed when it ends.
+
+        Returns:
+            A summary with the report file path and the step timings in seconds.
+        """
+        if clients is None:
+            async with async_tools.AsyncClients() as clients:
+                return await self.run_async(product_idea, report_file, clients)
+
         print(f"\n🚀 Starting LIVE research for idea: '{product_idea}'")
+        start = time.perf_counter()
 
-        # Step 1: Define Research Questions using an LLM
-        print("\nStep 1: Defining research questions...")
-        research_questions = tools.define_research_questions(product_idea)
+        # Steps 1 & 2: Research questions and competitor analysis do not depend on each other
+        print("\nSteps 1 & 2: Defining research questions and analyzing competitors concurrently...")
+        research_questions, competitor_analysis = await asyncio.gather(
+            async_tools.define_research_questions(clients, product_idea),
+            async_tools.analyze_competitors(clients, product_idea)
+        )
+        research_done = time.perf_counter()
         print("✅ Research questions defined.")
         print(f"Generated Questions:\n{research_questions}\n")
-
-
-        # Step 2: Analyze Competitors using Web Search and LLM
-        print("\nStep 2: Analyzing competitors...")
-        competitor_analysis = tools.analyze_competitors(product_idea)
         print("✅ Competitor analysis complete.")
         print(f"Generated Analysis:\n{competitor_analysis}\n")
 
 
         # Step 3: Generate Final Report using an LLM
         print("\nStep 3: Generating final report and recommendations...")
-        final_report_content = tools.generate_product_report(
+        final_report_content = await async_tools.generate_product_report(
+            clients,
             product_idea,
             research_questions,
             competitor_analysis
         )
+        report_done = time.perf_counter()
         print("✅ Final report generated.")
 
 
-        # Step 4: Create and Send Report
+        # Step 4: Create and Send Report (blocking I/O, kept off the event loop)
         print("\nStep 4: Creating HTML report and sending email...")
-        report_file = create_html_report(final_report_content, product_idea)
-        send_report_by_email(report_file, product_idea)
-        
-        print("\n🏁 Research process finished successfully!")
\ No newline at end of file
+        report_file = await asyncio.to_thread(
+            create_html_report, final_report_content, product_idea,
+            report_file or report_file_name(product_idea)
+        )
+        await asyncio.to_thread(send_report_by_email, report_file, product_idea)
+
+        timings = {
+            "research_s": round(research_done - start, 2),
+            "report_s": round(report_done - research_done, 2),
+            "total_s": round(time.perf_counter() - start, 2),
+        }
+        print(f"\n🏁 Research process finished successfully! Timings: {timings}")
+        return {"product_idea": product_idea, "report_file": report_file, "timings": timings}
+
+    async def run_batch(self, product_ideas: list[str], max_concurrency: int = config.MAX_CONCURRENT_IDEAS) -> list[dict]:
+        """
+        Researches several product ideas in parallel, at most `max_concurrency` at a time.
+
+        A failing idea is reported and does not stop the others.
+
+        Returns:
+            One summary per idea, in input order; failed ideas carry an "error" key.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def research(clients: async_tools.AsyncClients, product_idea: str) -> dict:
+            async with semaphore:
+                try:
+                    return await self.run_async(product_idea, clients=clients)
+                except Exception as e:
+                    print(f"An error occurred while researching '{product_idea}': {e}")
+                    return {"product_idea": product_idea, "error": str(e)}
+
+        start = time.perf_counter()
+        async with async_tools.AsyncClients() as clients:
+            results = await asyncio.gather(*(research(clients, idea) for idea in product_ideas))
+        print(f"\n🏁 Researched {len(product_ideas)} ideas in {time.perf_counter() - start:.1f}s")
+        delivery = await asyncio.to_thread(shutdown_mailer)
+        if delivery:
+            print(f"📧 Email delivery: {delivery}")
+        return results
@@ -0,0 +1,72 @@
+import config
+from openai import AsyncOpenAI
+from tavily import AsyncTavilyClient
+from tools import (research_questions_messages, competitor_search_query,
+                   competitor_analysis_messages, product_report_messages)
+from search_context import search_cache, compact_context
+
+class AsyncClients:
+    """
+    OpenAI and Tavily clients shared by the concurrent tool calls of one event loop.
+
+    Their connection pools are bound to the loop that creates them, so create them
+    inside the coroutine that makes the calls and close them before that loop ends:
+    `async with AsyncClients() as clients: ...`
+    """
+    def __init__(self):
+        self.openai = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+        self.tavily = AsyncTavilyClient(api_key=config.TAVILY_API_KEY)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.openai.close()
+        await self.tavily.close()
+
+async def define_research_questions(clients: AsyncClients, product_idea: str) -> str:
+    """
+    Async version of tools.define_research_questions.
+    """
+    print(f"Tool Executed: define_research_questions (Async) for '{product_idea}'")
+
+    response = await clients.openai.chat.completions.create(
+        model="gpt-4o",
+        messages=research_questions_messages(product_idea)
+    )
+    return response.choices[0].message.content
+
+async def analyze_competitors(clients: AsyncClients, product_idea: str) -> str:
+    """
+    Async version of tools.analyze_competitors.
+    """
+    print(f"Tool Executed: analyze_competitors (Async) for '{product_idea}'")
+
+    search_query = competitor_search_query(product_idea)
+    search_results = search_cache.get(search_query, "advanced")
+    if search_results is None:
+        search_results = await clients.tavily.search(query=search_query, search_depth="advanced")
+        search_cache.put(search_query, "advanced", search_results)
+
+    context, stats = compact_context(search_results['results'], product_idea)
+    print(f"--> Context compacted for '{product_idea}': {stats}")
+
+    response = await clients.openai.chat.completions.create(
+        model="gpt-4o",
+        messages=competitor_analysis_messages(product_idea, context)
+    )
+    return response.choices[0].message.content
+
+async def generate_product_report(clients: AsyncClients, product_idea: str, research_questions: str,
+                                  competitor_analysis: str) -> str:
+    """
+    Async version of tools.generate_product_report.
+    """
+    print(f"Tool Executed: generate_product_report (Async) for '{product_idea}'")
+
+    response = await clients.openai.chat.completions.create(
+        model="gpt-4o",
+        messages=product_report_messages(product_idea, research_questions, competitor_analysis),
+        temperature=0.7
+    )
+    return response.choices[0].message.content
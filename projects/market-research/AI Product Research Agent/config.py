@@ -11,7 +11,27 @@ TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 SENDER_EMAIL = os.getenv("SENDER_EMAIL")
 SENDER_PASSWORD = os.getenv("SENDER_PASSWORD")
 RECIPIENT_EMAIL = os.getenv("RECIPIENT_EMAIL")
+# Gmail by default; point at a local aiosmtpd server (SMTP_USE_TLS=0) for testing
+SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "1") == "1"
+# Number of persistent SMTP connections used to deliver queued reports
+SMTP_POOL_SIZE = 2
+# Longest time to wait for one report to be delivered
+SMTP_SEND_TIMEOUT_SECONDS = 120
 
 # --- Validation ---
 if not OPENAI_API_KEY or not TAVILY_API_KEY:
-    raise ValueError("API keys for OpenAI and Tavily must be set in the .env file.")
\ No newline at end of file
+    raise ValueError("API keys for OpenAI and Tavily must be set in the .env file.")
+
+# --- Batch Configuration ---
+# Maximum number of product ideas researched at the same time in batch mode
+MAX_CONCURRENT_IDEAS = 4
+
+# --- Search Cache & Context Configuration ---
+SEARCH_CACHE_PATH = "search_cache.sqlite"
+SEARCH_CACHE_TTL_SECONDS = 24 * 3600
+# Approximate token budget for the competitor search context sent to the model
+CONTEXT_TOKEN_BUDGET = 1500
+# Snippets at least this similar (shingle Jaccard) are treated as duplicates
+DEDUP_SIMILARITY = 0.6
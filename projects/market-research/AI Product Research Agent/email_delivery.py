@@ -0,0 +1,260 @@
+import base64
+import mimetypes
+import os
+import queue
+import smtplib
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from email.header import Header
+from email.utils import formatdate, make_msgid
+import config
+
+# 57 raw bytes encode to one 76-character base64 line; read the attachment in multiples of it
+ATTACHMENT_CHUNK_BYTES = 57 * 1024
+
+class SMTPConnection:
+    """
+    A persistent SMTP connection that does STARTTLS and login once and reconnects when dropped.
+    """
+    def __init__(self, host: str, port: int, use_tls: bool, username: str | None, password: str | None):
+        self.host = host
+        self.port = port
+        self.use_tls = use_tls
+        self.username = username
+        self.password = password
+        self.server = None
+        self.connects = 0
+
+    def _connect(self):
+        self.server = smtplib.SMTP(self.host, self.port, timeout=30)
+        self.server.ehlo()
+        if self.use_tls:
+            self.server.starttls()
+            # STARTTLS discards the ESMTP features; ask for them again over the encrypted channel
+            self.server.ehlo()
+        if self.password:
+            self.server.login(self.username, self.password)
+        self.connects += 1
+
+    def ensure(self) -> smtplib.SMTP:
+        """
+        Returns a live connection, reconnecting if the server closed the previous one.
+        """
+        if self.server is not None:
+            try:
+                if self.server.noop()[0] == 250:
+                    return self.server
+            except smtplib.SMTPException:
+                pass
+            self.close()
+        self._connect()
+        return self.server
+
+    def close(self):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.server = None
+
+def _dot_stuff(text: str) -> str:
+    """
+    Escapes lines starting with '.' and normalizes line endings for the SMTP DATA phase.
+    """
+    return "\r\n".join(("." + line) if line.startswith(".") else line for line in text.splitlines())
+
+def send_streaming(server: smtplib.SMTP, sender: str, recipient: str, subject: str, body: str, file_path: str):
+    """
+    Sends a plain-text message with one file attachment, streaming the attachment from disk.
+
+    The MIME message is written straight into the SMTP DATA phase and the
+    attachment is base64-encoded chunk by chunk, so it is never held in memory
+    as a whole.
+    """
+    boundary = f"=={uuid.uuid4().hex}"
+    # RFC 2047-encode the subject so non-ASCII product ideas survive, and keep it on one line
+    subject = Header(" ".join(subject.split()), "utf-8").encode()
+    file_name = os.path.basename(file_path)
+    content_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+
+    server.ehlo_or_helo_if_needed()
+    code, response = server.mail(sender)
+    if code != 250:
+        raise smtplib.SMTPSenderRefused(code, response, sender)
+    code, response = server.rcpt(recipient)
+    if code not in (250, 251):
+        raise smtplib.SMTPRecipientsRefused({recipient: (code, response)})
+    code, response = server.docmd("DATA")
+    if code != 354:
+        raise smtplib.SMTPDataError(code, response)
+
+    header = (
+        f"From: {sender}\r\nTo: {recipient}\r\nSubject: {subject}\r\n"
+        f"Date: {formatdate(localtime=True)}\r\nMessage-ID: {make_msgid()}\r\n"
+        f"MIME-Version: 1.0\r\nContent-Type: multipart/mixed; boundary=\"{boundary}\"\r\n\r\n"
+        f"--{boundary}\r\nContent-Type: text/plain; charset=\"utf-8\"\r\nContent-Transfer-Encoding: 8bit\r\n\r\n"
+        f"{_dot_stuff(body)}\r\n"
+        f"--{boundary}\r\nContent-Type: {content_type}\r\nContent-Transfer-Encoding: base64\r\n"
+        f"Content-Disposition: attachment; filename=\"{file_name}\"\r\n\r\n"
+    )
+    server.send(header.encode("utf-8"))
+    # base64 lines never start with '.', so the attachment needs no dot-stuffing
+    with open(file_path, "rb") as attachment:
+        while chunk := attachment.read(ATTACHMENT_CHUNK_BYTES):
+            encoded = base64.b64encode(chunk)
+            server.send(b"\r\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76)) + b"\r\n")
+    server.send(f"--{boundary}--\r\n.\r\n".encode("ascii"))
+
+    code, response = server.getreply()
+    if code != 250:
+        raise smtplib.SMTPDataError(code, response)
+
+class ReportMailer:
+    """
+    Queue-based report delivery over a pool of persistent SMTP connections.
+
+    Each of `pool_size` worker threads owns one connection and sends queued
+    reports over it, so the connect/STARTTLS/login handshake is paid once per
+    connection instead of once per report.
+    """
+    def __init__(self, host: str = config.SMTP_HOST, port: int = config.SMTP_PORT,
+                 use_tls: bool = config.SMTP_USE_TLS, pool_size: int = config.SMTP_POOL_SIZE,
+                 sender: str | None = config.SENDER_EMAIL, password: str | None = config.SENDER_PASSWORD):
+        self.sender = sender
+        self.connections = [SMTPConnection(host, port, use_tls, sender, password) for _ in range(pool_size)]
+        self._queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self.stats = {"sent": 0, "failed": 0, "send_seconds": 0.0}
+        self._started = None
+        self._workers = [threading.Thread(target=self._work, args=(connection,), daemon=True)
+                         for connection in self.connections]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, file_path: str, product_idea: str, recipient: str | None = None) -> Future:
+        """
+        Queues a report for delivery.
+
+        Returns:
+            A future that resolves once the report was sent (or raises the delivery error).
+        """
+        future = Future()
+        if self._started is None:
+            self._started = time.perf_counter()
+        self._queue.put((file_path, product_idea, recipient or config.RECIPIENT_EMAIL, future))
+        return future
+
+    def _work(self, connection: SMTPConnection):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                connection.close()
+                return
+            file_path, product_idea, recipient, future = job
+            start = time.perf_counter()
+            try:
+                self._deliver(connection, file_path, product_idea, recipient)
+            except Exception as e:
+                # Any failure must resolve the future, or the submitter waits forever.
+                # The connection may be unusable now; the next job reconnects
+                connection.close()
+                with self._stats_lock:
+                    self.stats["failed"] += 1
+                future.set_exception(e)
+            else:
+                with self._stats_lock:
+                    self.stats["sent"] += 1
+                    self.stats["send_seconds"] += time.perf_counter() - start
+                future.set_result(recipient)
+
+    def _deliver(self, connection: SMTPConnection, file_path: str, product_idea: str, recipient: str):
+        subject = f"AI Product Research Report: {product_idea}"
+        body = f"Please find the attached research report for the product idea: '{product_idea}'."
+        try:
+            send_streaming(connection.ensure(), self.sender, recipient, subject, body, file_path)
+        except smtplib.SMTPServerDisconnected:
+            # Idle connections get dropped by the server; retry once on a fresh one
+            connection.close()
+            send_streaming(connection.ensure(), self.sender, recipient, subject, body, file_path)
+
+    def report(self) -> dict:
+        """
+        Returns delivery statistics, including throughput since the first submission.
+        """
+        elapsed = time.perf_counter() - self._started if self._started else 0.0
+        with self._stats_lock:
+            return {
+                "sent": self.stats["sent"],
+                "failed": self.stats["failed"],
+                "connections_opened": sum(connection.connects for connection in self.connections),
+                "elapsed_s": round(elapsed, 2),
+                "emails_per_sec": round(self.stats["sent"] / elapsed, 1) if elapsed else 0.0,
+            }
+
+    def close(self):
+        """
+        Sends everything still queued, then closes all connections.
+        """
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+
+_mailer = None
+_mailer_lock = threading.Lock()
+
+def get_mailer() -> ReportMailer:
+    """
+    Returns the process-wide mailer, creating it on first use.
+    """
+    global _mailer
+    with _mailer_lock:
+        if _mailer is None:
+            _mailer = ReportMailer()
+        return _mailer
+
+def shutdown_mailer() -> dict | None:
+    """
+    Flushes and closes the process-wide mailer if it was used.
+
+    Returns:
+        Its delivery statistics, or None if no report was sent through it.
+    """
+    global _mailer
+    with _mailer_lock:
+        mailer, _mailer = _mailer, None
+    if mailer is None:
+        return None
+    mailer.close()
+    return mailer.report()
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+    from aiosmtpd.controller import Controller
+    from aiosmtpd.handlers import Sink
+
+    parser = argparse.ArgumentParser(description="Measure report delivery throughput against a local aiosmtpd server.")
+    parser.add_argument("--emails", type=int, default=200)
+    parser.add_argument("--pool-size", type=int, default=config.SMTP_POOL_SIZE)
+    parser.add_argument("--attachment-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    controller = Controller(Sink(), hostname="127.0.0.1", port=8025)
+    controller.start()
+    with tempfile.NamedTemporaryFile("wb", suffix=".html", delete=False) as f:
+        f.write(os.urandom(args.attachment_kb * 1024))
+    try:
+        mailer = ReportMailer(host="127.0.0.1", port=8025, use_tls=False, pool_size=args.pool_size,
+                              sender="bench@example.com", password=None)
+        futures = [mailer.submit(f.name, f"idea {i}", "inbox@example.com") for i in range(args.emails)]
+        for future in futures:
+            future.result()
+        print(mailer.report())
+        mailer.close()
+    finally:
+        os.remove(f.name)
+        controller.stop()
@@ -1,3 +1,5 @@
+import argparse
+import asyncio
 from agent import ProductResearchAgent
 import config
 
@@ -5,15 +7,26 @@ def main():
     """
     Main entry point for the AI Product Research Agent.
     """
+    parser = argparse.ArgumentParser(description="AI Product Research Agent")
+    parser.add_argument("--ideas-file", help="Text file with one product idea per line (batch mode)")
+    parser.add_argument("--max-concurrency", type=int, default=config.MAX_CONCURRENT_IDEAS,
+                        help="Maximum number of ideas researched at the same time in batch mode")
+    args = parser.parse_args()
+
     # The initial idea that triggers the research process
     product_idea = "Build an AI agent for medical diagnosis support"
     
     # Initialize and run the agent
     try:
         research_agent = ProductResearchAgent()
-        research_agent.run(product_idea)
+        if args.ideas_file:
+            with open(args.ideas_file, encoding="utf-8") as f:
+                product_ideas = [line.strip() for line in f if line.strip()]
+            asyncio.run(research_agent.run_batch(product_ideas, args.max_concurrency))
+        else:
+            research_agent.run(product_idea)
     except Exception as e:
         print(f"An error occurred during the research process: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,113 @@
+import html
+import re
+from typing import Iterable, Iterator
+from urllib.parse import urlsplit
+
+HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+FENCE = re.compile(r"^\s*```")
+RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+UNORDERED_ITEM = re.compile(r"^\s*[-*+]\s+(.*)$")
+ORDERED_ITEM = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+INLINE = re.compile(
+    r"`([^`]+)`"                                       # code
+    r"|\*\*(.+?)\*\*|__(.+?)__"                        # bold
+    r"|\*(?!\s)(.+?)(?<!\s)\*|(?<!\w)_(.+?)_(?!\w)"    # italic, flanked by non-space / non-word
+    r"|\[([^\]]+)\]\(((?:[^()\s]|\([^()\s]*\))+)\)"    # link; the URL may hold one level of (...)
+)
+# Anything else (javascript:, data:, ...) is rendered as text, not as a link
+LINK_SCHEMES = {"http", "https", "mailto"}
+CLOSING_TAGS = {"p": "</p>\n", "ul": "</ul>\n", "ol": "</ol>\n", "code": "</code></pre>\n"}
+
+def render_inline(text: str) -> str:
+    """
+    Renders inline Markdown (code, bold, italic, links) in one line of text, escaping HTML.
+    """
+    def replace(match: re.Match) -> str:
+        code, bold, bold_alt, italic, italic_alt, link_text, link_url = match.groups()
+        if code is not None:
+            return f"<code>{html.escape(code)}</code>"
+        if bold is not None or bold_alt is not None:
+            return f"<strong>{render_inline(bold or bold_alt)}</strong>"
+        if italic is not None or italic_alt is not None:
+            return f"<em>{render_inline(italic or italic_alt)}</em>"
+        if urlsplit(link_url).scheme.lower() not in LINK_SCHEMES:
+            return html.escape(match.group(0))
+        return f'<a href="{html.escape(link_url)}">{render_inline(link_text)}</a>'
+
+    parts, position = [], 0
+    for match in INLINE.finditer(text):
+        parts.append(html.escape(text[position:match.start()]))
+        parts.append(replace(match))
+        position = match.end()
+    parts.append(html.escape(text[position:]))
+    return "".join(parts)
+
+def render_markdown(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Renders Markdown to HTML in a single pass, yielding HTML chunks as lines arrive.
+
+    Supports headings, paragraphs, unordered and ordered lists, fenced code
+    blocks, horizontal rules and inline code, bold, italic and links. Only
+    the current block is kept as state, so any iterable of lines (a file, a
+    model stream) can be rendered without holding the whole document.
+
+    Args:
+        lines: Markdown source, one line per item (trailing newlines are ignored).
+
+    Yields:
+        HTML fragments in document order.
+    """
+    block = None  # one of None, "p", "ul", "ol", "code"
+
+    def switch_to(new_block):
+        nonlocal block
+        chunk = ""
+        if block != new_block:
+            chunk = CLOSING_TAGS.get(block, "")
+            if new_block == "code":
+                chunk += "<pre><code>"
+            elif new_block:
+                chunk += f"<{new_block}>"
+            block = new_block
+        return chunk
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+
+        if block == "code":
+            if FENCE.match(line):
+                yield switch_to(None)
+            else:
+                yield html.escape(line) + "\n"
+            continue
+        if FENCE.match(line):
+            yield switch_to("code")
+            continue
+        if not line.strip():
+            yield switch_to(None)
+            continue
+
+        heading = HEADING.match(line)
+        if heading:
+            level = len(heading.group(1))
+            yield f"{switch_to(None)}<h{level}>{render_inline(heading.group(2))}</h{level}>\n"
+            continue
+        if RULE.match(line):
+            yield f"{switch_to(None)}<hr>\n"
+            continue
+
+        item = UNORDERED_ITEM.match(line)
+        if item:
+            yield f"{switch_to('ul')}<li>{render_inline(item.group(1))}</li>\n"
+            continue
+        item = ORDERED_ITEM.match(line)
+        if item:
+            yield f"{switch_to('ol')}<li>{render_inline(item.group(1))}</li>\n"
+            continue
+
+        if block == "p":
+            yield f"<br>\n{render_inline(line.strip())}"
+        else:
+            yield f"{switch_to('p')}{render_inline(line.strip())}"
+
+    yield switch_to(None)
@@ -1,17 +1,16 @@
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+import html
 import config
+from email_delivery import get_mailer
+from markdown_renderer import render_markdown
 
-def create_html_report(report_content: str, product_idea: str) -> str:
+def create_html_report(report_content: str, product_idea: str, file_path: str = "product_research_report.html") -> str:
     """
     Converts the report content into a styled HTML file.
     
     Args:
         report_content: The string content of the report.
         product_idea: The product idea for the report title.
+        file_path: Where to write the report.
 
     Returns:
         The file path of the generated HTML report.
@@ -38,29 +37,22 @@ def create_html_report(report_content: str, product_idea: str) -> str:
     </style>
     """
     
-    # Simple conversion from Markdown-like text to HTML
-    html_content = report_content.replace("\n\n", "<p>")
-    html_content = html_content.replace("\n", "<br>")
-    html_content = html_content.replace("## ", "<h2>").replace("</h2><br>", "</h2>")
-    html_content = html_content.replace("# ", "<h1>").replace("</h1><br>", "</h1>")
-    
-    html_body = f"""
+    html_head = f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
-        <title>Product Research Report: {product_idea}</title>
+        <title>Product Research Report: {html.escape(product_idea)}</title>
         {html_style}
     </head>
     <body>
-        {html_content}
-    </body>
-    </html>
     """
     
-    file_path = "product_research_report.html"
+    # Stream the rendered Markdown straight into the file
     with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_body)
+        f.write(html_head)
+        f.writelines(render_markdown(report_content.splitlines()))
+        f.write("\n    </body>\n    </html>\n")
         
     print(f"Report successfully generated at: {file_path}")
     return file_path
@@ -68,6 +60,9 @@ def create_html_report(report_content: str, product_idea: str) -> str:
 def send_report_by_email(file_path: str, product_idea: str):
     """
     Sends the generated report file as an email attachment.
+
+    Delivery goes through the shared pooled mailer, so consecutive reports
+    reuse an open SMTP connection.
     
     Args:
         file_path: The path to the report file to attach.
@@ -78,31 +73,8 @@ def send_report_by_email(file_path: str, product_idea: str):
         return
 
     try:
-        msg = MIMEMultipart()
-        msg['From'] = config.SENDER_EMAIL
-        msg['To'] = config.RECIPIENT_EMAIL
-        msg['Subject'] = f"AI Product Research Report: {product_idea}"
-
-        body = f"Please find the attached research report for the product idea: '{product_idea}'."
-        msg.attach(MIMEText(body, 'plain'))
-
-        with open(file_path, "rb") as attachment:
-            part = MIMEBase('application', 'octet-stream')
-            part.set_payload(attachment.read())
-        
-        encoders.encode_base64(part)
-        part.add_header('Content-Disposition', f"attachment; filename= {file_path}")
-        msg.attach(part)
-
-        # Using Gmail's SMTP server as an example
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-        server.starttls()
-        server.login(config.SENDER_EMAIL, config.SENDER_PASSWORD)
-        text = msg.as_string()
-        server.sendmail(config.SENDER_EMAIL, config.RECIPIENT_EMAIL, text)
-        server.quit()
-        
-        print(f"Report successfully sent to {config.RECIPIENT_EMAIL}")
+        recipient = get_mailer().submit(file_path, product_idea).result(timeout=config.SMTP_SEND_TIMEOUT_SECONDS)
+        print(f"Report successfully sent to {recipient}")
 
     except Exception as e:
-        print(f"Error sending email: {e}")
\ No newline at end of file
+        print(f"Error sending email: {e}")
@@ -0,0 +1,170 @@
+import json
+import math
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+import config
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "build", "by", "for", "from", "in", "is", "it",
+    "of", "on", "or", "that", "the", "to", "with",
+}
+
+def tokenize(text: str) -> list[str]:
+    """
+    Lowercases text and splits it into word tokens.
+    """
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+def normalize_query(query: str) -> str:
+    """
+    Normalizes a search query so that trivially different spellings share a cache entry.
+
+    Only case, punctuation and whitespace are ignored; word order is kept, since
+    "dog bites man" and "man bites dog" are different searches.
+    """
+    return " ".join(re.findall(r"\w+", query.casefold()))
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimates the number of model tokens in a text (about 4 characters per token).
+    """
+    return math.ceil(len(text) / 4)
+
+
+class SearchCache:
+    """
+    SQLite cache of web search responses keyed on normalized query, with a time-to-live.
+    """
+    def __init__(self, path: str = config.SEARCH_CACHE_PATH, ttl_seconds: float = config.SEARCH_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS searches (key TEXT PRIMARY KEY, response TEXT, created_at REAL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(query: str, search_depth: str) -> str:
+        return f"{search_depth}:{normalize_query(query)}"
+
+    def get(self, query: str, search_depth: str) -> dict | None:
+        """
+        Returns the cached search response, or None if missing or expired.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT response, created_at FROM searches WHERE key = ?",
+                                     (self.key(query, search_depth),)).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, query: str, search_depth: str, response: dict):
+        """
+        Stores a search response.
+        """
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO searches VALUES (?, ?, ?)",
+                               (self.key(query, search_depth), json.dumps(response), time.time()))
+            self._conn.commit()
+
+
+search_cache = SearchCache()
+
+# --- Context compaction ---
+
+def split_snippets(text: str, max_words: int = 80) -> list[str]:
+    """
+    Splits a search result into snippets of whole sentences of at most about `max_words` words.
+    """
+    snippets, current, length = [], [], 0
+    for sentence in re.split(r"(?<=[.!?])\s+|\n+", text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        words = len(sentence.split())
+        if current and length + words > max_words:
+            snippets.append(" ".join(current))
+            current, length = [], 0
+        current.append(sentence)
+        length += words
+    if current:
+        snippets.append(" ".join(current))
+    return snippets
+
+def shingles(text: str, size: int = 3) -> set[tuple[str, ...]]:
+    """
+    Returns the set of word `size`-grams of a text (the whole text if it is shorter).
+    """
+    tokens = tokenize(text)
+    if len(tokens) < size:
+        return {tuple(tokens)}
+    return {tuple(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+def compact_context(results: list[dict], product_idea: str,
+                    token_budget: int = config.CONTEXT_TOKEN_BUDGET,
+                    similarity_threshold: float = config.DEDUP_SIMILARITY) -> tuple[str, dict]:
+    """
+    Builds a compact prompt context from search results.
+
+    Results are split into snippets, near-duplicate snippets (shingle Jaccard
+    similarity above the threshold) are dropped, the rest are ranked by
+    relevance to the product idea and added until the token budget is used.
+
+    Args:
+        results: Tavily search results (dicts with 'content' and optionally 'score' and 'url').
+        product_idea: The idea the context should be relevant to.
+        token_budget: Approximate maximum number of tokens in the returned context.
+        similarity_threshold: Jaccard similarity above which two snippets count as duplicates.
+
+    Returns:
+        The context text and statistics about the compaction.
+    """
+    snippets = [
+        (snippet, result.get("score", 0.0), result.get("url", ""))
+        for result in results
+        for snippet in split_snippets(result.get("content") or "")
+    ]
+    raw_tokens = estimate_tokens("\n".join(result.get("content") or "" for result in results))
+
+    # Drop near-duplicates, keeping the first occurrence
+    unique, kept_shingles = [], []
+    for snippet in snippets:
+        snippet_shingles = shingles(snippet[0])
+        if any(jaccard(snippet_shingles, seen) >= similarity_threshold for seen in kept_shingles):
+            continue
+        unique.append(snippet)
+        kept_shingles.append(snippet_shingles)
+
+    # Rank by IDF-weighted overlap with the product idea (plus the search engine's own score)
+    idea_terms = {token for token in tokenize(product_idea) if token not in STOPWORDS}
+    document_frequency = Counter(token for text, _, _ in unique for token in set(tokenize(text)))
+    def relevance(snippet):
+        counts = Counter(tokenize(snippet[0]))
+        overlap = sum(math.log(1 + len(unique) / document_frequency[term]) * counts[term] / (counts[term] + 1)
+                      for term in idea_terms if counts[term])
+        return overlap + snippet[1]
+    ranked = sorted(unique, key=relevance, reverse=True)
+
+    selected, used = [], 0
+    for text, _, url in ranked:
+        line = f"- {text} ({url})" if url else f"- {text}"
+        tokens = estimate_tokens(line)
+        if used + tokens > token_budget:
+            continue
+        selected.append(line)
+        used += tokens
+
+    stats = {"snippets": len(snippets), "duplicates": len(snippets) - len(unique),
+             "selected": len(selected), "raw_tokens": raw_tokens, "context_tokens": used}
+    return "\n".join(selected), stats
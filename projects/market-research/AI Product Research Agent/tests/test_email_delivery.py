@@ -0,0 +1,106 @@
+"""
+Tests for pooled report delivery against a local aiosmtpd server.
+"""
+import email
+import email.header
+import os
+import socket
+import pytest
+
+pytest.importorskip("aiosmtpd")
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+# config refuses to load without API keys; delivery does not use them
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("TAVILY_API_KEY", "test")
+import email_delivery  # noqa: E402
+from email_delivery import ReportMailer
+
+
+class RecordingHandler:
+    """Keeps every received message."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(email.message_from_bytes(envelope.content))
+        return "250 OK"
+
+
+def authenticator(server, session, envelope, mechanism, auth_data):
+    # handled=False lets the server send its own 535 reply on failure
+    return AuthResult(success=auth_data.login == b"bot@example.com" and auth_data.password == b"secret",
+                      handled=False)
+
+
+@pytest.fixture
+def smtp_server():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port, authenticator=authenticator,
+                            auth_required=True, auth_require_tls=False)
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+
+@pytest.fixture
+def report_file(tmp_path):
+    path = tmp_path / "report.html"
+    path.write_text("<html><body>report</body></html>")
+    return str(path)
+
+
+def test_delivers_to_server_requiring_auth(smtp_server, report_file):
+    """Test that the mailer logs in and that non-ASCII subjects are encoded."""
+    handler, port = smtp_server
+    mailer = ReportMailer(host="127.0.0.1", port=port, use_tls=False, pool_size=1,
+                          sender="bot@example.com", password="secret")
+    try:
+        assert mailer.submit(report_file, "Café finder", "inbox@example.com").result(timeout=10) == "inbox@example.com"
+    finally:
+        mailer.close()
+
+    assert len(handler.messages) == 1
+    subject = str(email.header.make_header(email.header.decode_header(handler.messages[0]["Subject"])))
+    assert subject == "AI Product Research Report: Café finder"
+
+
+def test_wrong_password_fails_the_future(smtp_server, report_file):
+    """Test that a rejected login is reported through the future."""
+    _, port = smtp_server
+    mailer = ReportMailer(host="127.0.0.1", port=port, use_tls=False, pool_size=1,
+                          sender="bot@example.com", password="wrong")
+    try:
+        with pytest.raises(email_delivery.smtplib.SMTPAuthenticationError):
+            mailer.submit(report_file, "idea", "inbox@example.com").result(timeout=10)
+    finally:
+        mailer.close()
+
+
+def test_unexpected_error_resolves_future_and_keeps_worker(smtp_server, report_file, monkeypatch):
+    """Test that a non-SMTP error fails only its own report."""
+    _, port = smtp_server
+    mailer = ReportMailer(host="127.0.0.1", port=port, use_tls=False, pool_size=1,
+                          sender="bot@example.com", password="secret")
+    original = email_delivery.send_streaming
+    calls = []
+
+    def flaky_send(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            raise ValueError("bad header")
+        return original(*args)
+
+    monkeypatch.setattr(email_delivery, "send_streaming", flaky_send)
+    try:
+        with pytest.raises(ValueError):
+            mailer.submit(report_file, "first", "inbox@example.com").result(timeout=10)
+        assert mailer.submit(report_file, "second", "inbox@example.com").result(timeout=10) == "inbox@example.com"
+    finally:
+        mailer.close()
+    assert mailer.report()["failed"] == 1
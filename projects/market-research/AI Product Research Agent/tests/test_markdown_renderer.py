@@ -0,0 +1,48 @@
+"""
+Tests for the streaming Markdown renderer used for emailed reports.
+"""
+from markdown_renderer import render_inline, render_markdown
+
+
+def render(text):
+    return "".join(render_markdown(text.splitlines()))
+
+
+def test_link_url_may_contain_parentheses():
+    """Test that a URL with balanced parentheses is kept whole."""
+    html = render_inline("see [Rust](https://en.wikipedia.org/wiki/Rust_(programming_language)).")
+    assert html == 'see <a href="https://en.wikipedia.org/wiki/Rust_(programming_language)">Rust</a>.'
+
+
+def test_allowed_link_schemes():
+    """Test that http, https and mailto links become anchors."""
+    assert render_inline("[a](http://a.example)") == '<a href="http://a.example">a</a>'
+    assert render_inline("[b](HTTPS://b.example)") == '<a href="HTTPS://b.example">b</a>'
+    assert render_inline("[c](mailto:c@example.com)") == '<a href="mailto:c@example.com">c</a>'
+
+
+def test_disallowed_link_schemes_render_as_text():
+    """Test that javascript: and other schemes never reach an href."""
+    html = render_inline("[x](javascript:alert(1)) [y](data:text/html,hi)")
+    assert "<a" not in html
+    assert html == "[x](javascript:alert(1)) [y](data:text/html,hi)"
+
+
+def test_arithmetic_asterisks_are_not_italic():
+    """Test that spaced asterisks are left alone while emphasis still works."""
+    assert render_inline("Compute 2 * 3 * 4") == "Compute 2 * 3 * 4"
+    assert render_inline("a *b* c and _d_") == "a <em>b</em> c and <em>d</em>"
+    assert render_inline("**bold** and snake_case_name") == "<strong>bold</strong> and snake_case_name"
+
+
+def test_fenced_code_is_escaped_and_not_rendered():
+    """Test that fence contents are escaped verbatim."""
+    html = render("```\n<b>*not italic*</b>\n```\nafter")
+    assert html == "<pre><code>&lt;b&gt;*not italic*&lt;/b&gt;\n</code></pre>\n<p>after</p>\n"
+
+
+def test_lists_open_and_close():
+    """Test that consecutive items share one list and switching list type closes it."""
+    html = render("- one\n- *two*\n1. first\n\ntext")
+    assert html == ("<ul><li>one</li>\n<li><em>two</em></li>\n</ul>\n"
+                    "<ol><li>first</li>\n</ol>\n<p>text</p>\n")
@@ -0,0 +1,43 @@
+"""
+Tests for the search cache key and expiry.
+"""
+import os
+
+# config refuses to load without API keys; the cache does not use them
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("TAVILY_API_KEY", "test")
+import config  # noqa: E402
+
+# Keep the module-level cache out of the working directory
+config.SEARCH_CACHE_PATH = ":memory:"
+import search_context  # noqa: E402
+from search_context import SearchCache, normalize_query  # noqa: E402
+
+
+def test_normalize_query_ignores_case_punctuation_and_whitespace():
+    """Test that trivially different spellings share a key."""
+    assert normalize_query("  AI  note-taking apps, for Students! ") == "ai note taking apps for students"
+    assert normalize_query("Café   market") == normalize_query("café market") == "café market"
+
+
+def test_normalize_query_keeps_word_order():
+    """Test that reordered words are different searches."""
+    assert normalize_query("dog bites man") != normalize_query("man bites dog")
+    assert SearchCache.key("dog bites man", "basic") != SearchCache.key("man bites dog", "basic")
+    assert SearchCache.key("dog bites man", "basic") != SearchCache.key("dog bites man", "advanced")
+
+
+def test_cache_hit_then_expiry(monkeypatch):
+    """Test that an entry is served until its TTL has passed."""
+    now = [1000.0]
+    monkeypatch.setattr(search_context.time, "time", lambda: now[0])
+    cache = SearchCache(":memory:", ttl_seconds=60)
+    cache.put("Dog bites man", "basic", {"results": [1]})
+
+    now[0] += 59
+    assert cache.get("dog bites man!", "basic") == {"results": [1]}
+    assert cache.get("man bites dog", "basic") is None
+
+    now[0] += 2
+    assert cache.get("dog bites man", "basic") is None
+    assert (cache.hits, cache.misses) == (1, 2)
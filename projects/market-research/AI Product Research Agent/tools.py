@@ -1,48 +1,38 @@
 import config
 from openai import OpenAI
 from tavily import TavilyClient
+from search_context import search_cache, compact_context
 
 # Initialize clients once to be used by all tools
 client = OpenAI(api_key=config.OPENAI_API_KEY)
 tavily_client = TavilyClient(api_key=config.TAVILY_API_KEY)
 
-def define_research_questions(product_idea: str) -> str:
+# --- Prompt builders (shared with async_tools) ---
+
+def research_questions_messages(product_idea: str) -> list[dict]:
     """
-    Generates key strategic questions for market research using OpenAI's GPT model.
+    Builds the chat messages for define_research_questions.
     """
-    print(f"Tool Executed: define_research_questions (Online) for '{product_idea}'")
-    
     prompt = f"""
     Based on the product idea '{product_idea}', generate a concise list of 5-7 critical strategic questions
     that a product manager must answer. These questions should cover market need, target audience,
     value proposition, competition, and technical feasibility.
     """
-    
-    response = client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": "You are a world-class product strategist."},
-            {"role": "user", "content": prompt}
-        ]
-    )
-    return response.choices[0].message.content
+    return [
+        {"role": "system", "content": "You are a world-class product strategist."},
+        {"role": "user", "content": prompt}
+    ]
 
-def analyze_competitors(product_idea: str) -> str:
+def competitor_search_query(product_idea: str) -> str:
     """
-    Performs a live web search to find competitors and then uses GPT to analyze them.
+    Builds the web search query used to find competitors.
     """
-    print(f"Tool Executed: analyze_competitors (Online) for '{product_idea}'")
-
-    # Step 1: Use Tavily to search for competitors
-    print("--> Performing web search for competitors...")
-    search_query = f"competitors and alternatives for '{product_idea}'"
-    search_results = tavily_client.search(query=search_query, search_depth="advanced")
-    
-    # Extract relevant content from search results
-    context = "\n".join([result['content'] for result in search_results['results']])
+    return f"competitors and alternatives for '{product_idea}'"
 
-    # Step 2: Use GPT to analyze the search results
-    print("--> Analyzing search results with GPT...")
+def competitor_analysis_messages(product_idea: str, context: str) -> list[dict]:
+    """
+    Builds the chat messages for analyzing competitor search results.
+    """
     prompt = f"""
     Based on the following web search results, identify the top 3-4 competitors for the product idea '{product_idea}'.
     For each competitor, provide a brief analysis of their strengths, weaknesses, and primary value proposition.
@@ -52,23 +42,15 @@ def analyze_competitors(product_idea: str) -> str:
     {context}
     ---
     """
-    
-    response = client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": "You are an expert market analyst. Your analysis is sharp and concise."},
-            {"role": "user", "content": prompt}
-        ]
-    )
-    return response.choices[0].message.content
+    return [
+        {"role": "system", "content": "You are an expert market analyst. Your analysis is sharp and concise."},
+        {"role": "user", "content": prompt}
+    ]
 
-
-def generate_product_report(product_idea: str, research_questions: str, competitor_analysis: str) -> str:
+def product_report_messages(product_idea: str, research_questions: str, competitor_analysis: str) -> list[dict]:
     """
-    Generates a final, comprehensive report with strategic recommendations using GPT.
+    Builds the chat messages for generate_product_report.
     """
-    print(f"Tool Executed: generate_product_report (Online) for '{product_idea}'")
-    
     prompt = f"""
     Create a comprehensive product research report for the idea: '{product_idea}'.
     Structure the report with the following sections: Executive Summary, Key Research Questions, Competitive Landscape, and Strategic Recommendations.
@@ -84,13 +66,63 @@ def generate_product_report(product_idea: str, research_questions: str, competit
     {competitor_analysis}
     ---
     """
+    return [
+        {"role": "system", "content": "You are a Senior Product Manager tasked with writing a go-to-market strategy report."},
+        {"role": "user", "content": prompt}
+    ]
+
+# --- Tools ---
+
+def define_research_questions(product_idea: str) -> str:
+    """
+    Generates key strategic questions for market research using OpenAI's GPT model.
+    """
+    print(f"Tool Executed: define_research_questions (Online) for '{product_idea}'")
+    
+    response = client.chat.completions.create(
+        model="gpt-4o",
+        messages=research_questions_messages(product_idea)
+    )
+    return response.choices[0].message.content
+
+def analyze_competitors(product_idea: str) -> str:
+    """
+    Performs a live web search to find competitors and then uses GPT to analyze them.
+    """
+    print(f"Tool Executed: analyze_competitors (Online) for '{product_idea}'")
+
+    # Step 1: Use Tavily to search for competitors
+    print("--> Performing web search for competitors...")
+    search_query = competitor_search_query(product_idea)
+    search_results = search_cache.get(search_query, "advanced")
+    if search_results is None:
+        search_results = tavily_client.search(query=search_query, search_depth="advanced")
+        search_cache.put(search_query, "advanced", search_results)
+    else:
+        print("--> Using cached search results.")
+
+    # Keep only distinct, relevant snippets within the token budget
+    context, stats = compact_context(search_results['results'], product_idea)
+    print(f"--> Context compacted: {stats}")
+
+    # Step 2: Use GPT to analyze the search results
+    print("--> Analyzing search results with GPT...")
+    response = client.chat.completions.create(
+        model="gpt-4o",
+        messages=competitor_analysis_messages(product_idea, context)
+    )
+    return response.choices[0].message.content
+
+
+def generate_product_report(product_idea: str, research_questions: str, competitor_analysis: str) -> str:
+    """
+    Generates a final, comprehensive report with strategic recommendations using GPT.
+    """
+    print(f"Tool Executed: generate_product_report (Online) for '{product_idea}'")
 
     response = client.chat.completions.create(
         model="gpt-4o",
-        messages=[
-            {"role": "system", "content": "You are a Senior Product Manager tasked with writing a go-to-market strategy report."},
-            {"role": "user", "content": prompt}
-        ],
+        messages=product_report_messages(product_idea, research_questions, competitor_analysis),
         temperature=0.7
     )
-    return response.choices[0].message.content
\ No newline at end of file
+    return response.choices[0].message.content
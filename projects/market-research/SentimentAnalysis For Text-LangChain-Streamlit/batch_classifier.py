@@ -0,0 +1,306 @@
+"""
+High-Throughput Batch Sentiment Classification
+
+Labels large CSV/JSONL streams with a local-first fast path. Every item is
+embedded (in batches) and classified by similarity-weighted nearest-neighbour
+voting over the labeled example set with vectorized NumPy. Only items whose
+local confidence is below a threshold are sent to the LLM, packed many per
+request. The run reports throughput, the share of items sent to the LLM and,
+optionally, agreement of the local labels with an LLM baseline sample.
+
+Usage:
+    python batch_classifier.py reviews.csv --text-field review --output labeled.jsonl
+    python batch_classifier.py reviews.jsonl --examples labeled_examples.csv --baseline-sample 200
+"""
+
+import argparse
+import csv
+import json
+import random
+import re
+import time
+
+import numpy as np
+from langchain_cohere import ChatCohere
+
+from sentiment_analysis import SentimentEngine, example_ids, load_examples
+
+LABELS = ["Positive", "Negative", "Neutral"]
+
+
+def read_records(path):
+    """
+    Stream records from a CSV or JSONL file.
+
+    Args:
+        path (str): Input file; `.jsonl` is read as JSON lines, anything else as CSV.
+
+    Yields:
+        Dict[str, Any]: The original record.
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def read_examples(path):
+    """
+    Load extra labeled examples (`input` and `output` fields) from CSV or JSONL.
+
+    Args:
+        path (str): Examples file.
+
+    Returns:
+        List[Dict[str, str]]: Examples in the same shape as load_examples().
+    """
+    return [{"input": r["input"], "output": r["output"]} for r in read_records(path)]
+
+
+def batched(iterable, size):
+    """
+    Yield lists of up to `size` items from an iterable.
+    """
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def normalize_rows(vectors):
+    """
+    Scale each row to unit length; all-zero rows stay zero instead of becoming NaN.
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def parse_label(text):
+    """
+    Extract a sentiment label from free-form model output.
+
+    Returns:
+        str or None: One of LABELS, or None if none is mentioned.
+    """
+    match = re.search(r"positive|negative|neutral", text, re.IGNORECASE)
+    return match.group(0).capitalize() if match else None
+
+
+class NearestNeighbourClassifier:
+    """
+    Similarity-weighted k-NN vote over embedded examples.
+
+    Example vectors are normalized once; a batch of items is classified with a
+    single matrix product. Votes are weighted by a softmax over the neighbours'
+    similarities, so a clearly closer neighbour outweighs several marginal ones.
+    By default k is the size of the smallest class, so every class can win a
+    unanimous vote even with a small, unbalanced example set.
+    """
+
+    def __init__(self, example_vectors, example_labels, k=None, temperature=0.05):
+        self.examples = normalize_rows(np.asarray(example_vectors, dtype=np.float32))
+        self.label_index = np.array([LABELS.index(label) for label in example_labels])
+        smallest_class = int(np.unique(self.label_index, return_counts=True)[1].min())
+        self.k = max(1, min(k or smallest_class, len(example_labels)))
+        self.temperature = temperature
+
+    def predict(self, vectors):
+        """
+        Classify a batch of embeddings.
+
+        Args:
+            vectors (List[List[float]]): Item embeddings.
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Predicted labels and confidence (winning vote share).
+        """
+        items = normalize_rows(np.asarray(vectors, dtype=np.float32))
+        similarities = items @ self.examples.T
+
+        # Top-k neighbours per item, weighted by a softmax of their similarity
+        top = np.argpartition(-similarities, self.k - 1, axis=1)[:, :self.k]
+        top_similarities = np.take_along_axis(similarities, top, axis=1)
+        weights = np.exp((top_similarities - top_similarities.max(axis=1, keepdims=True)) / self.temperature)
+        votes = np.zeros((len(items), len(LABELS)), dtype=np.float32)
+        np.add.at(votes, (np.arange(len(items))[:, None], self.label_index[top]), weights)
+
+        totals = votes.sum(axis=1)
+        # An all-zero embedding is equally close to everything, so leave it to the LLM
+        confidence = np.divide(votes.max(axis=1), totals, out=np.zeros_like(totals),
+                               where=(totals > 0) & items.any(axis=1))
+        return [LABELS[i] for i in votes.argmax(axis=1)], confidence
+
+
+class BatchSentimentClassifier:
+    """
+    Local-first batch classifier with packed LLM fallback.
+    """
+
+    def __init__(self, engine, extra_examples=None, confidence_threshold=0.75,
+                 llm_pack_size=25, k=None):
+        """
+        Args:
+            engine (SentimentEngine): Provides the embeddings and the persisted example vectors.
+            extra_examples (List[Dict[str, str]]): Additional labeled examples for the local classifier.
+            confidence_threshold (float): Items below this local confidence go to the LLM.
+            llm_pack_size (int): Number of items per LLM request.
+            k (int): Number of neighbours in the vote (default: size of the smallest class).
+        """
+        self.embeddings = engine.embeddings
+        self.confidence_threshold = confidence_threshold
+        self.llm_pack_size = llm_pack_size
+        self.llm = ChatCohere(model="command-r-plus", temperature=0)
+
+        # Reuse the example vectors already persisted in Chroma by the engine
+        stored = engine.example_selector.vectorstore.get(
+            ids=example_ids(engine.examples), include=["embeddings", "metadatas"]
+        )
+        vectors = list(stored["embeddings"])
+        labels = [metadata["output"] for metadata in stored["metadatas"]]
+        if extra_examples:
+            vectors += self.embeddings.embed_documents([e["input"] for e in extra_examples])
+            labels += [e["output"] for e in extra_examples]
+        self.local = NearestNeighbourClassifier(vectors, labels, k=k)
+
+        self.stats = {"items": 0, "local": 0, "llm_items": 0, "llm_requests": 0, "seconds": 0.0}
+
+    def classify_with_llm(self, texts):
+        """
+        Label texts with the LLM, packing many texts into each request.
+
+        Returns:
+            List[str]: One label per text (None if the model gave no usable label).
+        """
+        labels = []
+        for pack in batched(texts, self.llm_pack_size):
+            numbered = "\n".join(f"{i}. {text}" for i, text in enumerate(pack, 1))
+            prompt = (
+                "You are a sentiment analysis expert. Label the sentiment of each numbered sentence "
+                "as Positive, Negative or Neutral.\n"
+                'Respond only with a JSON list of labels in the same order, e.g. ["Positive", "Neutral"].\n\n'
+                f"{numbered}"
+            )
+            self.stats["llm_requests"] += 1
+            content = self.llm.invoke(prompt).content
+            try:
+                pack_labels = [parse_label(str(label)) for label in json.loads(content[content.index("["):content.rindex("]") + 1])]
+            except ValueError:
+                pack_labels = []
+            if len(pack_labels) != len(pack):
+                # The model did not follow the format; fall back to one request per item
+                pack_labels = []
+                for text in pack:
+                    self.stats["llm_requests"] += 1
+                    pack_labels.append(parse_label(self.llm.invoke(
+                        f"Analyze the sentiment of this sentence (Positive, Negative or Neutral): {text}").content))
+            labels.extend(pack_labels)
+        return labels
+
+    def classify_batch(self, texts):
+        """
+        Classify one batch of texts.
+
+        Returns:
+            List[Dict[str, Any]]: Label, source ('local' or 'llm') and local confidence per text.
+        """
+        start = time.perf_counter()
+        labels, confidence = self.local.predict(self.embeddings.embed_documents(texts))
+        results = [{"label": label, "source": "local", "confidence": round(float(c), 3)}
+                   for label, c in zip(labels, confidence)]
+
+        uncertain = [i for i, c in enumerate(confidence) if c < self.confidence_threshold]
+        if uncertain:
+            for i, label in zip(uncertain, self.classify_with_llm([texts[i] for i in uncertain])):
+                if label:
+                    results[i]["label"] = label
+                    results[i]["source"] = "llm"
+
+        self.stats["items"] += len(texts)
+        self.stats["llm_items"] += len(uncertain)
+        self.stats["local"] += len(texts) - len(uncertain)
+        self.stats["seconds"] += time.perf_counter() - start
+        return results
+
+    def report(self):
+        """
+        Summarize throughput and LLM usage.
+
+        Returns:
+            Dict[str, Any]: Run statistics.
+        """
+        items = self.stats["items"]
+        return {
+            **self.stats,
+            "seconds": round(self.stats["seconds"], 2),
+            "items_per_second": round(items / self.stats["seconds"], 1) if self.stats["seconds"] else 0.0,
+            "llm_call_ratio": round(self.stats["llm_items"] / items, 3) if items else 0.0,
+        }
+
+
+def measure_agreement(classifier, sample):
+    """
+    Compare local labels with the LLM baseline on a sample of locally labeled items.
+
+    Args:
+        classifier (BatchSentimentClassifier): The classifier used for the run.
+        sample (List[Tuple[str, str]]): (text, local label) pairs.
+
+    Returns:
+        float or None: Share of items where both agree.
+    """
+    if not sample:
+        return None
+    baseline = classifier.classify_with_llm([text for text, _ in sample])
+    return round(sum(b == local for (_, local), b in zip(sample, baseline)) / len(sample), 3)
+
+
+def main():
+    """
+    Command-line entry point for batch classification.
+    """
+    parser = argparse.ArgumentParser(description="Batch sentiment classification with a local fast path.")
+    parser.add_argument("input", help="CSV or JSONL file to classify")
+    parser.add_argument("--text-field", default="text", help="Column / key holding the text")
+    parser.add_argument("--output", default="labeled.jsonl", help="Output JSONL file")
+    parser.add_argument("--examples", help="Extra labeled examples (CSV/JSONL with input,output)")
+    parser.add_argument("--threshold", type=float, default=0.75, help="Local confidence threshold")
+    parser.add_argument("--batch-size", type=int, default=96, help="Texts embedded per request")
+    parser.add_argument("--pack-size", type=int, default=25, help="Texts per LLM request")
+    parser.add_argument("--k", type=int, default=None,
+                        help="Neighbours in the local vote (default: size of the smallest example class)")
+    parser.add_argument("--baseline-sample", type=int, default=0,
+                        help="Locally labeled items to re-check with the LLM for agreement")
+    args = parser.parse_args()
+
+    engine = SentimentEngine(load_examples())
+    extra = read_examples(args.examples) if args.examples else None
+    classifier = BatchSentimentClassifier(engine, extra, args.threshold, args.pack_size, k=args.k)
+
+    # Reservoir sample of locally labeled items for the agreement check
+    sample, seen_local = [], 0
+    with open(args.output, "w", encoding="utf-8") as out:
+        for records in batched(read_records(args.input), args.batch_size):
+            texts = [str(record[args.text_field]) for record in records]
+            for record, text, result in zip(records, texts, classifier.classify_batch(texts)):
+                out.write(json.dumps({**record, **result}, ensure_ascii=False) + "\n")
+                if result["source"] == "local" and args.baseline_sample:
+                    seen_local += 1
+                    if len(sample) < args.baseline_sample:
+                        sample.append((text, result["label"]))
+                    elif random.random() < args.baseline_sample / seen_local:
+                        sample[random.randrange(args.baseline_sample)] = (text, result["label"])
+
+    report = classifier.report()
+    report["agreement_with_llm"] = measure_agreement(classifier, sample)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
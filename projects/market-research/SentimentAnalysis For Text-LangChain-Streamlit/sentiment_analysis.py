@@ -6,6 +6,8 @@ It dynamically selects relevant examples based on semantic similarity for few-sh
 and provides a Streamlit UI for user interaction.
 """
 
+import hashlib
+import json
 import os
 import streamlit as st
 from dotenv import load_dotenv
@@ -14,7 +16,6 @@ from langchain_core.example_selectors import SemanticSimilarityExampleSelector
 from langchain_cohere import CohereEmbeddings, ChatCohere
 from langchain_core.prompts import FewShotChatMessagePromptTemplate, ChatPromptTemplate
 from langchain_core.runnables import RunnableSequence
-import chromadb
 
 
 # Setup API Key
@@ -24,6 +25,10 @@ if not COHERE_API_KEY:
     raise ValueError("COHERE_API_KEY not found in .env file. Please set it.")
 os.environ["COHERE_API_KEY"] = COHERE_API_KEY
 
+# Chroma persist directory and embedding model for the few-shot examples
+PERSIST_DIRECTORY = "./chromaDB"
+EMBEDDING_MODEL = "embed-english-v3.0"
+
 
 # Load Examples
 def load_examples():
@@ -48,47 +53,83 @@ def load_examples():
     ]
 
 
-def create_example_selector(examples):
+def example_set_hash(examples):
+    """
+    Compute a stable hash of an example set.
+
+    Args:
+        examples (List[Dict[str, str]]): List of example dictionaries with input and output.
+
+    Returns:
+        str: Hex digest identifying the examples and the embedding model.
+    """
+    payload = json.dumps({"model": EMBEDDING_MODEL, "examples": examples}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def example_ids(examples):
+    """
+    Chroma ids of an example set, derived from its hash.
+
+    Args:
+        examples (List[Dict[str, str]]): List of example dictionaries with input and output.
+
+    Returns:
+        List[str]: One id per example.
+    """
+    set_hash = example_set_hash(examples)
+    return [f"{set_hash[:16]}-{i}" for i in range(len(examples))]
+
+
+def create_example_selector(examples, embeddings, persist_directory=PERSIST_DIRECTORY):
     """
     Create a semantic similarity example selector using Cohere embeddings and Chroma.
 
+    Example embeddings are stored in a persistent Chroma collection named after
+    the example-set hash, so they are computed once and reused by later runs.
+
     Args:
         examples (List[Dict[str, str]]): List of example dictionaries with input and output.
+        embeddings (CohereEmbeddings): Embedding model for examples and queries.
+        persist_directory (str): Chroma persist directory.
 
     Returns:
         SemanticSimilarityExampleSelector: Configured example selector for dynamic example selection.
     """
-    # define cohere Embeddings
-    embeddings = CohereEmbeddings(model="embed-english-v3.0")
-    
-    # chroma_db with persist directory
-    persist_directory = "./chromaDB"
-    
-    # Define settings for client
-    chroma_client = chromadb.PersistentClient(path=persist_directory)
+    set_hash = example_set_hash(examples)
 
     # build chroma db
     vectorstore = Chroma(
-        collection_name="sentiment_examples",
+        collection_name=f"sentiment_examples_{set_hash[:16]}",
         embedding_function=embeddings,
         persist_directory=persist_directory
     )
-    
+
+    # Embed the examples only if this example set has not been persisted yet
+    ids = example_ids(examples)
+    if len(vectorstore.get(ids=ids)["ids"]) != len(ids):
+        vectorstore.add_texts(
+            texts=[example["input"] for example in examples],
+            metadatas=examples,
+            ids=ids
+        )
+
     # define selector
-    selector = SemanticSimilarityExampleSelector.from_examples(
-        examples=examples,
-        embeddings=embeddings,
-        vectorstore_cls=Chroma,
+    selector = SemanticSimilarityExampleSelector(
+        vectorstore=vectorstore,
         k=3,  # انتخاب 3 مثال نزدیک‌ترین از نظر معنایی
         input_keys=["input"]  # کلیدهایی که برای تولید متن استفاده می‌شن
     )
     return selector
 
 
-def create_prompt_template():
+def create_prompt_template(example_selector):
     """
     Create a chat prompt template with dynamic few-shot examples.
 
+    Args:
+        example_selector (SemanticSimilarityExampleSelector): Selector picking the examples for each input.
+
     Returns:
         ChatPromptTemplate: Configured prompt template with system message and few-shot examples.
     """
@@ -97,14 +138,11 @@ def create_prompt_template():
         ("human", "Analyze the sentiment of this sentence: {input}"),
         ("assistant", "Sentiment: {output}")
     ])
-    # Load examples
-    examples = load_examples()
-    # Create example selector
-    example_selector = create_example_selector(examples)
     # Creating dynamic few-shot promp
     few_shot_prompt = FewShotChatMessagePromptTemplate(
-        examples=examples,
-        example_prompt=example_prompt
+        example_selector=example_selector,
+        example_prompt=example_prompt,
+        input_variables=["input"]
     )
 
     # Final prompt with messages & dynamic examples
@@ -117,20 +155,63 @@ def create_prompt_template():
     return final_prompt
 
 
-def build_chain():
+def build_chain(example_selector):
     """
     Build a LangChain runnable chain for sentiment analysis.
 
+    Args:
+        example_selector (SemanticSimilarityExampleSelector): Selector picking the few-shot examples.
+
     Returns:
         RunnableSequence: A chain combining the prompt template and Cohere chat model.
     """
     # Define chat model
     chat_model = ChatCohere(model="command-r-plus", temperature=0.7)
     # create prompt
-    prompt = create_prompt_template()
+    prompt = create_prompt_template(example_selector)
     chain = prompt | chat_model
     return chain
 
+
+class SentimentEngine:
+    """
+    Holds the embeddings, example selector and chain for sentiment analysis.
+
+    Built once per process (see get_sentiment_engine), so each request only
+    costs one query embedding for example selection plus one completion.
+    """
+
+    def __init__(self, examples=None, persist_directory=PERSIST_DIRECTORY):
+        self.examples = examples or load_examples()
+        self.embeddings = CohereEmbeddings(model=EMBEDDING_MODEL)
+        self.example_selector = create_example_selector(self.examples, self.embeddings, persist_directory)
+        self.chain = build_chain(self.example_selector)
+
+    def analyze(self, sentence):
+        """
+        Run the chain on one sentence.
+
+        Args:
+            sentence (str): The input sentence to analyze.
+
+        Returns:
+            str: The model's sentiment answer.
+        """
+        return self.chain.invoke({"input": sentence}).content
+
+
+@st.cache_resource
+def get_sentiment_engine():
+    """
+    Return the process-wide sentiment engine, creating it on first use.
+
+    st.cache_resource keeps it alive across Streamlit reruns and sessions.
+
+    Returns:
+        SentimentEngine: The shared engine.
+    """
+    return SentimentEngine()
+
 def analyze_sentiment(sentence):
     """
     Analyze the sentiment of a given sentence using the chatbot.
@@ -144,11 +225,9 @@ def analyze_sentiment(sentence):
     Raises:
         Exception: If the chain execution fails.
     """
-    chain = build_chain()
     try:
         # Run chain with user input
-        result = chain.invoke({"input": sentence})
-        return result.content
+        return get_sentiment_engine().analyze(sentence)
     except Exception as e:
         return f"Error: {e}"
     
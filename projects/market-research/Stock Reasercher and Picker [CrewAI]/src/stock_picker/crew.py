@@ -1,10 +1,15 @@
 # Libraries
+import asyncio
+import json
+import os
+import re
+import time
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import SerperDevTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from typing import List
 from .tools.push_tool import PushNotificationTool
+from .tools.cached_search import CachedSerperDevTool
 from crewai.memory import LongTermMemory, ShortTermMemory, EntityMemory
 from crewai.memory.storage.rag_storage import RAGStorage
 from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
@@ -33,6 +38,21 @@ class TrendingCompanyResearchList(BaseModel):
     research_list: List[TrendingCompanyResearch] = Field(description="Comprehensive research on all trending companies")
 
 
+def parse_output(output, model):
+    """
+    Returns a crew's output as `model`. Falls back to parsing the raw text (without
+    Markdown code fences) when CrewAI could not, and raises ValueError if that fails too.
+    """
+    if output.pydantic is not None:
+        return output.pydantic
+    raw = re.sub(r"^```(?:json)?\s*|\s*```$", "", (output.raw or "").strip())
+    try:
+        return model.model_validate_json(raw)
+    except ValidationError as e:
+        raise ValueError(f"The output could not be parsed as {model.__name__}: {e}\n"
+                         f"Raw output:\n{output.raw}") from e
+
+
 @CrewBase
 class StockPicker():
     """StockPicker crew"""
@@ -46,12 +66,12 @@ class StockPicker():
     @agent
     def trending_company_finder(self) -> Agent:
         return Agent(config=self.agents_config['trending_company_finder'],
-                     tools=[SerperDevTool()], memory=True)
+                     tools=[CachedSerperDevTool()], memory=True)
     
     @agent
     def financial_researcher(self) -> Agent:
         return Agent(config=self.agents_config['financial_researcher'], 
-                     tools=[SerperDevTool()])
+                     tools=[CachedSerperDevTool()])
 
     @agent
     def stock_picker(self) -> Agent:
@@ -85,21 +105,9 @@ class StockPicker():
     #------------#
     # Crew       #
     #------------#
-    @crew
-    def crew(self) -> Crew:
-        """Creates the StockPicker crew"""
-
-        manager = Agent(
-            config=self.agents_config['manager'],
-            allow_delegation=True
-        )
-            
-        return Crew(
-            agents=self.agents,
-            tasks=self.tasks, 
-            process=Process.hierarchical,
-            verbose=True,
-            manager_agent=manager,
+    def memory_config(self) -> dict:
+        """Memory settings shared by the hierarchical crew and the fan-out crews"""
+        return dict(
             memory=True,
             # Long-term memory for persistent storage across sessions
             long_term_memory = LongTermMemory(
@@ -133,3 +141,96 @@ class StockPicker():
                 )
             ),
         )
+
+    @crew
+    def crew(self) -> Crew:
+        """Creates the StockPicker crew"""
+
+        manager = Agent(
+            config=self.agents_config['manager'],
+            allow_delegation=True
+        )
+            
+        return Crew(
+            agents=self.agents,
+            tasks=self.tasks, 
+            process=Process.hierarchical,
+            verbose=True,
+            manager_agent=manager,
+            **self.memory_config(),
+        )
+
+    #------------#
+    # Fan-out    #
+    #------------#
+    def research_company_crew(self) -> Crew:
+        """A one-task crew researching a single company, with its own agent so crews can run concurrently"""
+        researcher = Agent(config=self.agents_config['financial_researcher'],
+                           tools=[CachedSerperDevTool()])
+        research = Task(
+            config=self.tasks_config['research_company'],
+            agent=researcher,
+            output_pydantic=TrendingCompanyResearch,
+        )
+        return Crew(agents=[researcher], tasks=[research], process=Process.sequential, verbose=True)
+
+    async def _timed_kickoff(self, name: str, crew: Crew, inputs: dict):
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            return await crew.kickoff_async(inputs=inputs)
+        except Exception:
+            status = "failed"
+            raise
+        finally:
+            self.timings.append({"task": name, "seconds": round(time.perf_counter() - start, 2),
+                                 "status": status})
+
+    async def run_parallel(self, inputs: dict, max_concurrency: int = 4):
+        """
+        Finds trending companies, researches each one in its own concurrent crew
+        (at most `max_concurrency` at a time), merges the results into a
+        TrendingCompanyResearchList and then picks the best company.
+
+        Per-task timings are collected in `self.timings`.
+        """
+        self.timings = []
+        start = time.perf_counter()
+
+        finder = Crew(agents=[self.trending_company_finder()], tasks=[self.find_trending_companies()],
+                      process=Process.sequential, verbose=True, **self.memory_config())
+        trending = parse_output(await self._timed_kickoff("find_trending_companies", finder, inputs),
+                                TrendingCompanyList)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def research(company: TrendingCompany):
+            async with semaphore:
+                company_inputs = {**inputs, "company": company.name, "ticker": company.ticker,
+                                  "reason": company.reason}
+                try:
+                    result = await self._timed_kickoff(f"research_company:{company.ticker}",
+                                                       self.research_company_crew(), company_inputs)
+                    return parse_output(result, TrendingCompanyResearch)
+                except Exception as e:
+                    print(f"Research failed for {company.name}: {e}")
+                    return None
+
+        results = await asyncio.gather(*(research(company) for company in trending.companies))
+        research_list = TrendingCompanyResearchList(research_list=[r for r in results if r is not None])
+        os.makedirs("output", exist_ok=True)
+        with open("output/research_report.json", "w", encoding="utf-8") as f:
+            f.write(research_list.model_dump_json(indent=2))
+
+        picker = Crew(
+            agents=[self.stock_picker()],
+            tasks=[Task(config=self.tasks_config['pick_best_company_from_research'])],
+            process=Process.sequential, verbose=True, **self.memory_config(),
+        )
+        decision = await self._timed_kickoff("pick_best_company", picker,
+                                             {**inputs, "research": research_list.model_dump_json(indent=2)})
+
+        self.timings.append({"task": "total", "seconds": round(time.perf_counter() - start, 2), "status": "ok"})
+        with open("output/timings.json", "w", encoding="utf-8") as f:
+            json.dump(self.timings, f, indent=2)
+        return decision
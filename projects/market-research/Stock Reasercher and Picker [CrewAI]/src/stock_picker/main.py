@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 import sys
+import asyncio
+import json
 import warnings
 import os
 from datetime import datetime
 
 from stock_picker.crew import StockPicker
+from stock_picker.tools.cached_search import search_stats
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
@@ -24,7 +27,33 @@ def run():
     # Print the result
     print("\n\n=== FINAL DECISION ===\n\n")
     print(result.raw)
+    print(f"\nSearch cache: {search_stats.summary()}")
+
+
+def run_parallel():
+    """
+    Run the crew with one concurrent research task per trending company.
+
+    The number of research crews running at once is capped by MAX_CONCURRENT_RESEARCH (default 4).
+    """
+    inputs = {
+        'sector': 'Technology',
+        "current_date": str(datetime.now())
+    }
+    max_concurrency = int(os.getenv("MAX_CONCURRENT_RESEARCH", "4"))
+
+    stock_picker = StockPicker()
+    result = asyncio.run(stock_picker.run_parallel(inputs, max_concurrency=max_concurrency))
+
+    print("\n\n=== TIMINGS ===\n\n")
+    print(json.dumps(stock_picker.timings, indent=2))
+    print("\n\n=== FINAL DECISION ===\n\n")
+    print(result.raw)
+    print(f"\nSearch cache: {search_stats.summary()}")
 
 
 if __name__ == "__main__":
-    run()
+    if "--parallel" in sys.argv:
+        run_parallel()
+    else:
+        run()
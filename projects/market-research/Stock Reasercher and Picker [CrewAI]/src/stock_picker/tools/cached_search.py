@@ -0,0 +1,137 @@
+from crewai_tools import SerperDevTool
+from concurrent.futures import Future
+from typing import Any
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+# Shared by every crew on the machine unless overridden, so daily runs and other crews reuse results
+SERPER_CACHE_PATH = os.getenv("SERPER_CACHE_PATH",
+                              os.path.join(os.path.expanduser("~"), ".cache", "crew_search", "serper_cache.sqlite"))
+SERPER_CACHE_TTL_SECONDS = float(os.getenv("SERPER_CACHE_TTL_SECONDS", str(24 * 3600)))
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, drop quotes and collapse whitespace so trivially different queries share an entry."""
+    return re.sub(r"\s+", " ", re.sub(r"[\"'`]", "", query)).strip().lower()
+
+
+class SearchStore:
+    """SQLite store of search results with a time-to-live, safe to use from several threads."""
+
+    def __init__(self, path: str, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS searches (key TEXT PRIMARY KEY, result TEXT, created_at REAL)")
+        self._conn.commit()
+
+    def get(self, key: str):
+        with self._lock:
+            row = self._conn.execute("SELECT result, created_at FROM searches WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return json.loads(row[0])
+
+    def put(self, key: str, result) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO searches VALUES (?, ?, ?)",
+                               (key, json.dumps(result), time.time()))
+            self._conn.commit()
+
+
+class SearchStats:
+    """Counts of cache hits, coalesced waits and real API calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.coalesced = 0
+        self.api_calls = 0
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def summary(self) -> dict:
+        total = self.hits + self.coalesced + self.api_calls
+        return {
+            "searches": total,
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "api_calls": self.api_calls,
+            "hit_rate": round((self.hits + self.coalesced) / total, 3) if total else 0.0,
+        }
+
+
+search_stats = SearchStats()
+_store = None
+_store_lock = threading.Lock()
+_in_flight: dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def _get_store() -> SearchStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SearchStore(SERPER_CACHE_PATH, SERPER_CACHE_TTL_SECONDS)
+        return _store
+
+
+class CachedSerperDevTool(SerperDevTool):
+    """
+    SerperDevTool backed by a shared on-disk cache.
+
+    Results are keyed on the normalized query plus the search settings. While a
+    query is being fetched, identical concurrent queries wait for that one
+    request instead of issuing their own.
+    """
+
+    def _run(self, **kwargs: Any) -> Any:
+        search_query = kwargs.get("search_query") or kwargs.get("query")
+        search_type = kwargs.get("search_type", self.search_type)
+        # Results saved to a file must come from a real request
+        if kwargs.get("save_file", self.save_file):
+            search_stats.increment("api_calls")
+            return super()._run(**kwargs)
+
+        key = "|".join([search_type, str(self.n_results), self.country or "", self.location or "",
+                        self.locale or "", normalize_query(search_query)])
+        store = _get_store()
+        cached = store.get(key)
+        if cached is not None:
+            search_stats.increment("hits")
+            return cached
+
+        with _in_flight_lock:
+            future = _in_flight.get(key)
+            owner = future is None
+            if owner:
+                # Another thread may have stored the result since the first lookup
+                cached = store.get(key)
+                if cached is None:
+                    future = _in_flight[key] = Future()
+        if owner and cached is not None:
+            search_stats.increment("hits")
+            return cached
+        if not owner:
+            search_stats.increment("coalesced")
+            return future.result()
+
+        try:
+            search_stats.increment("api_calls")
+            result = super()._run(**kwargs)
+            store.put(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _in_flight_lock:
+                _in_flight.pop(key, None)
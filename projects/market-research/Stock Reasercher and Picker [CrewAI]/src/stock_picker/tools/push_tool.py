@@ -1,8 +1,7 @@
 from crewai.tools import BaseTool
 from typing import Type
 from pydantic import BaseModel, Field
-import os
-import requests
+from .notifier import get_dispatcher
 
 
 class PushNotification(BaseModel):
@@ -19,11 +18,8 @@ class PushNotificationTool(BaseTool):
     args_schema: Type[BaseModel] = PushNotification
 
     def _run(self, message: str) -> str:
-        pushover_user = os.getenv("PUSHOVER_USER")
-        pushover_token = os.getenv("PUSHOVER_TOKEN")
-        pushover_url = "https://api.pushover.net/1/messages.json"
-
         print(f"Push: {message}")
-        payload = {"user": pushover_user, "token": pushover_token, "message": message}
-        requests.post(pushover_url, data=payload)
-        return '{"notification": "ok"}'
\ No newline at end of file
+        # Queued for the background dispatcher; the agent does not wait for Pushover
+        if not get_dispatcher().notify(message):
+            return '{"notification": "skipped", "reason": "PUSHOVER_USER/PUSHOVER_TOKEN not set"}'
+        return '{"notification": "ok"}'
@@ -0,0 +1,188 @@
+# async_debate_manager.py
+
+import argparse
+import asyncio
+import time
+from config import AGENTS, DEBATE_TOPIC
+from conversation_context import ConversationContext
+from debate_manager import DebateManager, JUDGE_SYSTEM_PROMPT, save_transcript_to_markdown
+from llm_interface import count_prompt_tokens, create_async_client, get_cerebras_response_async
+
+class AsyncDebateManager(DebateManager):
+    """
+    Runs the same debate as DebateManager on an async Cerebras client.
+
+    - Opening statements stay sequential, since each one responds to the ones before it.
+    - Cross-examination is pipelined: once a question is on the log, its answer and the
+      next question are generated together. The next question therefore sees the log up
+      to the previous question rather than the previous answer. Pass overlap=False to
+      keep the strict serial order.
+    - All judge votes are requested concurrently, as they only depend on the finished transcript.
+
+    With compact=True, calls get a ConversationContext (recent turns plus per-speaker
+    summaries) instead of the full log, and judges get the summaries instead of the
+    whole transcript, so prompt size stays bounded however many cross-examination
+    rounds are run.
+
+    Besides round_times (wall time per round), call_seconds records the summed latency of
+    the calls in each round, i.e. roughly what the round would take if run serially, and
+    call_tokens the estimated prompt tokens of each call.
+    """
+
+    def __init__(self, agents, topic: str, overlap: bool = True, compact: bool = False, cross_rounds: int = 1):
+        super().__init__(agents, topic)
+        self.overlap = overlap
+        self.compact = compact
+        self.cross_rounds = cross_rounds
+        self.call_seconds = {}
+        self.call_tokens = {}
+        self.client = None
+        self.context = None
+        self._current_round = None
+
+    def _history(self):
+        return self.context.history() if self.context else list(self.conversation_log)
+
+    def _log(self, speaker: str, content: str):
+        self.conversation_log.append({"role": "user", "content": content})
+        if self.context:
+            self.context.add_turn(speaker, content)
+
+    async def _call(self, name: str, system_prompt: str, history):
+        self.call_tokens[self._current_round].append(
+            count_prompt_tokens([{"role": "system", "content": system_prompt}, *history]))
+        start = time.perf_counter()
+        response = await get_cerebras_response_async(self.client, self.agents[name]["model"], system_prompt, history)
+        self.call_seconds[self._current_round] += time.perf_counter() - start
+        return response
+
+    async def run_opening_statements(self):
+        self._add_to_transcript("\n## Round 1: Opening Statements\n")
+        for name in self.agent_names:
+            prompt = f"It's your turn, {name}. Please state your opening position on the topic."
+            response = await self._call(name, self.agents[name]["persona"],
+                                        [*self._history(), {"role": "user", "content": prompt}])
+            self._add_to_transcript(f"### **{name}:**\n{response}\n")
+            self._log(name, f"Statement from {name}: {response}")
+
+    def _ask(self, asker: str, target: str):
+        prompt = f"It's your turn, {asker}. Ask a challenging, direct question to {target}."
+        return asyncio.create_task(self._call(asker, self.agents[asker]["persona"],
+                                              [*self._history(), {"role": "user", "content": prompt}]))
+
+    async def run_crossexamination(self):
+        self._add_to_transcript("\n## Round 2: Cross-Examination\n")
+        pairs = [(name, self.agent_names[(i + 1) % len(self.agent_names)]) for i, name in enumerate(self.agent_names)]
+        next_question = self._ask(*pairs[0])
+        for i, (asker, target) in enumerate(pairs):
+            question = await next_question
+            self._add_to_transcript(f"### **{asker} asks {target}:**\n{question}\n")
+            self._log(asker, f"Question from {asker}: {question}")
+
+            answer_prompt = f"It's your turn, {target}. Answer this question: '{question}'"
+            answer_task = asyncio.create_task(self._call(target, self.agents[target]["persona"],
+                                                         [*self._history(), {"role": "user", "content": answer_prompt}]))
+            is_last = i + 1 == len(pairs)
+            if self.overlap and not is_last:
+                next_question = self._ask(*pairs[i + 1])
+            answer = await answer_task
+            self._add_to_transcript(f"### **{target} responds:**\n{answer}\n")
+            self._log(target, f"Response from {target}: {answer}")
+            if not self.overlap and not is_last:
+                next_question = self._ask(*pairs[i + 1])
+
+    async def run_judging(self):
+        self._add_to_transcript("\n## Final Round: Judgment\n")
+        judging_prompt = self._judging_prompt(await self.context.digest() if self.context else None)
+        votes = await asyncio.gather(*(
+            self._call(name, JUDGE_SYSTEM_PROMPT, [{"role": "user", "content": judging_prompt}])
+            for name in self.agent_names
+        ))
+        for name, vote in zip(self.agent_names, votes):
+            self._add_to_transcript(f"### **Vote from {name}:**\n{vote}\n")
+
+    async def _timed(self, round_name: str, run_round):
+        """Runs one round and records its wall time and summed call latency."""
+        self._current_round = round_name
+        self.call_seconds[round_name] = 0.0
+        self.call_tokens[round_name] = []
+        start = time.perf_counter()
+        await run_round()
+        self.round_times[round_name] = time.perf_counter() - start
+
+    async def start(self):
+        """Starts and runs the entire debate process."""
+        print("="*20)
+        print(self.transcript_list[0])
+        print("="*20)
+
+        async with create_async_client() as self.client:
+            if self.compact:
+                self.context = ConversationContext(self.client)
+            await self._timed("opening", self.run_opening_statements)
+            for i in range(self.cross_rounds):
+                name = "crossexamination" if self.cross_rounds == 1 else f"crossexamination_{i + 1}"
+                await self._timed(name, self.run_crossexamination)
+            await self._timed("judging", self.run_judging)
+            if self.context:
+                await self.context.settle()
+
+        self._add_to_transcript("\n---\n*The Debate has Concluded.*")
+
+def format_round_report(debate: AsyncDebateManager, serial_times=None) -> str:
+    """
+    A Markdown table of per-round wall time against the serial baseline: the summed call
+    latency of the async run and, if given, the round times of an actual serial run.
+    """
+    lines = ["| Round | Async wall (s) | Summed call latency (s) | Serial run (s) | Speedup |",
+             "|---|---|---|---|---|"]
+    rounds = list(debate.round_times) + ["total"]
+    for name in rounds:
+        if name == "total":
+            wall, summed = sum(debate.round_times.values()), sum(debate.call_seconds.values())
+            serial = sum(serial_times.values()) if serial_times else None
+        else:
+            wall, summed = debate.round_times[name], debate.call_seconds[name]
+            serial = serial_times.get(name) if serial_times else None
+        baseline = serial if serial is not None else summed
+        serial_cell = f"{serial:.1f}" if serial is not None else "-"
+        lines.append(f"| {name} | {wall:.1f} | {summed:.1f} | {serial_cell} | {baseline / wall:.2f}x |")
+    return "\n".join(lines)
+
+def format_token_report(debate: AsyncDebateManager) -> str:
+    """A Markdown table of estimated prompt tokens per call and wall time per round."""
+    lines = ["| Round | Calls | Mean prompt tokens | Max prompt tokens | Wall (s) |",
+             "|---|---|---|---|---|"]
+    for name, tokens in debate.call_tokens.items():
+        lines.append(f"| {name} | {len(tokens)} | {sum(tokens) // max(len(tokens), 1)} | "
+                     f"{max(tokens, default=0)} | {debate.round_times[name]:.1f} |")
+    if debate.context:
+        stats = debate.context.stats
+        lines.append(f"\nSummary updates: {stats['summary_calls']} calls, "
+                     f"{stats['summary_seconds']:.1f}s in the background")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the debate on the async engine.")
+    parser.add_argument("--no-overlap", action="store_true",
+                        help="Generate each cross-examination question only after the previous answer")
+    parser.add_argument("--compact", action="store_true",
+                        help="Send recent turns plus per-speaker summaries instead of the full log")
+    parser.add_argument("--rounds", type=int, default=1, help="Number of cross-examination rounds")
+    parser.add_argument("--compare-serial", action="store_true",
+                        help="Also run the serial DebateManager and compare round times")
+    args = parser.parse_args()
+
+    debate = AsyncDebateManager(AGENTS, DEBATE_TOPIC, overlap=not args.no_overlap,
+                                compact=args.compact, cross_rounds=args.rounds)
+    asyncio.run(debate.start())
+    save_transcript_to_markdown(debate.get_full_transcript())
+
+    serial_times = None
+    if args.compare_serial:
+        serial_debate = DebateManager(AGENTS, DEBATE_TOPIC)
+        serial_debate.start()
+        serial_times = serial_debate.round_times
+
+    print("\n" + format_round_report(debate, serial_times))
+    print("\n" + format_token_report(debate))
@@ -42,4 +42,22 @@ AGENTS = {
     }
 }
 
-DEBATE_TOPIC = "Given the widespread job displacement by AI, should governments implement Universal Basic Income (UBI) as a primary policy?"
\ No newline at end of file
+DEBATE_TOPIC = "Given the widespread job displacement by AI, should governments implement Universal Basic Income (UBI) as a primary policy?"
+
+
+# --- Rate Limiting ---
+# Starting limits for the shared limiter; they are updated from the provider's rate-limit headers.
+REQUESTS_PER_MINUTE = 30
+TOKENS_PER_MINUTE = 60000
+MAX_COMPLETION_TOKENS = 512
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+
+# --- Context Compaction ---
+# Recent turns are passed verbatim up to this many (estimated) tokens; older turns are
+# replaced by per-speaker running summaries.
+CONTEXT_WINDOW_TOKENS = 1500
+SUMMARY_MODEL = "llama3.1-8b"
+SUMMARY_MAX_WORDS = 120
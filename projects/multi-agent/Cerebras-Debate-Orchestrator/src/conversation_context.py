@@ -0,0 +1,88 @@
+# conversation_context.py
+
+import asyncio
+import time
+from typing import Dict, List
+from config import CONTEXT_WINDOW_TOKENS, SUMMARY_MODEL, SUMMARY_MAX_WORDS
+from llm_interface import count_prompt_tokens, get_cerebras_response_async
+
+SUMMARIZER_SYSTEM_PROMPT = "You keep concise, faithful running summaries of speakers in a debate."
+
+class ConversationContext:
+    """
+    Bounded conversation history for long debates.
+
+    Each call gets the most recent turns verbatim, up to `budget_tokens`, plus a
+    running summary for every speaker with older turns. Summaries are updated
+    incrementally: after each turn, a background task folds that turn into the
+    speaker's previous summary, so the next turn does not wait for it. A summary
+    can therefore lag one turn behind, and that turn is normally still inside
+    the recent window.
+    """
+
+    def __init__(self, client, budget_tokens: int = CONTEXT_WINDOW_TOKENS, summary_model: str = SUMMARY_MODEL):
+        self.client = client
+        self.budget_tokens = budget_tokens
+        self.summary_model = summary_model
+        self.turns = []  # (speaker, message) in debate order
+        self.summaries = {}
+        self._pending = {}
+        self.stats = {"summary_calls": 0, "summary_seconds": 0.0}
+
+    def add_turn(self, speaker: str, content: str):
+        """Records a turn and schedules the update of the speaker's summary."""
+        message = {"role": "user", "content": content}
+        self.turns.append((speaker, message))
+        # Chain on the speaker's previous update so their summary folds in turns in order
+        self._pending[speaker] = asyncio.create_task(
+            self._update_summary(speaker, content, self._pending.get(speaker)))
+
+    async def _update_summary(self, speaker: str, content: str, previous):
+        if previous is not None:
+            await previous
+        prompt = (
+            f"Previous summary of {speaker}'s contributions:\n{self.summaries.get(speaker, '(none yet)')}\n\n"
+            f"New turn:\n{content}\n\n"
+            f"Rewrite the summary to include the new turn, keeping {speaker}'s positions, key arguments, "
+            f"questions asked and answers given. Use at most {SUMMARY_MAX_WORDS} words."
+        )
+        start = time.perf_counter()
+        summary = await get_cerebras_response_async(
+            self.client, self.summary_model, SUMMARIZER_SYSTEM_PROMPT, [{"role": "user", "content": prompt}])
+        self.stats["summary_calls"] += 1
+        self.stats["summary_seconds"] += time.perf_counter() - start
+        # A failed call returns an error string; keep the last good summary instead
+        if not summary.startswith("An error occured"):
+            self.summaries[speaker] = summary
+
+    def _window_start(self) -> int:
+        """Index of the oldest turn that still fits the token budget (the latest turn always does)."""
+        used = 0
+        for index in range(len(self.turns) - 1, -1, -1):
+            used += count_prompt_tokens([self.turns[index][1]])
+            if used > self.budget_tokens and index < len(self.turns) - 1:
+                return index + 1
+        return 0
+
+    def _summary_text(self, speakers) -> str:
+        return "\n\n".join(f"{speaker}: {self.summaries[speaker]}" for speaker in speakers if speaker in self.summaries)
+
+    def history(self) -> List[Dict]:
+        """The messages to send in place of the full conversation log."""
+        start = self._window_start()
+        older = dict.fromkeys(speaker for speaker, _ in self.turns[:start])
+        summary = self._summary_text(older)
+        window = [message for _, message in self.turns[start:]]
+        if not summary:
+            return window
+        return [{"role": "user", "content": f"Summary of earlier turns, by speaker:\n{summary}"}, *window]
+
+    async def digest(self) -> str:
+        """Every speaker's summary followed by the recent turns, once all pending summaries are done."""
+        await self.settle()
+        window = "\n\n".join(message["content"] for _, message in self.turns[self._window_start():])
+        return f"Summaries by speaker:\n{self._summary_text(self.summaries)}\n\nMost recent turns:\n{window}"
+
+    async def settle(self):
+        """Waits for all scheduled summary updates."""
+        await asyncio.gather(*self._pending.values())
@@ -6,6 +6,8 @@ from typing import List, Dict
 from config import AGENTS, DEBATE_TOPIC
 from llm_interface import get_cerebras_response
 
+JUDGE_SYSTEM_PROMPT = "You are a fair and impartial judge analyzing a debate."
+
 class DebateManager:
     """Orchestrates a multi-agent debate and saves the transcript to a file."""
     
@@ -15,6 +17,7 @@ class DebateManager:
         self.topic = topic
         self.transcript_list = [f"# Debate Topic: {self.topic}\n"]
         self.conversation_log = []
+        self.round_times = {}
 
     def _add_to_transcript(self, text: str):
         """Prints text to console and adds it to the transcript list."""
@@ -34,7 +37,6 @@ class DebateManager:
             
             self._add_to_transcript(f"### **{name}:**\n{response}\n")
             self.conversation_log.append({"role": "user", "content": f"Statement from {name}: {response}"})
-            time.sleep(10)
 
     def run_crossexamination(self):
         self._add_to_transcript("\n## Round 2: Cross-Examination\n")
@@ -50,7 +52,6 @@ class DebateManager:
             )
             self._add_to_transcript(f"### **{asker} asks {target}:**\n{question}\n")
             self.conversation_log.append({"role": "user", "content": f"Question from {asker}: {question}"})
-            time.sleep(10)
             
             answer_prompt = f"It's your turn, {target}. Answer this question: '{question}'"
             answer = get_cerebras_response(
@@ -60,13 +61,11 @@ class DebateManager:
             )
             self._add_to_transcript(f"### **{target} responds:**\n{answer}\n")
             self.conversation_log.append({"role": "user", "content": f"Response from {target}: {answer}"})
-            time.sleep(10)
 
-    def run_judging(self):
-        self._add_to_transcript("\n## Final Round: Judgment\n")
-        full_transcript_str = "\n".join(self.transcript_list)
-        
-        judging_prompt = f"""
+    def _judging_prompt(self, full_transcript_str: str = None) -> str:
+        if full_transcript_str is None:
+            full_transcript_str = "\n".join(self.transcript_list)
+        return f"""
         You are now an impartial judge. Forget your previous persona completely.
         Analyze the full debate transcript below. You cannot vote for yourself.
         Based on argumentation, logic, and persuasiveness, which participant performed best?
@@ -75,30 +74,38 @@ class DebateManager:
         Full Debate Transcript:
         {full_transcript_str}
         """
+
+    def run_judging(self):
+        self._add_to_transcript("\n## Final Round: Judgment\n")
+        judging_prompt = self._judging_prompt()
         
         for name in self.agent_names:
-            neutral_system_prompt = "You are a fair and impartial judge analyzing a debate."
             vote = get_cerebras_response(
                 model=self.agents[name]["model"],
-                system_prompt=neutral_system_prompt,
+                system_prompt=JUDGE_SYSTEM_PROMPT,
                 history=[{"role": "user", "content": judging_prompt}]
             )
             self._add_to_transcript(f"### **Vote from {name}:**\n{vote}\n")
-            time.sleep(10)
 
     def get_full_transcript(self) -> str:
         """Joins the list of transcript entries into a single string."""
         return "\n".join(self.transcript_list)
 
+    def _timed(self, round_name: str, run_round):
+        """Runs one round and records its wall time in round_times."""
+        start = time.perf_counter()
+        run_round()
+        self.round_times[round_name] = time.perf_counter() - start
+
     def start(self):
         """Starts and runs the entire debate process."""
         print("="*20)
         print(self.transcript_list[0])
         print("="*20)
 
-        self.run_opening_statements()
-        self.run_crossexamination()
-        self.run_judging()
+        self._timed("opening", self.run_opening_statements)
+        self._timed("crossexamination", self.run_crossexamination)
+        self._timed("judging", self.run_judging)
         
         self._add_to_transcript("\n---\n*The Debate has Concluded.*")
 
@@ -1,20 +1,37 @@
-from cerebras.cloud.sdk import Cerebras, CerebrasError
+from cerebras.cloud.sdk import AsyncCerebras, Cerebras, CerebrasError, RateLimitError
 from typing import List, Dict
+from config import MAX_COMPLETION_TOKENS, MAX_RETRIES
+from rate_limiter import rate_limiter
 
 # The client is initialized once as a module-level
 # global variable for efficiency.
+# Retries are handled here, together with the shared rate limiter, so the SDK's own are disabled.
+# Set CEREBRAS_BASE_URL to point the client at a local mock server.
+
+CEREBRAS_API_KEY = "csk-5xdrewnk9jjk8x5xfk62yj2kmce5td3549dfkvwkmnrjy6kx"
 
 try:
-    cerebras_client = Cerebras(api_key="csk-5xdrewnk9jjk8x5xfk62yj2kmce5td3549dfkvwkmnrjy6kx")
+    cerebras_client = Cerebras(api_key=CEREBRAS_API_KEY, max_retries=0)
     print("Cerebras client initialized successfully.")
 except CerebrasError as e:
     print(f"Error initializing Cerebras client: {e}")
     cerebras_client = None
 
+def count_prompt_tokens(messages: List[Dict]) -> int:
+    """Roughly counts prompt tokens at ~4 characters per token."""
+    return sum(len(message["content"]) for message in messages) // 4
+
+def estimate_tokens(messages: List[Dict]) -> int:
+    """Roughly estimates the tokens a call will use: the prompt plus the completion budget."""
+    return count_prompt_tokens(messages) + MAX_COMPLETION_TOKENS
+
 def get_cerebras_response(model, system_prompt, history):
     """
     Fetches a response from a specified Cerebras model.
 
+    Every call goes through the process-wide rate limiter, and 429 responses
+    are retried after the server's Retry-After time (or an exponential backoff).
+
     Args:
         model: The name of the model to call.
         system_prompt: The system prompt defining the agent's persona.
@@ -27,17 +44,79 @@ def get_cerebras_response(model, system_prompt, history):
         return "Error: Cerebras client is not initialized."
     
     messages = [{"role": "system", "content": system_prompt}] + history
+    estimated_tokens = estimate_tokens(messages)
     
-    try:
-        response = cerebras_client.chat.completions.create(
-            model=model,
-            messages=messages,
-            max_completion_tokens=512,
-            temperature=0.7,
-            top_p=0.95,
-        )
-        return response.choices[0].message.content.strip()
-    except CerebrasError as e:
-        print(f"An error occured with model {model}: {e}")
-        return f"An error occured while calling the model {model}."
+    for attempt in range(MAX_RETRIES + 1):
+        rate_limiter.acquire(estimated_tokens)
+        try:
+            raw = cerebras_client.chat.completions.with_raw_response.create(
+                model=model,
+                messages=messages,
+                max_tokens=MAX_COMPLETION_TOKENS,
+                temperature=0.7,
+                top_p=0.95,
+            )
+            rate_limiter.update_from_headers(raw.headers)
+            response = raw.parse()
+            if response.usage:
+                rate_limiter.settle(estimated_tokens, response.usage.total_tokens)
+            return response.choices[0].message.content.strip()
+        except RateLimitError as e:
+            rate_limiter.update_from_headers(e.response.headers)
+            if attempt == MAX_RETRIES:
+                print(f"Rate limit still exceeded for model {model} after {attempt + 1} attempts.")
+                return f"An error occured while calling the model {model}."
+            delay = rate_limiter.backoff(attempt, e.response.headers.get("retry-after"))
+            print(f"Rate limited on model {model}, retrying in {delay:.1f}s")
+        except CerebrasError as e:
+            print(f"An error occured with model {model}: {e}")
+            return f"An error occured while calling the model {model}."
+
+def create_async_client() -> AsyncCerebras:
+    """
+    Creates an async Cerebras client. Use it with `async with` inside the event loop
+    that makes the calls, since its connection pool is bound to that loop.
+    """
+    return AsyncCerebras(api_key=CEREBRAS_API_KEY, max_retries=0)
+
+async def get_cerebras_response_async(client, model, system_prompt, history):
+    """
+    Async version of get_cerebras_response, sharing the same process-wide rate limiter.
+
+    Args:
+        client: An AsyncCerebras client from create_async_client().
+        model: The name of the model to call.
+        system_prompt: The system prompt defining the agent's persona.
+        history: The conversation history up to this point.
+
+    Returns:
+        The content of the model's response as a string.
+    """
+    messages = [{"role": "system", "content": system_prompt}] + history
+    estimated_tokens = estimate_tokens(messages)
 
+    for attempt in range(MAX_RETRIES + 1):
+        await rate_limiter.acquire_async(estimated_tokens)
+        try:
+            raw = await client.chat.completions.with_raw_response.create(
+                model=model,
+                messages=messages,
+                max_tokens=MAX_COMPLETION_TOKENS,
+                temperature=0.7,
+                top_p=0.95,
+            )
+            rate_limiter.update_from_headers(raw.headers)
+            response = await raw.parse()
+            if response.usage:
+                rate_limiter.settle(estimated_tokens, response.usage.total_tokens)
+            return response.choices[0].message.content.strip()
+        except RateLimitError as e:
+            rate_limiter.update_from_headers(e.response.headers)
+            if attempt == MAX_RETRIES:
+                print(f"Rate limit still exceeded for model {model} after {attempt + 1} attempts.")
+                return f"An error occured while calling the model {model}."
+            delay = rate_limiter.backoff(attempt, e.response.headers.get("retry-after"))
+            print(f"Rate limited on model {model}, retrying in {delay:.1f}s")
+        except CerebrasError as e:
+            print(f"An error occured with model {model}: {e}")
+            return f"An error occured while calling the model {model}."
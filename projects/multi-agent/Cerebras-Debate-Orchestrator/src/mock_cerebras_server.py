@@ -0,0 +1,158 @@
+# mock_cerebras_server.py
+"""
+A local stand-in for the Cerebras chat completions endpoint that enforces
+requests-per-minute and tokens-per-minute limits, sends rate-limit headers and
+answers with 429 + Retry-After when a limit is exceeded.
+
+Usage:
+    # serve on port 8089
+    python mock_cerebras_server.py --rpm 20 --tpm 20000
+
+    # serve and push a burst of calls through llm_interface to check the limiter
+    python mock_cerebras_server.py --rpm 20 --tpm 20000 --verify 40 --threads 4
+"""
+
+import argparse
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockLimits:
+    """Server-side token buckets mirroring how the provider meters requests and tokens."""
+
+    def __init__(self, rpm: float, tpm: float):
+        self.rpm, self.tpm = rpm, tpm
+        self.requests, self.tokens = rpm, tpm
+        self.updated = time.monotonic()
+        self.accepted = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def take(self, tokens: int):
+        """Returns (accepted, seconds until enough quota, headers)."""
+        with self.lock:
+            now = time.monotonic()
+            elapsed, self.updated = now - self.updated, now
+            self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60)
+            self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60)
+            wait = max(0.0 if self.requests >= 1 else (1 - self.requests) * 60 / self.rpm,
+                       0.0 if self.tokens >= tokens else (tokens - self.tokens) * 60 / self.tpm)
+            accepted = wait == 0
+            if accepted:
+                self.requests -= 1
+                self.tokens -= tokens
+                self.accepted += 1
+            else:
+                self.rejected += 1
+            headers = {
+                "x-ratelimit-limit-requests-minute": str(int(self.rpm)),
+                "x-ratelimit-limit-tokens-minute": str(int(self.tpm)),
+                "x-ratelimit-remaining-requests-minute": str(max(0, int(self.requests))),
+                "x-ratelimit-remaining-tokens-minute": str(max(0, int(self.tokens))),
+                "x-ratelimit-reset-requests-minute": f"{(self.rpm - self.requests) * 60 / self.rpm:.2f}",
+                "x-ratelimit-reset-tokens-minute": f"{(self.tpm - self.tokens) * 60 / self.tpm:.2f}",
+            }
+            return accepted, wait, headers
+
+
+def make_handler(limits: MockLimits, latency: float, completion_tokens: int):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            prompt_tokens = sum(len(m.get("content", "")) for m in body.get("messages", [])) // 4
+            completion = min(completion_tokens, body.get("max_tokens") or completion_tokens)
+            accepted, wait, headers = limits.take(prompt_tokens + completion)
+            if not accepted:
+                headers["retry-after"] = str(math.ceil(wait))
+                return self._send(429, {"message": "Rate limit exceeded", "type": "too_many_requests_error"}, headers)
+            time.sleep(latency)
+            self._send(200, {
+                "id": f"chatcmpl-mock-{limits.accepted}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "mock"),
+                "system_fingerprint": "mock",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "word " * completion}}],
+                "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion,
+                          "total_tokens": prompt_tokens + completion},
+                "time_info": {},
+            }, headers)
+
+        def do_GET(self):
+            self._send(200, {"object": "list", "data": []}, {})
+
+        def _send(self, status, payload, headers):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def start_server(rpm: float, tpm: float, port: int = 0, latency: float = 0.2, completion_tokens: int = 100):
+    """Starts the mock server in a background thread and returns (server, limits, base_url)."""
+    limits = MockLimits(rpm, tpm)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(limits, latency, completion_tokens))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, limits, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def verify(base_url: str, limits: MockLimits, calls: int, threads: int):
+    """Sends `calls` requests through llm_interface from several threads and reports how the limiter did."""
+    os.environ["CEREBRAS_BASE_URL"] = base_url
+    from llm_interface import get_cerebras_response
+    from rate_limiter import rate_limiter
+
+    def call(i):
+        return get_cerebras_response("mock-model", "You are terse.", [{"role": "user", "content": f"Call {i}"}])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(call, range(calls)))
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "calls": calls,
+        "elapsed_s": round(elapsed, 1),
+        "server_accepted": limits.accepted,
+        "server_429s": limits.rejected,
+        "achieved_rpm": round(limits.accepted / elapsed * 60, 1),
+        "limit_rpm": limits.rpm,
+        "limiter": {**rate_limiter.stats, "waited_seconds": round(rate_limiter.stats["waited_seconds"], 1)},
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock Cerebras server with rate limits.")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--rpm", type=float, default=30)
+    parser.add_argument("--tpm", type=float, default=60000)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds per completion")
+    parser.add_argument("--verify", type=int, default=0, metavar="CALLS",
+                        help="Send CALLS requests through llm_interface, report and exit")
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    server, limits, base_url = start_server(args.rpm, args.tpm, args.port, args.latency)
+    if args.verify:
+        verify(base_url, limits, args.verify, args.threads)
+        server.shutdown()
+    else:
+        print(f"Mock Cerebras server on {base_url} (set CEREBRAS_BASE_URL={base_url})")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
@@ -0,0 +1,166 @@
+# rate_limiter.py
+
+import asyncio
+import random
+import re
+import threading
+import time
+from typing import Mapping, Optional
+
+from config import REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE, BACKOFF_BASE_SECONDS, BACKOFF_MAX_SECONDS
+
+# e.g. x-ratelimit-limit-requests-minute, x-ratelimit-remaining-tokens, x-ratelimit-reset-tokens-minute
+RATE_LIMIT_HEADER = re.compile(r"^x-ratelimit-(limit|remaining|reset)-(requests|tokens)(?:-(minute|day))?$")
+DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """Parses '33.5', '1s', '6m0s' or '250ms' into seconds."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = DURATION_PART.findall(value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+class TokenBucket:
+    """
+    A bucket of `capacity` units refilled continuously at `capacity` per minute, or at
+    the rate implied by the provider's last reset header until the bucket is full again.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.level = per_minute
+        self.updated = time.monotonic()
+        self.reported_rate = None
+
+    @property
+    def rate(self) -> float:
+        return self.reported_rate or self.capacity / 60
+
+    def refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.level >= self.capacity:
+            self.reported_rate = None
+
+    def adopt_reset(self, seconds: float):
+        """Refills the bucket so that it is full `seconds` from now, as the provider reports."""
+        missing = self.capacity - self.level
+        self.reported_rate = missing / seconds if missing > 0 and seconds > 0 else None
+
+    def wait_time(self, amount: float) -> float:
+        # A request larger than the whole bucket only has to wait for a full bucket
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute token buckets shared by every call in the process.
+
+    Limits start from the configured values and are then kept in line with the
+    provider's rate-limit response headers. A 429 blocks all callers until the
+    Retry-After time (or an exponential backoff) has passed. Usable from
+    threads (`acquire`) and from asyncio (`acquire_async`).
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.blocked_until = 0.0
+        self.stats = {"calls": 0, "waited_seconds": 0.0, "rate_limited": 0}
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Takes one request and `tokens` tokens if available now; otherwise returns how long to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                wait = self.blocked_until - now
+            else:
+                self.requests.refill(now)
+                self.tokens.refill(now)
+                wait = max(self.requests.wait_time(1), self.tokens.wait_time(tokens))
+            if wait > 0:
+                self.stats["waited_seconds"] += wait
+                return wait
+            self.requests.level -= 1
+            self.tokens.level -= min(tokens, self.tokens.capacity)
+            self.stats["calls"] += 1
+            return 0.0
+
+    def acquire(self, tokens: int):
+        """Blocks the calling thread until a request of about `tokens` tokens fits the limits."""
+        while (wait := self._reserve(tokens)) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int):
+        """Like acquire(), but waits without blocking the event loop."""
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def settle(self, estimated: int, actual: int):
+        """Corrects the token bucket once the real token usage of a call is known."""
+        with self._lock:
+            self.tokens.level -= actual - estimated
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """
+        Adopts the per-minute limits, remaining quota and reset times reported by the provider.
+
+        A reset time is the time until the bucket is full again, so together with the
+        remaining quota it gives the refill rate; the next request then waits exactly
+        as long as its own size requires.
+        """
+        with self._lock:
+            now = time.monotonic()
+            resets = {}
+            for name, value in headers.items():
+                match = RATE_LIMIT_HEADER.match(name.lower())
+                # Daily quotas are not paced here; a 429 still blocks until they reset
+                if not match or match.group(3) == "day":
+                    continue
+                kind, resource = match.group(1), match.group(2)
+                bucket = self.requests if resource == "requests" else self.tokens
+                if kind == "limit":
+                    try:
+                        bucket.capacity = float(value)
+                    except ValueError:
+                        continue
+                elif kind == "remaining":
+                    try:
+                        bucket.refill(now)
+                        bucket.level = min(bucket.level, float(value))
+                    except ValueError:
+                        continue
+                elif kind == "reset":
+                    resets[resource] = parse_duration(value)
+            # Applied last, as they depend on the limit and remaining quota in the same response
+            for resource, reset in resets.items():
+                if reset is not None:
+                    (self.requests if resource == "requests" else self.tokens).adopt_reset(reset)
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Blocks all callers after a 429, for Retry-After seconds if given or an exponential backoff.
+
+        Returns:
+            The delay in seconds.
+        """
+        delay = parse_duration(retry_after) if retry_after else None
+        if delay is None:
+            delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt) + random.uniform(0, 0.5)
+        with self._lock:
+            self.stats["rate_limited"] += 1
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        return delay
+
+
+rate_limiter = RateLimiter(REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE)
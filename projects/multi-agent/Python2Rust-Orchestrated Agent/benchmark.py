@@ -0,0 +1,213 @@
+# benchmark.py
+
+import asyncio
+import os
+import re
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from config import (BENCHMARK_WARMUP_RUNS, BENCHMARK_RUNS, BENCHMARK_TIMEOUT_SECONDS,
+                    RUN_MEMORY_LIMIT_MB)
+from build_pool import resource_limits
+
+PYTHON_BASELINE = "Python (original)"
+
+# Lines reporting the program's own timing differ on every run and between languages
+TIMING_LINE = re.compile(r"\b(time|elapsed|took|duration)\b.*\d", re.IGNORECASE)
+
+# Peak RSS has to be read by a small parent process: on Linux a child started from this
+# (large) Python process inherits its high-water mark across exec, so wait4() from here
+# would report the orchestrator's memory rather than the program's. The runner is compiled
+# with the local rustc, starts the program, waits for it and prints
+# "<wait status> <peak RSS in KB> <wall time in ns>" to stderr.
+RSS_RUNNER_SOURCE = r"""
+use std::process::Command;
+use std::time::Instant;
+
+extern "C" {
+    fn wait4(pid: i32, status: *mut i32, options: i32, rusage: *mut i64) -> i32;
+}
+
+fn main() {
+    let args: Vec<String> = std::env::args().skip(1).collect();
+    let start = Instant::now();
+    let child = match Command::new(&args[0]).args(&args[1..]).spawn() {
+        Ok(child) => child,
+        Err(e) => {
+            eprintln!("spawn failed: {}", e);
+            std::process::exit(127);
+        }
+    };
+    let mut status: i32 = 0;
+    // struct rusage starts with two timevals, followed by ru_maxrss
+    let mut usage = [0i64; 18];
+    if unsafe { wait4(child.id() as i32, &mut status, 0, usage.as_mut_ptr()) } < 0 {
+        std::process::exit(126);
+    }
+    let elapsed = start.elapsed().as_nanos();
+    let maxrss_kb = if cfg!(target_os = "macos") { usage[4] / 1024 } else { usage[4] };
+    eprintln!("{} {} {}", status, maxrss_kb, elapsed);
+}
+"""
+
+
+def build_rss_runner(rustc: str, work_dir: str):
+    """Compiles the peak-RSS runner; returns its path, or None where it cannot be used."""
+    if not hasattr(os, "wait4"):
+        return None
+    source = os.path.join(work_dir, "rss_runner.rs")
+    binary = os.path.join(work_dir, "rss_runner")
+    with open(source, "w", encoding="utf-8") as f:
+        f.write(RSS_RUNNER_SOURCE)
+    result = subprocess.run([rustc, "-O", source, "-o", binary], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"Peak RSS will not be measured; the runner failed to compile:\n{result.stderr}")
+        return None
+    return binary
+
+
+def normalize_output(output: str) -> str:
+    """Drops self-reported timing lines and trailing whitespace so outputs can be compared."""
+    lines = [line.rstrip() for line in output.splitlines() if not TIMING_LINE.search(line)]
+    return "\n".join(lines).strip()
+
+
+def _run_once(args: list, cwd: str, runner: str = None) -> dict:
+    """
+    Runs the program once and measures its wall time and, through the runner, its peak
+    resident set size.
+    """
+    timed_out = threading.Event()
+    if runner:
+        args = [runner, *args]
+
+    with tempfile.TemporaryFile() as out:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            args, cwd=cwd, stdin=subprocess.DEVNULL, stdout=out, stderr=subprocess.PIPE,
+            preexec_fn=resource_limits(BENCHMARK_TIMEOUT_SECONDS, RUN_MEMORY_LIMIT_MB),
+            start_new_session=hasattr(os, "killpg"),
+        )
+
+        def kill():
+            timed_out.set()
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+
+        timer = threading.Timer(BENCHMARK_TIMEOUT_SECONDS, kill)
+        timer.start()
+        try:
+            _, stderr = process.communicate()
+        finally:
+            timer.cancel()
+        wall_seconds = time.perf_counter() - start
+        out.seek(0)
+        output = out.read().decode(errors="replace")
+
+    returncode, peak_rss_bytes = process.returncode, None
+    report = stderr.decode(errors="replace").strip().splitlines()
+    if runner and returncode == 0 and report:
+        status, maxrss_kb, elapsed_ns = (int(value) for value in report[-1].split())
+        returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+        peak_rss_bytes = maxrss_kb * 1024
+        wall_seconds = elapsed_ns / 1e9
+    return {"returncode": returncode, "timed_out": timed_out.is_set(),
+            "wall_seconds": wall_seconds, "peak_rss_bytes": peak_rss_bytes, "output": output}
+
+
+def measure(args: list, cwd: str, runner: str = None,
+            runs: int = BENCHMARK_RUNS, warmup: int = BENCHMARK_WARMUP_RUNS) -> dict:
+    """
+    Runs a program `warmup` times unmeasured, then `runs` times measured.
+
+    Returns:
+        dict: 'status' ('ok' or 'error'), wall time statistics in milliseconds,
+              the peak RSS in MB over all runs and the normalized output of the first run.
+    """
+    samples = []
+    for i in range(warmup + runs):
+        result = _run_once(args, cwd, runner)
+        if result["timed_out"] or result["returncode"] != 0:
+            reason = "timed out" if result["timed_out"] else f"exit code {result['returncode']}"
+            return {"status": "error", "error": f"Run {i + 1} failed ({reason})."}
+        if i >= warmup:
+            samples.append(result)
+
+    wall_ms = [sample["wall_seconds"] * 1000 for sample in samples]
+    peaks = [sample["peak_rss_bytes"] for sample in samples if sample["peak_rss_bytes"] is not None]
+    return {
+        "status": "ok",
+        "runs": runs,
+        "mean_ms": statistics.mean(wall_ms),
+        "min_ms": min(wall_ms),
+        "stdev_ms": statistics.stdev(wall_ms) if len(wall_ms) > 1 else 0.0,
+        "peak_rss_mb": max(peaks) / (1024 * 1024) if peaks else None,
+        "output": normalize_output(samples[0]["output"]),
+    }
+
+
+def benchmark_solutions(python_code: str, rust_solutions: dict, rustc: str, work_dir: str) -> dict:
+    """
+    Benchmarks the original Python script and every compiled solution, one program at a time
+    so measurements do not compete for the CPU.
+
+    Returns:
+        dict: Results keyed by PYTHON_BASELINE and model name. Rust results also carry
+              'output_matches' (compared with the Python output) and 'speedup' (Python mean
+              wall time divided by the Rust one).
+    """
+    runner = build_rss_runner(rustc, work_dir)
+    script_path = os.path.join(work_dir, "original.py")
+    with open(script_path, "w", encoding="utf-8") as f:
+        f.write(python_code)
+    print(f"Benchmarking {PYTHON_BASELINE}...")
+    results = {PYTHON_BASELINE: measure([sys.executable, script_path], work_dir, runner)}
+    baseline = results[PYTHON_BASELINE]
+
+    for model_name, data in rust_solutions.items():
+        binary = data["execution"].get("binary")
+        if not binary:
+            results[model_name] = {"status": "skipped", "error": "Did not compile and run."}
+            continue
+        print(f"Benchmarking {model_name}...")
+        result = measure([binary], os.path.dirname(binary), runner)
+        if result["status"] == "ok" and baseline["status"] == "ok":
+            result["output_matches"] = result["output"] == baseline["output"]
+            result["speedup"] = baseline["mean_ms"] / result["mean_ms"]
+        results[model_name] = result
+    return results
+
+
+async def run_benchmarks(python_code: str, rust_solutions: dict, rustc: str, work_dir: str) -> dict:
+    """Runs benchmark_solutions in a worker thread so the event loop is not blocked."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, benchmark_solutions, python_code, rust_solutions, rustc, work_dir)
+
+
+def format_benchmark_table(results: dict) -> str:
+    """Renders benchmark results as a Markdown table."""
+    lines = [
+        f"Wall time over {BENCHMARK_RUNS} runs after {BENCHMARK_WARMUP_RUNS} warmup run(s); "
+        "output is compared with the Python output, ignoring self-reported timing lines.\n",
+        "| Program | Mean wall (ms) | Min wall (ms) | Std dev (ms) | Peak RSS (MB) | Output matches Python | Speedup vs Python |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for name, result in results.items():
+        if result["status"] != "ok":
+            lines.append(f"| {name} | {result['status']}: {result['error']} | | | | | |")
+            continue
+        peak = f"{result['peak_rss_mb']:.1f}" if result["peak_rss_mb"] is not None else "n/a"
+        if name == PYTHON_BASELINE:
+            matches, speedup = "(baseline)", "1.00x"
+        else:
+            matches = {True: "yes", False: "**no**"}.get(result.get("output_matches"), "n/a")
+            speedup = f"{result['speedup']:.2f}x" if "speedup" in result else "n/a"
+        lines.append(f"| {name} | {result['mean_ms']:.1f} | {result['min_ms']:.1f} | {result['stdev_ms']:.1f} "
+                     f"| {peak} | {matches} | {speedup} |")
+    return "\n".join(lines)
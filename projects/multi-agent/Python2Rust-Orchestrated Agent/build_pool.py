@@ -0,0 +1,162 @@
+# build_pool.py
+
+import asyncio
+import os
+import shutil
+import signal
+import tempfile
+import time
+from config import (MAX_BUILD_WORKERS, COMPILE_TIMEOUT_SECONDS, RUN_TIMEOUT_SECONDS,
+                    RUN_MEMORY_LIMIT_MB, RUN_CPU_LIMIT_SECONDS, MAX_OUTPUT_FILE_MB)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Output kept per job; a runaway program should not flood the judge's prompt
+MAX_CAPTURED_OUTPUT_CHARS = 20000
+
+
+def resource_limits(cpu_seconds: int, memory_mb: int = None):
+    """Returns a preexec_fn applying rlimits in the child process, or None where unsupported."""
+    if resource is None:
+        return None
+
+    def apply():
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+        file_bytes = MAX_OUTPUT_FILE_MB * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_FSIZE, (file_bytes, file_bytes))
+        if memory_mb:
+            memory_bytes = memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+    return apply
+
+
+def _read_capped(path: str) -> str:
+    """Reads at most MAX_CAPTURED_OUTPUT_CHARS bytes of a captured output file."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        text = f.read(MAX_CAPTURED_OUTPUT_CHARS).decode(errors="replace")
+    if size > MAX_CAPTURED_OUTPUT_CHARS:
+        text += f"\n... [truncated {size - MAX_CAPTURED_OUTPUT_CHARS} bytes]"
+    return text
+
+
+def _kill_group(process):
+    """Kills the process and, where process groups exist, anything it left running."""
+    try:
+        if resource is not None:
+            os.killpg(process.pid, signal.SIGKILL)
+        elif process.returncode is None:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+async def run_limited(args: list, cwd: str, timeout: float, cpu_seconds: int, memory_mb: int = None):
+    """
+    Runs a command in its own process group under rlimits and a wall-clock timeout.
+
+    stdout and stderr go to files in `cwd` rather than pipes, so RLIMIT_FSIZE caps how
+    much a runaway program can write and the orchestrator only ever reads a bounded prefix.
+
+    Returns:
+        tuple: (returncode, stdout, stderr). Raises asyncio.TimeoutError after killing the
+               whole process group if the timeout expires.
+    """
+    stdout_path, stderr_path = os.path.join(cwd, "stdout.log"), os.path.join(cwd, "stderr.log")
+    with open(stdout_path, "wb") as stdout, open(stderr_path, "wb") as stderr:
+        process = await asyncio.create_subprocess_exec(
+            *args, cwd=cwd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=stdout,
+            stderr=stderr,
+            preexec_fn=resource_limits(cpu_seconds, memory_mb),
+            start_new_session=resource is not None,
+        )
+    try:
+        await asyncio.wait_for(process.wait(), timeout)
+    finally:
+        # On timeout or cancellation, take down the whole group so nothing outlives the job
+        _kill_group(process)
+        await process.wait()
+    return process.returncode, _read_capped(stdout_path), _read_capped(stderr_path)
+
+
+class BuildPool:
+    """
+    Compiles and runs Rust solutions with at most `max_workers` jobs at a time.
+
+    Every job gets its own temporary directory, so jobs never share files and several
+    runs can happen side by side. rustc runs under a CPU limit; the compiled program
+    also gets a memory limit and cannot write large files. Compiled binaries are kept
+    (see 'binary' in the result) until the pool is closed, so they can be benchmarked
+    afterwards; use the pool as a context manager.
+    """
+
+    def __init__(self, max_workers: int = MAX_BUILD_WORKERS):
+        self.rustc = shutil.which("rustc")
+        self.root = tempfile.mkdtemp(prefix="p2r_")
+        self._semaphore = asyncio.Semaphore(max_workers)
+
+    def close(self):
+        """Removes every job directory."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def execute(self, rust_code: str, model_name: str) -> dict:
+        """
+        Compiles and runs one solution.
+
+        Returns:
+            dict: 'status' ('success' or 'error'), 'output', 'notes', the
+                  'compile_seconds' and 'run_seconds' it took and, on success,
+                  the path of the compiled 'binary'.
+        """
+        if self.rustc is None:
+            return {"status": "error", "notes": "The code could not be compiled.",
+                    "output": "Compiler Error: `rustc` not found. Is Rust installed and in your PATH?"}
+
+        async with self._semaphore:
+            safe_model_name = model_name.replace("/", "_")
+            job_dir = tempfile.mkdtemp(prefix=f"{safe_model_name}_", dir=self.root)
+            return await self._build_and_run(rust_code, job_dir)
+
+    async def _build_and_run(self, rust_code: str, job_dir: str) -> dict:
+        with open(os.path.join(job_dir, "main.rs"), "w", encoding="utf-8") as f:
+            f.write(rust_code)
+        timings = {"compile_seconds": None, "run_seconds": None}
+        try:
+            # Step 1: Compile the code using rustc, -O for optimization
+            start = time.perf_counter()
+            returncode, _, stderr = await run_limited(
+                [self.rustc, "-O", "main.rs", "-o", "main"], job_dir,
+                COMPILE_TIMEOUT_SECONDS, COMPILE_TIMEOUT_SECONDS)
+            timings["compile_seconds"] = round(time.perf_counter() - start, 2)
+            if returncode != 0:
+                return {"status": "error", "output": stderr,
+                        "notes": "The code failed during compilation.", **timings}
+
+            # Step 2: Run the compiled executable
+            start = time.perf_counter()
+            returncode, stdout, stderr = await run_limited(
+                [os.path.join(job_dir, "main")], job_dir,
+                RUN_TIMEOUT_SECONDS, RUN_CPU_LIMIT_SECONDS, RUN_MEMORY_LIMIT_MB)
+            timings["run_seconds"] = round(time.perf_counter() - start, 2)
+            if returncode != 0:
+                reason = f"killed by signal {-returncode}" if returncode < 0 else f"exit code {returncode}"
+                return {"status": "error", "output": stderr or stdout,
+                        "notes": f"The code failed during execution ({reason}); it may have hit a resource limit.",
+                        **timings}
+            return {"status": "success", "output": stdout,
+                    "notes": "Code compiled and executed successfully.", **timings,
+                    "binary": os.path.join(job_dir, "main")}
+        except asyncio.TimeoutError:
+            return {"status": "error", "output": "Process timed out.",
+                    "notes": "The code took too long to compile or run.", **timings}
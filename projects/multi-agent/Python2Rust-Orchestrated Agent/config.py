@@ -1,3 +1,5 @@
+import os
+
 # Define models and their respective platforms
 
 MODEL_CONFIG = {
@@ -19,4 +21,18 @@ MODEL_CONFIG = {
 
 # The most powerful model is designated as the "Judge" for the review task.
 JUDGE_PLATFORM = "cerebras"
-JUDGE_MODEL_NAME = "qwen-3-coder-480b"
\ No newline at end of file
+JUDGE_MODEL_NAME = "qwen-3-coder-480b"
+
+# Compile/execute pool: how many Rust jobs run at once and the limits each job runs under.
+# Memory and CPU limits use POSIX rlimits and are skipped on platforms without them.
+MAX_BUILD_WORKERS = min(4, os.cpu_count() or 1)
+COMPILE_TIMEOUT_SECONDS = 60
+RUN_TIMEOUT_SECONDS = 15
+RUN_MEMORY_LIMIT_MB = 512
+RUN_CPU_LIMIT_SECONDS = 10
+MAX_OUTPUT_FILE_MB = 64
+
+# Runtime benchmark of the original Python against each compiled solution
+BENCHMARK_WARMUP_RUNS = 1
+BENCHMARK_RUNS = 5
+BENCHMARK_TIMEOUT_SECONDS = 60
@@ -2,8 +2,8 @@ import os
 import datetime
 from config import JUDGE_MODEL_NAME
 
-def save_results(python_code: str, rust_solutions: dict, review: str):
-    """Saves the generated Rust code and final review to files"""
+def save_results(python_code: str, rust_solutions: dict, review: str, benchmark_table: str = None):
+    """Saves the generated Rust code, the benchmark and the final review to files"""
     
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     output_dir = f"results/conversion_result_{timestamp}"
@@ -24,6 +24,10 @@ def save_results(python_code: str, rust_solutions: dict, review: str):
     md_content += "## Original Python Code\n\n"
     md_content += f"```python\n{python_code}\n```\n\n"
     md_content += "--- \n\n"
+    if benchmark_table:
+        md_content += "## Runtime Benchmark\n\n"
+        md_content += f"{benchmark_table}\n\n"
+        md_content += "--- \n\n"
     md_content += "## Judge's Review of Submissions\n\n"
     md_content += review
     
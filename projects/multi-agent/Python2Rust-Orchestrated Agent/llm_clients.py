@@ -1,18 +1,20 @@
 # Imports
 import os
 from typing import List, Any
-from groq import Groq
-from cerebras.cloud.sdk import Cerebras
+from groq import AsyncGroq
+from cerebras.cloud.sdk import AsyncCerebras
 from config import MODEL_CONFIG
 
-def _stream_and_collect(stream):
-    """Helper function to collect text from a streaming API response."""
-    reply = ""
-    for chunk in stream:
-        fragment = chunk.choices[0].delta.content or "" 
-        reply += fragment
-        print(fragment, end="", flush=True)
-    return reply.strip()
+async def _stream_and_collect(stream):
+    """
+    Helper function to collect text from a streaming API response.
+    Fragments are not echoed, since several streams are usually read at once.
+    """
+    fragments = []
+    async for chunk in stream:
+        if chunk.choices:
+            fragments.append(chunk.choices[0].delta.content or "")
+    return "".join(fragments).strip()
 
 
 # Grog client class
@@ -21,12 +23,12 @@ class GroqClient:
     def __init__(self, api_key: str):
         if not api_key:
             raise ValueError("Grog API KEY not found.")
-        self.client = Groq(api_key=api_key)
+        self.client = AsyncGroq(api_key=api_key)
     
-    def generate(self, model_name: str, messages: List[Any]) -> str:
+    async def generate(self, model_name: str, messages: List[Any]) -> str:
         """Generates a response from a Groq model."""
         config = MODEL_CONFIG["groq"]["models"][model_name]
-        stream = self.client.chat.completions.create(
+        stream = await self.client.chat.completions.create(
             messages=messages,
             model=model_name,
             stream=True,
@@ -34,7 +36,7 @@ class GroqClient:
             temperature=config["temperature"],
             top_p=config["top_p"]
         )
-        return _stream_and_collect(stream)
+        return await _stream_and_collect(stream)
 
 
 class CerebrasClient:
@@ -42,12 +44,12 @@ class CerebrasClient:
     def __init__(self, api_key: str):
         if not api_key:
             raise ValueError("Cerebras API KEY not found.")
-        self.client = Cerebras(api_key=api_key)
+        self.client = AsyncCerebras(api_key=api_key)
 
-    def generate(self, model_name: str, messages: List[Any]) -> str:
+    async def generate(self, model_name: str, messages: List[Any]) -> str:
         """Generates a response from a Cerebras model."""
         config = MODEL_CONFIG["cerebras"]["models"][model_name]
-        stream = self.client.chat.completions.create(
+        stream = await self.client.chat.completions.create(
             messages=messages,
             model=model_name,
             stream=True,
@@ -56,4 +58,4 @@ class CerebrasClient:
             top_p=config['top_p']
         )
 
-        return _stream_and_collect(stream)
+        return await _stream_and_collect(stream)
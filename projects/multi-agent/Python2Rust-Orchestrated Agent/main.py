@@ -1,12 +1,15 @@
 # main.py
 
+import asyncio
 import os
-import subprocess
+import time
 from dotenv import load_dotenv
 from config import MODEL_CONFIG, JUDGE_PLATFORM, JUDGE_MODEL_NAME
 from prompts import create_conversion_prompt, create_review_prompt_with_execution
 from llm_clients import GroqClient, CerebrasClient
 from file_handler import save_results
+from build_pool import BuildPool
+from benchmark import run_benchmarks, format_benchmark_table
 
 def initialize_clients() -> dict:
     """Initializes API clients based on available keys."""
@@ -22,76 +25,6 @@ def initialize_clients() -> dict:
         print(e)
     return clients
 
-def execute_rust_code(rust_code: str, model_name: str) -> dict:
-    """
-    Tries to compile and run the given Rust code.
-
-    Args:
-        rust_code (str): The Rust code to execute.
-        model_name (str): The name of the model that generated the code, used for filenames.
-
-    Returns:
-        dict: A dictionary containing the status ('success' or 'error'),
-              and the output or error message.
-    """
-    # Sanitize model name for filename
-    safe_model_name = model_name.replace("/", "_")
-    file_name = f"temp_{safe_model_name}"
-    
-    with open(f"{file_name}.rs", "w", encoding="utf-8") as f:
-        f.write(rust_code)
-        
-    try:
-        # Step 1: Compile the code using rustc
-        # -O for optimization
-        compile_process = subprocess.run(
-            ["rustc", "-O", f"{file_name}.rs"],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=30  # 30-second timeout for compilation
-        )
-        
-        # Step 2: Run the compiled executable
-        run_process = subprocess.run(
-            [f"./{file_name}"],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=15  # 15-second timeout for execution
-        )
-        
-        return {
-            "status": "success",
-            "output": run_process.stdout,
-            "notes": "Code compiled and executed successfully."
-        }
-        
-    except FileNotFoundError:
-        return {
-            "status": "error",
-            "output": "Compiler Error: `rustc` not found. Is Rust installed and in your PATH?"
-        }
-    except subprocess.CalledProcessError as e:
-        # This catches both compilation and runtime errors
-        return {
-            "status": "error",
-            "output": e.stderr,
-            "notes": "The code failed during compilation or execution."
-        }
-    except subprocess.TimeoutExpired as e:
-        return {
-            "status": "error",
-            "output": f"Process timed out: {e.cmd}",
-            "notes": "The code took too long to compile or run."
-        }
-    finally:
-        # Clean up temporary files
-        for ext in [".rs", ""]:
-            if os.path.exists(f"{file_name}{ext}"):
-                os.remove(f"{file_name}{ext}")
-
-
 def main():
     """Main function to orchestrate the conversion, execution, and review process."""
     
@@ -137,12 +70,38 @@ if __name__ == "__main__":
     print(f"\\nPython Execution Time: {end_time - start_time:.4f} seconds")
 """
 
+    asyncio.run(orchestrate(python_to_convert))
+
+
+async def generate_and_execute(client, platform: str, model_name: str, conversion_prompt: list,
+                               pool: BuildPool, started: float) -> dict:
+    """Generates one contender's solution, then compiles and runs it in the build pool."""
+    print(f"--- Generating with {model_name} on {platform} ---")
+    rust_code = await client.generate(model_name, conversion_prompt)
+    rust_code = rust_code.replace("```rust", "").replace("```", "").strip()
+    generated_at = time.perf_counter() - started
+    print(f"Generated {model_name} in {generated_at:.1f}s, queued for compilation")
+
+    execution_result = await pool.execute(rust_code, model_name)
+    finished_at = time.perf_counter() - started
+    print(f"Execution status for {model_name}: {execution_result['status']} (done at {finished_at:.1f}s)")
+    return {
+        "code": rust_code,
+        "execution": execution_result,
+        "timings": {"generated_at": round(generated_at, 1), "finished_at": round(finished_at, 1)},
+    }
+
+
+async def orchestrate(python_to_convert: str):
+    """
+    Generates all contender solutions concurrently; each one is compiled and run as
+    soon as it arrives, so the whole phase takes about as long as the slowest model.
+    """
     clients = initialize_clients()
     if not clients:
         print("No API clients could be initialized.")
         return
 
-    rust_solutions = {}
     conversion_prompt = create_conversion_prompt(python_to_convert)
 
     print("--- Starting Code Generation and Execution Phase ---")
@@ -150,27 +109,36 @@ if __name__ == "__main__":
         (p, m) for p, conf in MODEL_CONFIG.items() for m in conf["models"]
         if not (p == JUDGE_PLATFORM and m == JUDGE_MODEL_NAME)
     ]
-    
     for platform, model_name in contender_models:
         if platform not in clients:
             print(f"Skipping platform {platform} as client is not available.")
-            continue
-        
-        client = clients[platform]
-        print(f"\n--- Generating and Executing for {model_name} on {platform} ---")
-        
-        # Generate the code
-        rust_code = client.generate(model_name, conversion_prompt)
-        rust_code = rust_code.replace("```rust", "").replace("```", "").strip()
-        
-        # Compile and run the code
-        execution_result = execute_rust_code(rust_code, model_name)
-        
-        rust_solutions[model_name] = {
-            "code": rust_code,
-            "execution": execution_result
-        }
-        print(f"Execution status for {model_name}: {execution_result['status']}")
+    contender_models = [(p, m) for p, m in contender_models if p in clients]
+
+    with BuildPool() as pool:
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(generate_and_execute(clients[p], p, m, conversion_prompt, pool, started) for p, m in contender_models),
+            return_exceptions=True,
+        )
+        rust_solutions = {}
+        for (platform, model_name), result in zip(contender_models, results):
+            if isinstance(result, Exception):
+                print(f"Generation failed for {model_name} on {platform}: {result}")
+                continue
+            rust_solutions[model_name] = result
+        print(f"\nGeneration and execution phase took {time.perf_counter() - started:.1f}s")
+
+        print("\n\n--- Starting Benchmark Phase ---")
+        if pool.rustc is None:
+            print("Skipping benchmark: `rustc` not found.")
+            benchmark_table = None
+        elif not rust_solutions:
+            print("Skipping benchmark: no solutions to compare.")
+            benchmark_table = None
+        else:
+            benchmarks = await run_benchmarks(python_to_convert, rust_solutions, pool.rustc, pool.root)
+            benchmark_table = format_benchmark_table(benchmarks)
+            print(benchmark_table)
 
     print("\n\n--- Starting Review Phase ---")
     if JUDGE_PLATFORM not in clients:
@@ -178,14 +146,15 @@ if __name__ == "__main__":
     else:
         judge_client = clients[JUDGE_PLATFORM]
         # Use the new, richer review prompt
-        review_prompt = create_review_prompt_with_execution(python_to_convert, rust_solutions)
-        review_text = judge_client.generate(JUDGE_MODEL_NAME, review_prompt)
+        review_prompt = create_review_prompt_with_execution(python_to_convert, rust_solutions, benchmark_table)
+        review_text = await judge_client.generate(JUDGE_MODEL_NAME, review_prompt)
+        print(review_text)
 
     print("\n\n--- Saving Results ---")
     # You might want to update save_results to handle the new structure
     # For now, we pass a simplified version for demonstration
     simplified_solutions = {k: v['code'] for k, v in rust_solutions.items()}
-    save_results(python_to_convert, simplified_solutions, review_text)
+    save_results(python_to_convert, simplified_solutions, review_text, benchmark_table)
     print("\nProcess finished successfully.")
 
 
@@ -19,9 +19,10 @@ def create_conversion_prompt(python_code: str) -> list:
         {"role": "user", "content": user_prompt}]
 
 
-def create_review_prompt_with_execution(python_code: str, rust_solutions: dict) -> list:
+def create_review_prompt_with_execution(python_code: str, rust_solutions: dict, benchmark_table: str = None) -> list:
     """
-    Creates an enhanced review prompt that includes code execution results.
+    Creates an enhanced review prompt that includes code execution results and,
+    if available, a runtime benchmark of each submission against the original Python.
     """
     system_prompt = (
         "You are a world-class software architect and Rust expert. Your task is to act as a judge "
@@ -38,7 +39,8 @@ def create_review_prompt_with_execution(python_code: str, rust_solutions: dict)
         "Here are the Rust submissions from different AI models, along with their compilation and execution results. "
         "Please review each one based on the following criteria in order of importance:\n"
         "1.  **Execution Result:** Did the code compile and run? Does its output seem correct?\n"
-        "2.  **Performance:** Does the implementation look efficient?\n"
+        "2.  **Performance:** Does the implementation look efficient? Where a benchmark table is given, "
+        "base this on the measured speedup, memory use and whether the output matches the Python output.\n"
         "3.  **Idiomatic Style:** Is the code clean, safe, and idiomatic Rust?\n\n"
         "For each submission, provide a rating from 1 to 10 and a brief critique.\n\n"
         "---"
@@ -59,6 +61,12 @@ def create_review_prompt_with_execution(python_code: str, rust_solutions: dict)
             "```"
         )
     
+    if benchmark_table:
+        user_prompt += (
+            "\n\n---\n\n### Runtime Benchmark\n\n"
+            f"{benchmark_table}"
+        )
+
     user_prompt += "\n\n--- \nPlease provide your final, consolidated review."
 
     return [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}]
\ No newline at end of file